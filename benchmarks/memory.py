@@ -0,0 +1,80 @@
+"""Measures the memory retained by large schemas and large validation results.
+
+Run from the root of the repository with ``python benchmarks/memory.py``; requires the
+``tracemalloc`` module, which is available in Python 3.4 and later. Specify ``--save PATH`` to
+save the measurements as a reference, such as before making a change, and ``--compare PATH``
+to report each measurement relative to a saved reference.
+"""
+
+import json
+import os
+import sys
+import tracemalloc
+from argparse import ArgumentParser
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scheme import *
+
+def measure(title, count, unit, construct, results, reference=None):
+    tracemalloc.start()
+    baseline = tracemalloc.take_snapshot()
+    retained = construct()
+    snapshot = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    size = sum(stat.size_diff for stat in snapshot.compare_to(baseline, 'filename'))
+    results[title] = per_unit = float(size) / count
+
+    report = '%s: %.1f KiB total, %.0f bytes per %s' % (title, size / 1024.0, per_unit, unit)
+    if reference and title in reference:
+        previous = reference[title]
+        report += ' (reference %.0f, %+.0f bytes, %+.1f%%)' % (previous, per_unit - previous,
+            (per_unit - previous) * 100.0 / previous)
+
+    print(report)
+    return retained
+
+def construct_schema(count=5000):
+    fields = [Text(), Integer(minimum=0), Boolean(), Enumeration('alpha beta gamma'),
+        Sequence(Text()), Map(Integer())]
+
+    structure = {}
+    for i in range(count // 10):
+        structure['substructure%d' % i] = Structure(dict(('field%d' % j, fields[j % len(fields)])
+            for j in range(9)))
+
+    description = Structure(structure).describe()
+    return lambda: Field.reconstruct(description)
+
+def construct_errors(count=100000):
+    field = Sequence(Integer())
+    value = ['invalid'] * count
+
+    def validate():
+        try:
+            field.process(value)
+        except ValidationError as exception:
+            return exception
+    return validate
+
+if __name__ == '__main__':
+    parser = ArgumentParser(description='Measures the memory retained by schemas and errors.')
+    parser.add_argument('--save', metavar='PATH', help='save the measurements to PATH')
+    parser.add_argument('--compare', metavar='PATH',
+        help='report the measurements relative to those saved at PATH')
+    options = parser.parse_args()
+
+    reference = None
+    if options.compare:
+        with open(options.compare) as openfile:
+            reference = json.load(openfile)
+
+    results = {}
+    measure('5k-field schema', 5000, 'field', construct_schema(), results, reference)
+    measure('100k-error validation result', 100000, 'error', construct_errors(), results,
+        reference)
+
+    if options.save:
+        with open(options.save, 'w') as openfile:
+            json.dump(results, openfile, indent=2, sort_keys=True)
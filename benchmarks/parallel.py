@@ -0,0 +1,78 @@
+"""Compares processing a large sequence sequentially to processing it in parallel by passing an
+executor to ``Sequence.process()``.
+
+Run from the root of the repository with ``python benchmarks/parallel.py [WORKERS]``; requires
+``concurrent.futures``. Besides timing both modes, the benchmark measures the cost of pickling
+each item to a worker and its result back, which the parent process pays serially. Parallel
+processing pays off when processing an item costs clearly more than pickling it: the parent can
+then keep about ``processing / pickling`` workers busy, so the estimated speedup reported below
+is bounded both by the number of workers and by that ratio.
+"""
+
+import os
+import sys
+from time import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import cpu_count
+
+from scheme import *
+from scheme.fields.sequence import pickle
+
+def construct_schema():
+    return Sequence(Structure({
+        'id': Integer(nonempty=True),
+        'name': Text(nonempty=True, max_length=64),
+        'status': Enumeration('active inactive suspended'),
+        'score': Float(minimum=0.0),
+        'created': Date(),
+        'tags': Sequence(Text()),
+        'attributes': Map(Text()),
+        'address': Structure({'street': Text(), 'city': Text(), 'postal': Text()}),
+    }))
+
+def construct_records(count):
+    records = []
+    for i in range(count):
+        records.append({'id': i, 'name': 'record %d' % i, 'status': 'active',
+            'score': float(i), 'created': '2014-01-01', 'tags': ['a', 'b', 'c'],
+            'attributes': {'key': 'value'}, 'address': {'street': '1 Main St',
+            'city': 'Springfield', 'postal': '00000'}})
+    return records
+
+def measure(callable, repetitions=3):
+    timings = []
+    for i in range(repetitions):
+        start = time()
+        callable()
+        timings.append(time() - start)
+    return min(timings)
+
+if __name__ == '__main__':
+    workers = int(sys.argv[1]) if len(sys.argv) > 1 else cpu_count()
+    field = construct_schema()
+    records = construct_records(100000)
+    count = float(len(records))
+
+    processed = field.process(records, INBOUND, True)
+    sequential = measure(lambda: field.process(records, INBOUND, True))
+    pickling = measure(lambda: (pickle.loads(pickle.dumps(records, pickle.HIGHEST_PROTOCOL)),
+        pickle.loads(pickle.dumps(processed, pickle.HIGHEST_PROTOCOL))))
+
+    processing_cost = sequential / count * 1e6
+    pickling_cost = pickling / count * 1e6
+    estimate = min(workers, processing_cost / pickling_cost)
+
+    print('processing:           %.2fus per item' % processing_cost)
+    print('pickling:             %.2fus per item' % pickling_cost)
+    print('estimated speedup:    %.2fx with %d workers' % (max(estimate, 1.0), workers))
+    print('sequential:           %.3fs' % sequential)
+
+    with ProcessPoolExecutor(workers) as executor:
+        field.process(records[:workers * 1000], INBOUND, True, executor=executor)
+        parallel = measure(lambda: field.process(records, INBOUND, True, executor=executor))
+
+    print('parallel:             %.3fs (%.2fx, %d of %d cores)' % (parallel,
+        sequential / parallel, workers, cpu_count()))
@@ -0,0 +1,55 @@
+"""Compares processing a batch of independent records with ``Field.process_many()`` to calling
+``Field.process()`` for each record.
+
+Run from the root of the repository with ``python benchmarks/process_many.py``.
+"""
+
+import os
+import sys
+from timeit import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scheme import *
+
+def construct_schema():
+    return Structure({
+        'id': Integer(nonempty=True),
+        'name': Text(nonempty=True, max_length=64),
+        'status': Enumeration('active inactive suspended'),
+        'score': Float(minimum=0.0),
+        'created': Date(),
+        'tags': Sequence(Text()),
+        'attributes': Map(Text()),
+        'address': Structure({'street': Text(), 'city': Text(), 'postal': Text()}),
+    })
+
+def construct_records(count):
+    records = []
+    for i in range(count):
+        records.append({'id': i, 'name': 'record %d' % i, 'status': 'active',
+            'score': float(i), 'created': '2014-01-01', 'tags': ['a', 'b', 'c'],
+            'attributes': {'key': 'value'}, 'address': {'street': '1 Main St',
+            'city': 'Springfield', 'postal': '00000'}})
+    return records
+
+def process_individually(field, records):
+    results = []
+    for record in records:
+        try:
+            results.append(field.process(record, INBOUND, True))
+        except StructuralError:
+            results.append(None)
+    return results
+
+if __name__ == '__main__':
+    field = construct_schema()
+    records = construct_records(5000)
+    repetitions = 5
+
+    individually = timeit(lambda: process_individually(field, records), number=repetitions)
+    batched = timeit(lambda: field.process_many(records, INBOUND, True), number=repetitions)
+
+    print('process() in a loop: %.3fs' % (individually / repetitions))
+    print('process_many():      %.3fs' % (batched / repetitions))
+    print('speedup:             %.2fx' % (individually / batched))
@@ -0,0 +1,99 @@
+"""Compares the startup time of a process which constructs its schemas, and reconstructs a
+catalog of schemas from their descriptions, to that of a process which restores the same
+schemas from a snapshot (see :mod:`scheme.snapshot`).
+
+Run from the root of the repository with ``python benchmarks/snapshot.py``. Each measurement
+is the best of several runs of a new interpreter, so includes importing scheme itself.
+"""
+
+import json
+import os
+import subprocess
+import sys
+from tempfile import mkdtemp
+from time import time
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, root)
+
+from scheme import *
+from scheme import snapshot
+
+def construct_schemas(count=300):
+    schemas = {}
+    for i in range(count):
+        schemas['schema%d' % i] = Structure({
+            'id': Integer(nonnull=True, minimum=1),
+            'name': Text(nonempty=True, max_length=64),
+            'status': Enumeration('active inactive suspended', default='active'),
+            'created': DateTime(),
+            'score': Decimal(minimum='0'),
+            'tags': Sequence(Text(), unique=True),
+            'attributes': Map(Union((Integer(), Text()))),
+            'address': Structure({'street': Text(), 'city': Text(), 'postal': Text()}),
+            'field%d' % i: Boolean(default=False),
+        }, name='schema%d' % i)
+    return schemas
+
+def construct_catalog(count=300):
+    schemas = construct_schemas(count)
+    return dict((name, schema.describe()) for name, schema in schemas.items())
+
+CONSTRUCT = '''
+import json
+import sys
+sys.path.insert(0, %r)
+from benchmarks.snapshot import construct_schemas
+from scheme import Field
+schemas = construct_schemas()
+with open(%r) as openfile:
+    catalog = json.load(openfile)
+schemas.update((name, Field.reconstruct(description)) for name, description in catalog.items())
+'''
+
+RESTORE = '''
+import sys
+sys.path.insert(0, %r)
+from scheme import snapshot
+schemas = snapshot.load(%r)
+'''
+
+def measure(script, repetitions=5):
+    best = None
+    for i in range(repetitions):
+        start = time()
+        subprocess.check_call([sys.executable, '-c', script])
+        elapsed = time() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+if __name__ == '__main__':
+    directory = mkdtemp()
+    catalog = dict(('remote%s' % name, description)
+        for name, description in construct_catalog().items())
+    catalog_path = os.path.join(directory, 'catalog.json')
+    with open(catalog_path, 'w') as openfile:
+        json.dump(catalog, openfile)
+
+    schemas = construct_schemas()
+    schemas.update((name, Field.reconstruct(dict(description)))
+        for name, description in catalog.items())
+
+    path = os.path.join(directory, 'schemas.snapshot')
+    snapshot.save(path, schemas)
+
+    baseline = measure('import sys; sys.path.insert(0, %r); import scheme' % root)
+    constructed = measure(CONSTRUCT % (root, catalog_path))
+    restored = measure(RESTORE % (root, path))
+
+    print('%d schemas, snapshot of %.1f KiB' % (len(schemas), os.path.getsize(path) / 1024.0))
+    print('importing scheme:     %.3fs' % baseline)
+    print('constructing schemas: %.3fs (%.3fs after import)' % (constructed,
+        constructed - baseline))
+    print('restoring snapshot:   %.3fs (%.3fs after import)' % (restored, restored - baseline))
+    print('speedup after import: %.2fx' % ((constructed - baseline) / (restored - baseline)))
+
+    os.remove(catalog_path)
+    os.remove(path)
+    os.rmdir(directory)
@@ -1,3 +1,5 @@
+import sys
+
 from scheme.exceptions import *
 from scheme.field import *
 from scheme.timezone import *
@@ -6,11 +8,21 @@ from scheme.common import *
 from scheme.element import *
 from scheme.fields import *
 from scheme.format import *
-from scheme.formats import *
 from scheme.surrogate import surrogate
 
+from scheme import formats
+
 __all__ = ['surrogate']
 for module in (common, exceptions, field, timezone, element, fields, format, formats):
     __all__.extend(module.__all__)
 
+# the formats are imported lazily, on first access, where module __getattr__ is supported
+if sys.version_info >= (3, 7):
+    def __getattr__(name):
+        if name in formats.__all__:
+            return getattr(formats, name)
+        raise AttributeError('module %r has no attribute %r' % (__name__, name))
+else:
+    from scheme.formats import *
+
 __version__ = '2.0.2'
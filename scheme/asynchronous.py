@@ -0,0 +1,201 @@
+"""Coroutines which process values for fields without blocking an event loop for long.
+
+Processing a large value for a :class:`Structure`, :class:`Sequence` or :class:`Map` is
+performed by walking the field tree in the same manner as ``process()``, but control is yielded
+to the event loop whenever the walk has run for longer than a specified interval. Processing
+can instead be offloaded entirely to an executor. This module requires python 3.5 or later,
+and is not imported by :mod:`scheme` itself; the coroutines are typically invoked through
+:meth:`Field.aprocess` and :meth:`Field.aunserialize`.
+"""
+
+import asyncio
+from collections import OrderedDict
+from functools import partial
+from time import time
+
+from scheme.exceptions import *
+from scheme.field import *
+from scheme.fields.map import Map
+from scheme.fields.sequence import Sequence
+from scheme.fields.structure import Structure
+from scheme.format import Format
+from scheme.util import ATTRIBUTE_SEGMENT, INDEX_SEGMENT, compile_projection
+from scheme.util import exhausts_error_budget, string
+
+__all__ = ('process', 'unserialize')
+
+class Scheduler(object):
+    """Tracks how long processing has run since control was last yielded to the event loop.
+
+    :param float interval: The number of seconds processing can run before yielding.
+    """
+
+    __slots__ = ('deadline', 'interval')
+
+    def __init__(self, interval):
+        self.interval = interval
+        self.deadline = time() + interval
+
+    async def checkpoint(self):
+        """Yields control to the event loop if the current interval has elapsed."""
+
+        if time() >= self.deadline:
+            await asyncio.sleep(0)
+            self.deadline = time() + self.interval
+
+async def process(field, value, phase=INBOUND, serialized=False, ancestry=None, interval=0.005,
+        executor=None, **params):
+    """Processes ``value`` for ``field`` as described by :meth:`Field.process`; the options
+    accepted by ``field.process()``, such as ``max_errors``, ``partial`` and ``projection``, can
+    be specified as ``params``.
+
+    :param float interval: Optional, default is ``0.005``; the number of seconds processing can
+        run before control is yielded to the event loop.
+
+    :param executor: Optional, default is ``None``; if specified, an executor (such as an
+        instance of ``concurrent.futures.ThreadPoolExecutor``) to which processing is offloaded
+        in its entirety, instead of being performed cooperatively on the event loop. When a
+        process executor is used, ``field`` and ``value`` must be picklable.
+    """
+
+    if executor is not None:
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(executor, partial(field.process, value, phase,
+            serialized, ancestry, **params))
+
+    implementation = WALKERS.get(type(field).process)
+    if implementation is None:
+        return field.process(value, phase, serialized, ancestry, **params)
+
+    ancestry = field._construct_ancestry(ancestry, params.pop('fail_fast', False),
+        params.pop('max_errors', None), params.pop('preserve', False))
+    if field._is_null(value, ancestry):
+        return None
+
+    if params.get('projection') is not None:
+        params['projection'] = compile_projection(params['projection'])
+    return await implementation(field, value, phase, serialized, ancestry, Scheduler(interval),
+        **params)
+
+async def unserialize(field, value, format=None, ancestry=None, interval=0.005, executor=None,
+        **params):
+    """Unserializes ``value`` from ``format``, if ``format`` is specified, before processing it
+    as an inbound value for ``field``; see :func:`process`."""
+
+    if executor is not None:
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(executor, partial(field.unserialize, value, format,
+            ancestry, **params))
+
+    if format:
+        value = Format.formats[format].unserialize(value, field, **params)
+    return await process(field, value, INBOUND, True, ancestry, interval)
+
+async def _process_map(field, value, phase, serialized, ancestry, scheduler, projection=None):
+    value = field._prepare_processing(value, ancestry)
+
+    valid = True
+    key_field = field.key
+    if value:
+        value_field = _resolve(field.value, 'the value field of this map is undefined')
+        if not value_field.projectable:
+            projection = None
+
+    map = {}
+    for name, subvalue in value.items():
+        if key_field or not isinstance(name, string):
+            name = field._process_key(name, value, phase, serialized, ancestry)
+
+        try:
+            map[name] = await _process_value(value_field, subvalue, phase, serialized,
+                (ancestry, INDEX_SEGMENT, name), scheduler, projection)
+        except StructuralError as exception:
+            valid = False
+            map[name] = exception
+            if exhausts_error_budget(ancestry, exception):
+                raise ValidationError(identity=ancestry, field=field, value=value,
+                    structure=map)
+
+    return field._finish_processing(value, map, valid, ancestry)
+
+async def _process_sequence(field, value, phase, serialized, ancestry, scheduler,
+        projection=None):
+    value = field._prepare_processing(value, ancestry)
+
+    valid = True
+    if value:
+        item = _resolve(field.item, 'the item field of this sequence is undefined')
+        if not item.projectable:
+            projection = None
+
+    sequence = []
+    for i, subvalue in enumerate(value):
+        try:
+            sequence.append(await _process_value(item, subvalue, phase, serialized,
+                (ancestry, INDEX_SEGMENT, i), scheduler, projection))
+        except StructuralError as exception:
+            valid = False
+            sequence.append(exception)
+            if exhausts_error_budget(ancestry, exception):
+                break
+
+    return field._finish_processing(value, sequence, valid, ancestry)
+
+async def _process_structure(field, value, phase, serialized, ancestry, scheduler,
+        partial=False, projection=None):
+    value, identity = field._prepare_processing(value, phase, serialized, ancestry)
+    if field.key_order:
+        structure = OrderedDict()
+    else:
+        structure = {}
+
+    valid = True
+    entries, known = field._get_plan(identity)
+
+    for name, subfield, subvalue, subprojection in field._select_values(value, phase, entries,
+            partial, projection, ancestry, structure):
+        if subfield is None:
+            valid = False
+            continue
+
+        subfield = _resolve(subfield, 'the %r field of this structure is undefined' % name)
+        if not subfield.projectable:
+            subprojection = None
+
+        try:
+            structure[name] = await _process_value(subfield, subvalue, phase, serialized,
+                (ancestry, ATTRIBUTE_SEGMENT, name), scheduler, subprojection)
+        except StructuralError as exception:
+            valid = False
+            structure[name] = exception
+            if exhausts_error_budget(ancestry, exception):
+                raise ValidationError(identity=ancestry, field=field, value=value,
+                    structure=structure)
+
+    return field._finish_processing(value, structure, valid, known, ancestry)
+
+async def _process_value(field, value, phase, serialized, ancestry, scheduler, projection=None):
+    implementation = WALKERS.get(type(field).process)
+    if implementation is not None and value is not None:
+        if projection is not None:
+            return await implementation(field, value, phase, serialized, ancestry, scheduler,
+                projection=projection)
+        return await implementation(field, value, phase, serialized, ancestry, scheduler)
+
+    await scheduler.checkpoint()
+    if projection is not None:
+        return field.process(value, phase, serialized, ancestry, projection=projection)
+    return field.process(value, phase, serialized, ancestry)
+
+def _resolve(field, message):
+    if isinstance(field, Undefined):
+        if field.field is None:
+            raise UndefinedFieldError(message)
+        return field.field
+    return field
+
+WALKERS = {
+    Map.process: _process_map,
+    Sequence.process: _process_sequence,
+    Structure.process: _process_structure,
+}
@@ -1,6 +1,6 @@
 from traceback import format_exc
 
-from scheme.util import format_structure, indent
+from scheme.util import format_structure, indent, materialize_ancestry
 
 __all__ = ('CannotDescribeError', 'CannotExtractError', 'CannotFilterError',
     'CannotInterpolateError', 'FieldExcludedError', 'InvalidTypeError', 'StructuralError',
@@ -36,14 +36,17 @@ class StructuralError(SchemeError):
     
     
     :param *errors: All positional arguments are expected to be ``dict`` values representing
-        non-structural errors.
+        non-structural errors. Errors added by :meth:`ValidationError.construct` are rendered
+        into such values when ``errors`` is first accessed.
 
     :param field: Optional, default is ``None``; if specified, the :class:`Field` instance
         which is generating this ``StructuralError``.
 
     :param identity: Optional, default is ``None``; if specified, a ``list`` of ``str`` values
         which when concatenated will describe the location of ``field`` within a hierarchical
-        schema.
+        schema. A lazy ancestry (see :class:`scheme.util.AncestrySegment`) can also be specified,
+        in which case it is materialized into such a ``list`` when ``identity`` is first
+        accessed.
 
     :param structure: Optional, default is ``None``; if specified, a potentially hierarchical
         structure containing errors.
@@ -55,26 +58,65 @@ class StructuralError(SchemeError):
         non-structural error if ``token`` is present.
     """
 
+    __slots__ = ('field', 'structure', 'tracebacks', 'value', '_deferred', '_errors',
+        '_identity', '_serialized_errors')
+
     def __init__(self, *errors, **params):
-        self.errors = list(errors)
+        self._deferred = False
+        self._errors = list(errors)
         self.field = params.pop('field', None)
-        self.identity = params.pop('identity', '(unknown)')
+        self._identity = params.pop('identity', '(unknown)')
         self.structure = params.pop('structure', None)
         self.tracebacks = None
         self.value = params.pop('value', None)
 
         if params and 'token' in params:
-            self.errors.append(params)
+            self._errors.append(params)
+
+    def __reduce__(self):
+        state = {}
+        for attr in StructuralError.__slots__:
+            try:
+                state[attr] = getattr(self, attr)
+            except AttributeError:
+                pass
+
+        state['_errors'] = self.errors
+        state['_deferred'] = False
+        state['_identity'] = self.identity
+        return (type(self), self.args, state)
 
     def __str__(self):
         return '\n'.join(['validation failed'] + self.format_errors())
 
+    @property
+    def errors(self):
+        if self._deferred:
+            self._render_errors()
+        return self._errors
+
+    @errors.setter
+    def errors(self, errors):
+        self._deferred = False
+        self._errors = errors
+
+    @property
+    def identity(self):
+        identity = self._identity
+        if isinstance(identity, tuple):
+            identity = self._identity = materialize_ancestry(identity)
+        return identity
+
+    @identity.setter
+    def identity(self, identity):
+        self._identity = identity
+
     @property
     def substantive(self):
-        return (self.errors or self.structure)
+        return (self._errors or self.structure)
 
     def append(self, error):
-        self.errors.append(error)
+        self._errors.append(error)
         return self
 
     def attach(self, structure):
@@ -90,7 +132,7 @@ class StructuralError(SchemeError):
 
     def format_errors(self):
         errors = []
-        if self.errors:
+        if self._errors:
             self._format_errors(errors)
         if self.structure:
             self._format_structure(errors)
@@ -102,7 +144,7 @@ class StructuralError(SchemeError):
         return enumerated_errors
 
     def merge(self, exception):
-        self.errors.extend(exception.errors)
+        self._errors.extend(exception.errors)
         return self
 
     def serialize(self, force=False):
@@ -112,7 +154,7 @@ class StructuralError(SchemeError):
             except AttributeError:
                 pass
 
-        if self.errors:
+        if self._errors:
             errors = self._serialize_errors(self.errors)
         else:
             errors = None
@@ -165,6 +207,18 @@ class StructuralError(SchemeError):
                 else:
                     item._format_errors(errors)
 
+    def _render_errors(self):
+        field = self.field
+        errors = self._errors
+
+        for i, error in enumerate(errors):
+            if type(error) is tuple:
+                definition, params = error
+                errors[i] = {'token': definition.token, 'title': definition.title,
+                    'message': definition.format(field, params)}
+
+        self._deferred = False
+
     def _serialize_errors(self, errors):
         serialized = []
         for error in errors:
@@ -203,10 +257,26 @@ class StructuralError(SchemeError):
 class ValidationError(StructuralError):
     """Raised when field validation fails."""
 
+    __slots__ = ()
+
     def construct(self, error, **params):
-        error = self.field.errors[error]
-        return self.append({'token': error.token, 'title': error.title,
-            'message': error.format(self.field, params)})
+        """Appends the error identified by ``error``, a token defined by ``field``, formatted
+        with ``params``. The error is only rendered into a ``dict`` when ``errors`` is first
+        accessed (including by ``serialize()`` and ``format_errors()``), so that errors which
+        are caught and discarded, such as those raised by each non-matching field of a union,
+        are never formatted; the name of ``field`` is captured now, so the error is rendered
+        as it would have been when it was constructed."""
+
+        field = self.field
+        definition = field.errors[error]
+        if 'field' not in params:
+            params['field'] = field.name or 'unknown-field'
+
+        self._errors.append((definition, params))
+        self._deferred = True
+        return self
 
 class InvalidTypeError(ValidationError):
     """"Raised when field validation fails due to the type of the value."""
+
+    __slots__ = ()
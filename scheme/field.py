@@ -1,21 +1,49 @@
 import re
 from copy import deepcopy
+from functools import wraps
+from operator import attrgetter, is_
 
 from scheme.exceptions import *
 from scheme.format import Format
 from scheme.interpolation import interpolate_parameters
 from scheme.util import *
 
-__all__ = ('INBOUND', 'NATIVELY_SERIALIZABLE', 'OUTBOUND', 'Field', 'FieldError', 'Undefined')
+__all__ = ('INBOUND', 'NATIVELY_SERIALIZABLE', 'OUTBOUND', 'Field', 'FieldError', 'FieldInterner',
+    'Undefined')
 
 NATIVELY_SERIALIZABLE = tuple(list(numbers) + [string, bool, float, type(None), dict, list, tuple])
 
+IMPLEMENTATIONS = {}
+
 INBOUND = 'inbound'
 OUTBOUND = 'outbound'
 
+# the generation of field modifications, which is advanced whenever a field is modified through
+# one of its methods, or the default, ignore_null or required attribute of a field is set; the
+# modified field records the generation it was modified at as its _revision, so that a structure
+# only needs to check the revisions of the fields it contains to confirm that its processing
+# plans are still valid, and only once the generation has advanced
+GENERATION = 0
+
+def memoize_description(field, describe):
+    """Wraps ``describe``, the implementation of ``describe()`` defined by the field class
+    ``field``, so that the descriptions it constructs are cached by the field described. Calls
+    made through ``super()`` by the implementations of subclasses are not cached."""
+
+    @wraps(describe)
+    def describe_field(self, parameters=None, verbose=False, **params):
+        if params or self._get_implementations('describe')['describe'] is not field:
+            return describe(self, parameters, verbose, **params)
+
+        return copy_description(self._cache_description(None, parameters, verbose,
+            lambda: describe(self, parameters, verbose)))
+    return describe_field
+
 class FieldError(object):
     """A field error."""
 
+    __slots__ = ('message', 'show_field', 'show_value', 'title', 'token')
+
     def __init__(self, token, title, message, show_field=True, show_value=True):
         self.message = message
         self.show_field = show_field
@@ -38,6 +66,18 @@ class FieldMeta(type):
 
         errors = {}
         params = {}
+        defaulted = set()
+
+        # the attributes stored in slots, other than the one caching descriptions, which
+        # comprise the state of a field along with its instance __dict__, if any
+        slotted = []
+        for cls in reversed(field.__mro__):
+            slots = cls.__dict__.get('__slots__', ())
+            if isinstance(slots, string):
+                slots = (slots,)
+            for slot in slots:
+                if slot not in ('__dict__', '__weakref__', '_descriptions'):
+                    slotted.append(slot)
 
         for base in reversed(bases):
             inherited_errors = getattr(base, 'errors', None)
@@ -46,6 +86,7 @@ class FieldMeta(type):
             inherited_params = getattr(base, 'parameters', None)
             if inherited_params:
                 params.update(inherited_params)
+            defaulted.update(getattr(base, 'defaulted_parameters', ()))
 
         field.errors = errors
         for declared_error in declared_errors:
@@ -54,15 +95,48 @@ class FieldMeta(type):
         params.update(declared_params)
         field.parameters = params
 
+        # the default values of parameters which are not stored in slots are materialized on
+        # the class, so that looking up a parameter which was not set on an instance doesn't
+        # fall through to __getattr__
+        for parameter, default_value in params.items():
+            if parameter not in namespace and parameter not in slotted:
+                if parameter in defaulted or not hasattr(field, parameter):
+                    setattr(field, parameter, default_value)
+                    defaulted.add(parameter)
+
+        field.defaulted_parameters = frozenset(defaulted)
+        field.slotted_attributes = tuple(slotted)
+
+        # the parameters and public attributes of a field, the values of which its cached
+        # descriptions are validated against (see Field._get_signature()); those exposed
+        # through a property are read from the slot storing them
+        field.described_attributes = tuple(sorted(set(params).union(
+            slot for slot in slotted if slot[0] != '_').difference(['aspects'])))
+
+        getters = []
+        for attr in field.described_attributes:
+            if isinstance(getattr(field, attr, None), property) and '_' + attr in slotted:
+                attr = '_' + attr
+            getters.append(attr)
+        field._get_described_values = attrgetter(*getters)
+
+        if 'describe' in namespace:
+            field.describe = memoize_description(field, namespace['describe'])
+
         field.types[field.type] = field
         return field
 
-    def reconstruct(field, specification, **params):
-        """Reconstructs the field described by ``specification``."""
+    def reconstruct(field, specification, interner=None, **params):
+        """Reconstructs the field described by ``specification``. If ``interner`` is
+        specified, as a :class:`FieldInterner`, it is used to reconstruct the field, sharing
+        any identical fields (at any depth) previously reconstructed with it."""
 
         if isinstance(specification, Field):
             return specification
 
+        if interner is not None and isinstance(specification, dict):
+            return interner.reconstruct(specification)
+
         if isinstance(specification, string):
             fieldtype, specification = specification, params
         else:
@@ -141,6 +215,18 @@ class Field(object):
         preprocessed value for validation. Normally, a preprocessor would only make cosmetic
         changes that don't change the nature of the value.
 
+    :param int cache: Optional, default is ``None``; if specified, as an ``int`` >= 1, the
+        size of a least recently used cache of the values this field has processed, so that
+        processing a hashable value which was recently processed by this field, in the same
+        phase, only costs a lookup. Only successfully processed values are cached, and only
+        fields which do not provide their own implementation of ``process()`` (generally,
+        non-structural fields) consult the cache. Since a cached value is returned as is, this
+        should only be used for fields which produce immutable values and whose validation
+        (including any ``preprocessor``) depends only upon the candidate value, and which are
+        not modified once used. Fields without a cache never construct cache keys. The cache
+        itself is available as ``cache``, a :class:`scheme.util.LRUCache` which counts its hits
+        and misses.
+
     :param dict aspects: Optional, default is ``None``; a ``dict`` containing extension aspects
         for this field.
 
@@ -148,16 +234,38 @@ class Field(object):
         for this field (overriding anything specified in ``aspects``, if conflicting).
 
     When defining a subclass of ``Field``, several class-level attributes should be specified
-    on the subclass for proper implementation.
+    on the subclass for proper implementation. In particular, ``accepted_types`` can optionally
+    specify a ``tuple`` of types which candidate values must be instances of to avoid an
+    :exc:`InvalidTypeError`, allowing fields such as :class:`Union` to skip fields which
+    cannot possibly accept a value. Likewise, ``projectable`` indicates that the ``process()``,
+    ``extract()``, ``instantiate()`` and ``_serialize_trusted()`` methods of the field accept a
+    ``projection`` (see :meth:`Structure.process`).
+
+    The attributes of fields are stored in slots, and each subclass provided by scheme declares
+    slots for its own attributes. An instance ``__dict__`` is only allocated for attributes
+    which also have a class-level definition, such as a ``preprocessor``, a ``cache`` or custom
+    ``errors``, for extension aspects which override a parameter, and for the attributes of
+    subclasses which do not declare ``__slots__``.
     """
 
+    __slots__ = ('__dict__', 'aspects', 'constant', 'description', 'extractor', 'instantiator',
+        'name', 'nonnull', 'notes', 'title', '_default', '_descriptions', '_ignore_null',
+        '_required')
+
     types = {}
 
+    accepted_types = None
     basetype = None
+    cache = None
     equivalent = None
     preprocessor = None
+    projectable = False
     structural = False
 
+    # the generation at which this field was last modified, which is only stored on an instance
+    # once it is modified; see GENERATION
+    _revision = 0
+
     parameters = {'name': None, 'constant': None, 'description': None, 'default': None,
         'nonnull': False, 'ignore_null': False, 'required': False, 'title': None,
         'notes': None, 'structural': False}
@@ -166,12 +274,13 @@ class Field(object):
         FieldError('invalid', 'invalid value', '%(field)s is an invalid value'),
         FieldError('nonnull', 'null value', '%(field)s must be a non-null value'),
         FieldError('overflow', 'overflow error', '%(field)s overflowed'),
+        FieldError('invalidpath', 'invalid path', "%(field)s has no value at '%(path)s'"),
     ]
 
     def __init__(self, name=None, description=None, default=None, nonnull=False,
             ignore_null=False, required=False, constant=None, errors=None, title=None,
             notes=None, nonempty=False, instantiator=None, extractor=None,
-            preprocessor=None, aspects=None, **params):
+            preprocessor=None, cache=None, aspects=None, **params):
 
         if nonempty:
             nonnull = required = True
@@ -188,20 +297,29 @@ class Field(object):
 
         self.aspects = aspects or {}
         self.constant = constant
-        self.default = default
         self.description = description
         self.extractor = extractor
-        self.ignore_null = ignore_null
         self.instantiator = instantiator
         self.name = name
         self.notes = notes
         self.nonnull = nonnull
-        self.required = required
         self.title = title
 
+        # these are captured by the processing plans of structures, so are set through the
+        # properties below once the field is constructed
+        self._default = default
+        self._ignore_null = ignore_null
+        self._required = required
+        self._descriptions = None
+
         if preprocessor is not None:
             self.preprocessor = preprocessor
 
+        if isinstance(cache, LRUCache):
+            cache = cache.size
+        if cache is not None:
+            self.cache = LRUCache(cache)
+
         if errors:
             self.errors = self.errors.copy()
             for error in errors:
@@ -211,6 +329,9 @@ class Field(object):
             if attr[0] != '_' and value is not None:
                 self.aspects[attr] = value
 
+        for attr in self.defaulted_parameters.intersection(self.aspects):
+            setattr(self, attr, self.aspects[attr])
+
     def __repr__(self, params=None):
         aspects = []
         if self.name:
@@ -235,35 +356,136 @@ class Field(object):
         return self.clone()
 
     def __getattr__(self, name):
-        try:
-            return super(Field, self).__getattr__(name)
-        except AttributeError:
-            try:
-                return self.aspects[name]
-            except KeyError:
-                return None
+        if name == 'aspects' or name[:2] == '__':
+            raise AttributeError(name)
+        return self.aspects.get(name)
+
+    def __getstate__(self):
+        return self._get_attributes()
+
+    def __setstate__(self, state):
+        self._descriptions = None
+        for attr, value in state.items():
+            setattr(self, attr, value)
+
+    @property
+    def default(self):
+        return self._default
+
+    @default.setter
+    def default(self, value):
+        self._discard_descriptions()
+        self._default = value
 
     @property
     def guaranteed_name(self):
         return self.name or '(%s)' % self.type
 
+    @property
+    def ignore_null(self):
+        return self._ignore_null
+
+    @ignore_null.setter
+    def ignore_null(self, value):
+        self._discard_descriptions()
+        self._ignore_null = value
+
+    @property
+    def required(self):
+        return self._required
+
+    @required.setter
+    def required(self, value):
+        self._discard_descriptions()
+        self._required = value
+
+    def aprocess(self, value, phase=INBOUND, serialized=False, ancestry=None, interval=0.005,
+            executor=None, **params):
+        """Returns a coroutine which processes ``value`` as described by ``process()``, but
+        which yields control to the event loop whenever processing has run for longer than
+        ``interval`` seconds, or which offloads processing to ``executor``, if specified. Any
+        ``params`` are the options accepted by ``process()``. See
+        :func:`scheme.asynchronous.process`; requires python 3.5 or later."""
+
+        from scheme.asynchronous import process
+        return process(self, value, phase, serialized, ancestry, interval, executor, **params)
+
+    def aunserialize(self, value, format=None, ancestry=None, interval=0.005, executor=None,
+            **params):
+        """Returns a coroutine which unserializes and processes ``value`` as described by
+        ``unserialize()``; see ``aprocess()``."""
+
+        from scheme.asynchronous import unserialize
+        return unserialize(self, value, format, ancestry, interval, executor, **params)
+
     def clone(self, **params):
-        """Clones this field by deep copying it. All keyword parameters are applied to the cloned
-        field after cloning, overriding attributes already present. Any field parameters which have
-        a value that cannot be deep-copied are silently ignored."""
+        """Clones this field. All keyword parameters are applied to the cloned field after
+        cloning, overriding attributes already present. Any field parameters which have a value
+        that cannot be deep-copied are silently ignored.
+
+        Fields nested within this field are cloned along with it, so that the clone (including
+        any field nested within it) can be modified without affecting this field. The fields
+        within the ``structure`` of a :class:`Structure` are cloned lazily: they are shared by
+        the structure and its clone until one of them first exposes a shared field, at which
+        point the clone receives its own copy."""
 
         if 'default' not in params:
-            params['default'] = self.default
+            try:
+                params['default'] = self._copy_parameter(self.default)
+            except TypeError:
+                params['default'] = self.default
+
+        params.setdefault('ignore_null', self.ignore_null)
+        params.setdefault('required', self.required)
 
-        for key, value in self.__dict__.items():
-            if key not in params:
+        for key, value in self._get_attributes().items():
+            if key not in params and key[0] != '_':
                 try:
-                    params[key] = deepcopy(value)
+                    params[key] = self._copy_parameter(value)
                 except TypeError:
                     pass
 
         return type(self)(**params)
 
+    def compile(self, phase=INBOUND, serialized=False, **params):
+        """Compiles this field, and any fields nested within it, into a specialized processor for
+        the specified ``phase`` and ``serialized`` combination. The field is walked once, and all
+        decisions which depend only upon the field definition (and not upon the candidate value)
+        are resolved ahead of time, so that repeatedly processing values against the same field
+        avoids the interpretive overhead of ``process()``.
+
+        The returned processor is a ``callable`` with the signature ``(value, ancestry=None)``;
+        it returns the same values and raises the same exceptions as calling ``process()`` with
+        the same arguments (and ``params``). The processor reflects the definition of this field
+        at the time of compilation; if this field (or any field nested within it) is
+        subsequently modified, it should be recompiled.
+
+        The options accepted by the ``process()`` method of structural fields which determine
+        what is processed, namely ``partial`` for a :class:`Structure` and ``projection`` for a
+        field which is ``projectable``, are resolved at compilation and so must be specified
+        as ``params``. The options which govern an entire hierarchical value, such as
+        ``max_errors`` and ``preserve``, are instead specified by passing a
+        :class:`scheme.util.ProcessingContext` as the ``ancestry`` of the processor.
+
+        :param str phase: Optional, default is ``INBOUND``; see ``process()``.
+
+        :param boolean serialized: Optional, default is ``False``; see ``process()``.
+
+        :param \*\*params: Optional; ``partial`` and ``projection``, as described above. Raises
+            ``TypeError`` if this field does not accept the options specified.
+
+        :returns: The compiled processor.
+        """
+
+        if params.get('projection') is not None:
+            if not self.projectable:
+                raise TypeError("argument 'projection' requires a projectable field")
+            params['projection'] = compile_projection(params['projection'])
+
+        if self._overrides('process', '_compile_processor'):
+            return self._compile_fallback_processor(phase, serialized, **params)
+        return self._compile_processor(phase, serialized, **params)
+
     @classmethod
     def construct(cls, **specification):
         """Constructs and returns an instance of this field type using the specified keyword
@@ -293,6 +515,15 @@ class Field(object):
             included in the description, overriding any values present.
 
         :returns: The serializable field description, as a possibly nested ``dict``.
+
+        Descriptions are cached by the field described, for each combination of ``parameters``
+        and ``verbose``, and a copy of the cached description is returned. A cached description
+        is only returned while the parameters and attributes of the field, and of any field
+        nested within it, are unchanged, so that it is reconstructed once any of them is set,
+        whether directly or by methods such as :meth:`Structure.insert` and
+        :meth:`Enumeration.redefine`, and once a nested field is added, replaced or removed.
+        Otherwise modifying the value of an attribute in place, such as appending to the
+        ``enumeration`` of an :class:`Enumeration`, is not detected.
         """
 
         description = {'fieldtype': self.type}
@@ -381,6 +612,13 @@ class Field(object):
         if included:
             return self
 
+    def fingerprint(self):
+        """Returns a fingerprint of the description of this field, as a string of hexadecimal
+        digits. Fields with equal descriptions have equal fingerprints, so a fingerprint can be
+        used to identify a schema, such as one reconstructed with a :class:`FieldInterner`."""
+
+        return fingerprint_description(self.describe())
+
     def get(self, key, default=None):
         """Gets the child field of this field identified by ``key``, if this field is a structural
         field that has keyed child fields."""
@@ -431,7 +669,13 @@ class Field(object):
             or serialized after processing, if ``phase`` if ``OUTBOUND``.
 
         :param ancestry: Optional, default is ``None``; this parameter is used internally
-            during hierarchical processing and should not be directly specified.
+            during hierarchical processing and should not be directly specified. Implementations
+            should treat it as opaque, since it is typically a lazy ancestry (see
+            :class:`scheme.util.AncestrySegment`), passing it on to any errors they raise and
+            extending it with :func:`scheme.util.extend_ancestry` for any nested values they
+            process. In particular, it cannot be extended with ``+``, though a ``list`` of
+            ``str`` segments (such as one returned by :func:`scheme.util.materialize_ancestry`)
+            is still accepted.
 
         :returns: The processed value, which could be ``None``.
 
@@ -443,6 +687,9 @@ class Field(object):
         :raises UndefinedFieldError: when a subfield of a structural field was left undefined
         """
 
+        if self.cache is not None:
+            return self._process_cached(value, phase, serialized, ancestry)
+
         if not ancestry:
             ancestry = [self.guaranteed_name]
 
@@ -474,6 +721,37 @@ class Field(object):
 
         return value
 
+    def process_many(self, values, phase=INBOUND, serialized=False):
+        """Processes each value in ``values``, a sequence of independent candidate values for
+        this field, as described by ``process()``. The field is compiled (see ``compile()``) once
+        for the entire batch, so that the setup needed to process a value is not repeated for
+        each value.
+
+        :param values: A sequence of candidate values to process.
+
+        :param str phase: Optional, default is ``INBOUND``; see ``process()``.
+
+        :param boolean serialized: Optional, default is ``False``; see ``process()``.
+
+        :returns: A ``tuple`` containing a ``list`` of the processed values, in the same order
+            as ``values`` and with ``None`` for each value which failed to process, and a
+            ``dict`` mapping the index of each such value to the :exc:`StructuralError` which
+            ``process()`` would have raised for it.
+        """
+
+        processor = self.compile(phase, serialized)
+        results = []
+        errors = {}
+
+        for i, value in enumerate(values):
+            try:
+                results.append(processor(value))
+            except StructuralError as exception:
+                results.append(None)
+                errors[i] = exception
+
+        return results, errors
+
     def read(self, path, format=None, **params):
         """Reads the content of the file at ``path``, unserializes it, then processes it as an
         inbound value for this field."""
@@ -492,15 +770,56 @@ class Field(object):
         else:
             return True
 
-    def serialize(self, value, format=None, ancestry=None, **params):
+    def serialize(self, value, format=None, ancestry=None, trusted=False, projection=None,
+            **params):
         """Processes ``value`` as an outbound value for this field, then, if ``format`` is
-        specified, serializes the processed value to ``format``."""
-
-        value = self.process(value, OUTBOUND, True, ancestry)
+        specified, serializes the processed value to ``format``.
+
+        If ``trusted`` is ``True``, ``value`` is assumed to already be a valid value for this
+        field (such as one previously returned by processing an inbound value), and is only
+        converted to its serialized form; constraints are not checked, and neither
+        preprocessors nor any normalization performed during validation are applied.
+
+        If ``projection`` is specified, only the projected subset of ``value`` is processed
+        and serialized; see :meth:`Structure.process`. Only fields which are ``projectable``
+        accept a projection."""
+
+        if projection is not None:
+            if not self.projectable:
+                raise TypeError("argument 'projection' requires a projectable field")
+            projection = compile_projection(projection)
+            if trusted:
+                value = self._serialize_trusted(value, projection)
+            else:
+                value = self.process(value, OUTBOUND, True, ancestry, projection=projection)
+        elif trusted:
+            value = self._serialize_trusted(value)
+        else:
+            value = self.process(value, OUTBOUND, True, ancestry)
         if format:
             value = Format.formats[format].serialize(value, self, **params)
         return value
 
+    def serialize_description(self, format='json', parameters=None, verbose=False):
+        """Returns the description of this field, as constructed by ``describe()``, serialized
+        to ``format``. The serialized description is cached along with the description itself,
+        so that repeatedly serializing the description of an unmodified field only costs a
+        lookup.
+
+        :param string format: Optional, default is ``'json'``; the format to serialize the
+            description to.
+        """
+
+        formatter = Format.formats[format]
+        return self._cache_description(formatter, parameters, verbose,
+            lambda: formatter.serialize(self.describe(parameters, verbose)))
+
+    def serialize_many(self, values):
+        """Processes each value in ``values`` as an outbound value for this field; see
+        ``process_many()``."""
+
+        return self.process_many(values, OUTBOUND, True)
+
     def transform(self, transformer):
         """Invokes ``transformer`` with this field as the sole argument, then checks its return
         value. If a different Field instance, that value is immediately returned. If ``False``,
@@ -520,6 +839,12 @@ class Field(object):
             value = Format.formats[format].unserialize(value, self, **params)
         return self.process(value, INBOUND, True, ancestry)
 
+    def unserialize_many(self, values):
+        """Processes each value in ``values`` as a serialized inbound value for this field; see
+        ``process_many()``."""
+
+        return self.process_many(values, INBOUND, True)
+
     @classmethod
     def visit(cls, specification, callback):
         """Invokes ``callback`` directly on ``specification``, which should be a field
@@ -539,6 +864,177 @@ class Field(object):
         value = self.process(value, OUTBOUND, True)
         Format.write(path, value, format, self, **params)
 
+    def _cache_description(self, format, parameters, verbose, construct):
+        """Returns the description of this field for ``parameters`` and ``verbose`` (serialized
+        to ``format``, if specified) cached by this field, calling ``construct`` to construct it
+        if it is not cached or if the signature it was cached with no longer matches this field
+        (see ``_get_signature()``). Descriptions for ``parameters`` which are not hashable are
+        not cached."""
+
+        if parameters:
+            try:
+                key = (format, verbose, frozenset(parameters.items()))
+            except TypeError:
+                return construct()
+        else:
+            key = (format, verbose, None)
+
+        signature = self._get_signature()
+        if parameters:
+            signature.extend(getattr(self, name, None) for name in parameters)
+
+        cache = self._descriptions
+        if cache is None:
+            cache = self._descriptions = {}
+        else:
+            cached = cache.get(key)
+            if (cached is not None and len(cached[0]) == len(signature)
+                    and all(map(is_, cached[0], signature))):
+                return cached[1]
+
+        description = construct()
+        cache[key] = (signature, description)
+        return description
+
+    def _compile_cached_processor(self, processor, phase, serialized):
+        """Returns a processor which consults the cache of this field before delegating to
+        ``processor``; see the ``cache`` parameter."""
+
+        cache = self.cache
+        def cached_processor(value, ancestry=None):
+            if value is None:
+                return processor(value, ancestry)
+
+            key = (phase, serialized, type(value), value)
+            try:
+                candidate = cache.get(key, NODEFAULT)
+            except TypeError:
+                return processor(value, ancestry)
+
+            if candidate is NODEFAULT:
+                candidate = processor(value, ancestry)
+                cache.put(key, candidate)
+            return candidate
+        return cached_processor
+
+    def _compile_fallback_processor(self, phase, serialized, **params):
+        """Returns a processor which simply delegates to ``process()``; used for subclasses
+        which provide their own implementation of ``process()`` without a corresponding
+        implementation of ``_compile_processor()``."""
+
+        process = self.process
+        def processor(value, ancestry=None):
+            return process(value, phase, serialized, ancestry, **params)
+        return processor
+
+    def _compile_processor(self, phase, serialized):
+        """Constructs and returns a processor for this field, as described by ``compile()``.
+        Subclasses which provide their own implementation of ``process()`` should provide a
+        corresponding implementation of this method, accepting the same options as ``params``
+        that ``compile()`` does."""
+
+        field = self
+        name = self.guaranteed_name
+        nonnull = self.nonnull
+        constant = self.constant
+        preprocessor = self.preprocessor
+        validate = self._validate_value
+
+        is_null = None
+        if type(self)._is_null is not Field._is_null:
+            is_null = self._is_null
+
+        unserialize = None
+        if serialized and phase == INBOUND:
+            unserialize = self._unserialize_value
+
+        serialize = None
+        if serialized and phase == OUTBOUND:
+            serialize = self._serialize_value
+
+        def processor(value, ancestry=None):
+            if not ancestry:
+                ancestry = [name]
+
+            if is_null is not None:
+                if is_null(value, ancestry):
+                    return None
+            elif value is None:
+                if nonnull:
+                    raise ValidationError(identity=ancestry, field=field).construct('nonnull')
+                return None
+
+            if unserialize is not None:
+                value = unserialize(value, ancestry)
+
+            if preprocessor is not None:
+                try:
+                    value = preprocessor(value)
+                except Exception:
+                    raise InvalidTypeError(identity=ancestry, field=field,
+                        value=value).construct('invalid').capture()
+
+            if constant is not None and value != constant:
+                raise InvalidTypeError(identity=ancestry, field=field,
+                    value=value).construct('invalid')
+
+            candidate = validate(value, ancestry)
+            if candidate is not None:
+                value = candidate
+
+            if serialize is not None:
+                try:
+                    value = serialize(value)
+                except OverflowError:
+                    raise ValidationError(identity=ancestry, field=field,
+                        value=value).construct('overflow')
+
+            return value
+
+        if self.cache is not None:
+            return self._compile_cached_processor(processor, phase, serialized)
+        return processor
+
+    def _compile_subfield(self, field, phase, serialized, resolve, message, projection=None):
+        """Compiles ``field``, a subfield of this field, returning its processor; ``projection``
+        is applied to it if it is projectable. If ``field`` is still an :class:`Undefined`,
+        compilation is deferred until the processor is first invoked, at which point ``resolve``
+        is called to obtain the (hopefully) defined subfield; if it is still undefined,
+        :exc:`UndefinedFieldError` is raised with ``message``."""
+
+        if not isinstance(field, Undefined):
+            if projection is not None and field.projectable:
+                return field.compile(phase, serialized, projection=projection)
+            return field.compile(phase, serialized)
+
+        compiled = []
+        def processor(value, ancestry=None):
+            if not compiled:
+                subfield = resolve()
+                if isinstance(subfield, Undefined):
+                    if subfield.field is None:
+                        raise UndefinedFieldError(message)
+                    subfield = subfield.field
+                if projection is not None and subfield.projectable:
+                    compiled.append(subfield.compile(phase, serialized, projection=projection))
+                else:
+                    compiled.append(subfield.compile(phase, serialized))
+            return compiled[0](value, ancestry)
+        return processor
+
+    def _construct_ancestry(self, ancestry, fail_fast=False, max_errors=None, preserve=False):
+        """Constructs the root ancestry for processing a value for this field, which is a
+        :class:`scheme.util.ProcessingContext` if any processing options are specified."""
+
+        if fail_fast:
+            max_errors = 1
+        if max_errors is not None or preserve:
+            return ProcessingContext(ancestry or [self.guaranteed_name], max_errors, preserve)
+        elif ancestry:
+            return ancestry
+        else:
+            return [self.guaranteed_name]
+
     @classmethod
     def _construct_parameter(cls, parameter):
         if isinstance(parameter, dict):
@@ -555,6 +1051,22 @@ class Field(object):
         else:
             return parameter
 
+    def _copy_parameter(self, parameter):
+        if isinstance(parameter, Field):
+            return parameter.clone()
+        elif isinstance(parameter, Undefined):
+            return parameter
+        elif type(parameter) is dict:
+            return dict((k, self._copy_parameter(v)) for k, v in parameter.items())
+        elif type(parameter) in (list, tuple):
+            copy = [self._copy_parameter(item) for item in parameter]
+            if type(parameter) is list:
+                return copy
+            else:
+                return tuple(copy)
+        else:
+            return deepcopy(parameter)
+
     def _describe_parameter(self, parameter):
         if isinstance(parameter, dict):
             return dict((k, self._describe_parameter(v)) for k, v in parameter.items())
@@ -571,6 +1083,97 @@ class Field(object):
         else:
             raise CannotDescribeError(parameter)
 
+    def _discard_descriptions(self):
+        """Discards the descriptions cached by this field, along with any cached descriptions
+        which might embed them, in anticipation of this field being modified, and records the
+        modification as the revision of this field; see ``GENERATION``."""
+
+        global GENERATION
+        GENERATION += 1
+        self._descriptions = None
+        self._revision = GENERATION
+
+    def _get_accepted_types(self, phase, serialized):
+        """Returns the ``tuple`` of types which a value must be an instance of to possibly be
+        processed by this field for ``phase`` and ``serialized`` without raising an
+        :exc:`InvalidTypeError`, or ``None`` if that cannot be determined ahead of time. This
+        is the case if a preprocessor is specified, if the value will first be unserialized by
+        an implementation of ``_unserialize_value()``, or if ``_validate_value()`` or
+        ``process()`` is overridden below the class declaring ``accepted_types``."""
+
+        accepted_types = self.accepted_types
+        if accepted_types is None or self.preprocessor:
+            return None
+
+        if serialized and phase == INBOUND:
+            if self._get_implementations('_unserialize_value')['_unserialize_value'] is not Field:
+                return None
+
+        if self._overrides('process', 'accepted_types'):
+            return None
+        if self._overrides('_validate_value', 'accepted_types'):
+            return None
+
+        return accepted_types
+
+    def _get_attributes(self):
+        """Returns a ``dict`` of the attributes of this field which are set, whether they are
+        stored in slots or in the instance ``__dict__``, excluding its revision and its
+        cached processors and descriptions; see ``slotted_attributes``."""
+
+        attrs = {}
+        for attr in self.slotted_attributes:
+            try:
+                attrs[attr] = object.__getattribute__(self, attr)
+            except AttributeError:
+                pass
+
+        attrs.update(self.__dict__)
+        attrs.pop('_cached_processors', None)
+        attrs.pop('_revision', None)
+        return attrs
+
+    @classmethod
+    def _get_implementations(cls, *attrs):
+        """Returns a ``dict`` mapping each of ``attrs`` to the most derived class, in the method
+        resolution order of this class, which defines it."""
+
+        key = (cls,) + attrs
+        try:
+            return IMPLEMENTATIONS[key]
+        except KeyError:
+            pass
+
+        implementations = {}
+        for candidate in cls.__mro__:
+            for attr in attrs:
+                if attr not in implementations and attr in candidate.__dict__:
+                    implementations[attr] = candidate
+
+        IMPLEMENTATIONS[key] = implementations
+        return implementations
+
+    def _get_signature(self, signature=None):
+        """Returns the signature of this field, against which its cached descriptions are
+        validated: a ``list`` of the values of its described attributes and aspects, which are
+        compared by identity, followed by the signatures of any fields nested within a
+        structural field. If ``signature`` is specified, the signature of this field is
+        appended to it instead."""
+
+        if signature is None:
+            signature = []
+
+        values = self._get_described_values(self)
+        signature.extend(values)
+        if self.aspects:
+            self._sign_parameter(self.aspects, signature)
+
+        if self.structural:
+            for value in values:
+                if isinstance(value, (Field, dict, list, tuple)):
+                    self._sign_parameter(value, signature)
+        return signature
+
     def _is_null(self, value, ancestry):
         if value is None:
             if self.nonnull:
@@ -578,6 +1181,98 @@ class Field(object):
             else:
                 return True
 
+    @classmethod
+    def _overrides(cls, attr, counterpart):
+        """Indicates if ``attr`` is defined by a class which is more derived than the class which
+        defines ``counterpart``, such that an implementation of ``counterpart`` can no longer be
+        assumed to correspond to ``attr``."""
+
+        implementations = cls._get_implementations(attr, counterpart)
+        implementation, counterpart = implementations[attr], implementations[counterpart]
+        return implementation is not counterpart and issubclass(implementation, counterpart)
+
+    def _process_cached(self, value, phase, serialized, ancestry):
+        """Processes ``value`` as ``process()`` does, for a field with a ``cache``. The
+        processor consulting the cache for each ``phase`` and ``serialized`` combination is
+        compiled when first needed, so fields with a cache should not be modified once used."""
+
+        processors = self.__dict__.get('_cached_processors')
+        if processors is None:
+            processors = self._cached_processors = {}
+
+        try:
+            processor = processors[phase, serialized]
+        except KeyError:
+            processor = processors[phase, serialized] = Field._compile_processor(self, phase,
+                serialized)
+        return processor(value, ancestry)
+
+    def _raise_invalid_path(self, previous, path, identity):
+        """Raises a ``ValidationError`` for ``path``, a change path which does not identify a
+        value within ``previous``, reported at ``identity``, the lazy ancestry of the first key
+        of ``path`` which cannot be resolved; see ``_revalidate()``."""
+
+        raise ValidationError(identity=identity, field=self, value=previous).construct(
+            'invalidpath', path='.'.join(str(key) for key in path))
+
+    def _revalidate(self, previous, changes, serialized, ancestry):
+        """Revalidates ``previous``, a value previously returned by processing an inbound value
+        for this field, after applying ``changes``, a ``list`` of ``(path, value)`` pairs with
+        each ``path`` a ``tuple`` of keys relative to this field; see
+        :meth:`Structure.revalidate`. This implementation applies ``changes`` to an unprocessed
+        copy of ``previous``, then processes that copy in its entirety; structural fields
+        override it to reprocess only the affected items."""
+
+        value = previous
+        unprocessed = False
+
+        for path, change in changes:
+            if not path:
+                value, unprocessed = change, True
+                continue
+
+            if not unprocessed:
+                if serialized:
+                    value = self._serialize_trusted(value)
+                else:
+                    value = deepcopy(value)
+                unprocessed = True
+
+            subject, identity, last = value, ancestry, len(path) - 1
+            for i, key in enumerate(path):
+                if isinstance(subject, list):
+                    index = parse_change_index(key, len(subject))
+                    identity = (identity, INDEX_SEGMENT, key)
+                    if index is None:
+                        self._raise_invalid_path(previous, path, identity)
+                    key = index
+                elif isinstance(subject, dict):
+                    identity = (identity, ATTRIBUTE_SEGMENT, key)
+                    if i < last and key not in subject:
+                        self._raise_invalid_path(previous, path, identity)
+                else:
+                    self._raise_invalid_path(previous, path, (identity, ATTRIBUTE_SEGMENT, key))
+
+                if i < last:
+                    subject = subject[key]
+                else:
+                    subject[key] = change
+
+        return self.process(value, INBOUND, serialized, ancestry)
+
+    def _serialize_trusted(self, value):
+        """Converts ``value``, which is assumed to be a valid value for this field, to its
+        serialized form without validating it; see ``serialize()``. Subclasses which provide
+        their own implementation of ``process()`` should provide a corresponding implementation
+        of this method."""
+
+        if value is None:
+            return None
+        elif self._overrides('process', '_serialize_trusted'):
+            return self.process(value, OUTBOUND, True)
+        else:
+            return self._serialize_value(value)
+
     def _serialize_value(self, value):
         """Converts ``value`` to a natively serializable form, if necessary, and returns it. A
         suitable implementation of this method should be provided by subclasses which handle
@@ -586,6 +1281,21 @@ class Field(object):
 
         return value
 
+    def _sign_parameter(self, parameter, signature):
+        if isinstance(parameter, Field):
+            parameter._get_signature(signature)
+        elif isinstance(parameter, dict):
+            for key, value in dict.items(parameter):
+                signature.append(key)
+                signature.append(value)
+                if isinstance(value, (Field, dict, list, tuple)):
+                    self._sign_parameter(value, signature)
+        else:
+            for value in parameter:
+                signature.append(value)
+                if isinstance(value, (Field, dict, list, tuple)):
+                    self._sign_parameter(value, signature)
+
     def _unserialize_value(self, value, ancestry):
         """Converts ``value`` to the proper form for this field, if necessary, and returns it;
         ``value`` should be in the form returned by ``._serialize_value()`, but this is not
@@ -613,6 +1323,85 @@ class Field(object):
     def _visit_field(cls, specification, callback):
         return {}
 
+class FieldInterner(object):
+    """A registry of reconstructed fields, keyed by the fingerprints of their descriptions,
+    used to share a single instance of each distinct field among all the schemas reconstructed
+    with it. For example, every occurrence of an identical address structure within the field
+    descriptions sent by a remote service would be reconstructed as the same :class:`Field`
+    instance, along with every identical field nested within it.
+
+    :param int size: Optional, default is ``None``; if specified, the maximum number of fields
+        this registry retains, discarding the least recently used field when full. Otherwise,
+        every field interned by this registry is retained until :meth:`clear` is called.
+
+    Since an interned field can be shared by any number of schemas, interned fields must be
+    treated as immutable; in particular, they should not be modified with methods such as
+    :meth:`Structure.insert`.
+    """
+
+    def __init__(self, size=None):
+        if size is not None:
+            self.fields = LRUCache(size)
+        else:
+            self.fields = {}
+        self.size = size
+
+    def __len__(self):
+        return len(self.fields)
+
+    def clear(self):
+        """Discards all fields interned by this registry."""
+
+        self.fields.clear()
+
+    def reconstruct(self, specification):
+        """Reconstructs the field described by ``specification``, as ``Field.reconstruct()``
+        does, returning the interned field for an identical specification if there is one.
+        Fields nested within ``specification`` are interned as well. Unlike
+        ``Field.reconstruct()``, ``specification`` is not modified."""
+
+        return self._intern(specification)
+
+    def _intern(self, specification, key=None):
+        if isinstance(specification, Field):
+            return specification
+
+        try:
+            fingerprint = fingerprint_description(specification)
+        except TypeError:
+            return Field.reconstruct(self._intern_parameter(specification, True))
+
+        # an unnamed field nested within a structure is named with its key by that structure,
+        # so it can only be shared with fields nested under the same key
+        if key is not None and not specification.get('name'):
+            fingerprint = (fingerprint, key)
+
+        fields = self.fields
+        field = fields.get(fingerprint)
+        if field is None:
+            field = Field.reconstruct(self._intern_parameter(specification, True))
+            if self.size is None:
+                field = fields.setdefault(fingerprint, field)
+            else:
+                fields.put(fingerprint, field)
+        return field
+
+    def _intern_parameter(self, parameter, root=False, key=None):
+        if isinstance(parameter, dict):
+            if not root and 'fieldtype' in parameter:
+                return self._intern(parameter, key)
+            if root:
+                return dict((k, self._intern_parameter(v)) for k, v in parameter.items())
+            return dict((k, self._intern_parameter(v, key=k)) for k, v in parameter.items())
+        elif isinstance(parameter, (list, tuple)):
+            interned = [self._intern_parameter(item) for item in parameter]
+            if isinstance(parameter, list):
+                return interned
+            else:
+                return tuple(interned)
+        else:
+            return parameter
+
 class Undefined(object):
     """A field placeholder which can be replaced with a valid field at a later time, intended
     in particular to support defining recursive structures.
@@ -8,6 +8,9 @@ __all__ = ('Binary',)
 class Binary(Field):
     """A field for binary values."""
 
+    __slots__ = ('max_length', 'min_length')
+
+    accepted_types = (bytes,)
     basetype = 'binary'
     equivalent = bytes
     parameters = {'max_length': None, 'min_length': None}
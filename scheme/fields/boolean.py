@@ -6,6 +6,9 @@ __all__ = ('Boolean',)
 class Boolean(Field):
     """A field for boolean values."""
 
+    __slots__ = ()
+
+    accepted_types = (bool,)
     basetype = 'boolean'
     equivalent = bool
 
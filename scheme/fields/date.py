@@ -15,6 +15,8 @@ class Date(Field):
         either a ``date`` value or a ``str`` in the format ``YYYY-MM-DD``.
     """
 
+    __slots__ = ('maximum', 'minimum')
+
     basetype = 'date'
     equivalent = date
     parameters = {'maximum': None, 'minimum': None}
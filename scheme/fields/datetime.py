@@ -12,6 +12,8 @@ __all__ = ('DateTime',)
 class DateTime(Field):
     """A field for ``datetime`` values."""
 
+    __slots__ = ('maximum', 'minimum', 'timezone', 'utc')
+
     basetype = 'datetime'
     equivalent = datetime
     parameters = {'maximum': None, 'minimum': None, 'utc': False}
@@ -12,6 +12,8 @@ __all__ = ('Decimal',)
 class Decimal(Field):
     """A field for decimal values."""
 
+    __slots__ = ('maximum', 'minimum')
+
     basetype = 'decimal'
     equivalent = decimal
 
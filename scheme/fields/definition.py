@@ -7,6 +7,8 @@ __all__ = ('Definition',)
 class Definition(Field):
     """A field for field definitions."""
 
+    __slots__ = ('valid_fields',)
+
     basetype = 'definition'
     parameters = {'valid_fields': None}
     equivalent = Field
@@ -23,6 +23,8 @@ SEPARATORS = whitespace + ',;:'
 class Email(Text):
     """A field for one or more email addresses."""
 
+    __slots__ = ('extended', 'multiple')
+
     single_errors = [FieldError('pattern', 'invalid value', '%(field)s must be a valid email address')]
     multiple_errors = [FieldError('pattern', 'invalid value', '%(field)s must be a list of valid email addresses')]
     parameters = {'extended': False, 'multiple': False, 'strip': False}
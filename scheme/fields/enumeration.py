@@ -1,12 +1,46 @@
 from scheme.exceptions import *
 from scheme.field import *
 from scheme.interpolation import interpolate_parameters
-from scheme.util import string
+from scheme.util import LRUCache, string
 
 __all__ = ('Enumeration',)
 
+# frozen values are shared by enumerations with equal values, which schemas often repeat (such
+# as a status enumeration used by many structures), since even a small frozenset takes more
+# memory than the rest of an enumeration field
+FROZEN_VALUES = LRUCache(256)
+
+def freeze_values(values):
+    if values is not None:
+        try:
+            frozen = frozenset(values)
+        except TypeError:
+            return None
+
+        shared = FROZEN_VALUES.get(frozen)
+        if shared is None:
+            FROZEN_VALUES.put(frozen, frozen)
+            shared = frozen
+        return shared
+
+def contains_value(frozen, values, value):
+    if frozen is not None:
+        try:
+            return value in frozen
+        except TypeError:
+            pass
+    return value in values
+
 class Enumeration(Field):
-    """A field for enumerated values."""
+    """A field for enumerated values.
+
+    Membership is tested against a ``frozenset`` of the enumerated values, unless any of them
+    are unhashable, while ``enumeration`` retains the values in their original order. If
+    ``enumeration`` is modified in place, :meth:`redefine` should be used instead.
+    """
+
+    __slots__ = ('enumeration', 'ignored_values', 'representation', '_frozen_enumeration',
+        '_frozen_ignored_values')
 
     basetype = 'enumeration'
     parameters = {'enumeration': None}
@@ -39,16 +73,18 @@ class Enumeration(Field):
         self.enumeration = enumeration
         self.ignored_values = ignored_values
         self.representation = ', '.join([repr(value) for value in enumeration])
+        self._frozen_enumeration = freeze_values(enumeration)
+        self._frozen_ignored_values = freeze_values(ignored_values)
 
     def __repr__(self):
         return super(Enumeration, self).__repr__(['enumeration=[%s]' % self.representation])
 
     def interpolate(self, subject, parameters, interpolator=None):
-        if subject is None or subject in self.enumeration:
+        if subject is None or self._is_enumerated(subject):
             return subject
 
         value = interpolate_parameters(subject, parameters, True, interpolator)
-        if value in self.enumeration:
+        if self._is_enumerated(value):
             return value
         else:
             raise CannotInterpolateError('subject must be a value in this enumeration')
@@ -63,17 +99,22 @@ class Enumeration(Field):
         else:
             raise ValueError("argument 'strategy' must be either 'append' or 'replace'")
 
+        self._discard_descriptions()
         self.enumeration = list(set(baseline + enumeration))
         self.representation = ', '.join([repr(value) for value in self.enumeration])
+        self._frozen_enumeration = freeze_values(self.enumeration)
+
+    def _is_enumerated(self, value):
+        return contains_value(self._frozen_enumeration, self.enumeration, value)
 
     def _is_null(self, value, ancestry):
         ignored_values = self.ignored_values
-        if ignored_values and value in ignored_values:
+        if ignored_values and contains_value(self._frozen_ignored_values, ignored_values, value):
             value = None
 
         return super(Enumeration, self)._is_null(value, ancestry)
 
     def _validate_value(self, value, ancestry):
-        if value not in self.enumeration:
+        if not self._is_enumerated(value):
             raise InvalidTypeError(identity=ancestry, field=self, value=value).construct('invalid',
                 values=self.representation)
@@ -6,6 +6,8 @@ __all__ = ('Error',)
 class Error(Field):
     """A field for error values."""
 
+    __slots__ = ()
+
     basetype = 'tuple'
 
     errors = [
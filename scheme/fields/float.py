@@ -8,6 +8,9 @@ __all__ = ('Float',)
 class Float(Field):
     """A field for ``float`` values."""
 
+    __slots__ = ('maximum', 'minimum')
+
+    accepted_types = (float,)
     basetype = 'float'
     parameters = {'maximum': None, 'minimum': None}
 
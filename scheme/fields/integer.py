@@ -8,6 +8,9 @@ __all__ = ('Integer',)
 class Integer(Field):
     """A field for integer values."""
 
+    __slots__ = ('maximum', 'minimum')
+
+    accepted_types = integers
     basetype = 'integer'
     parameters = {'maximum': None, 'minimum': None}
 
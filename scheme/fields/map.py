@@ -1,7 +1,11 @@
+from functools import partial
+
 from scheme.exceptions import *
 from scheme.field import *
 from scheme.interpolation import interpolate_parameters
-from scheme.util import string
+from scheme.util import INDEX_SEGMENT, compile_projection
+from scheme.util import exhausts_error_budget, group_changes, mapping_is_unchanged
+from scheme.util import preserves_identity, string
 
 __all__ = ('Map',)
 
@@ -30,8 +34,12 @@ class Map(Field):
     :raises TypeError: when a constructor parameter is invalid
     """
 
+    __slots__ = ('key', 'required_keys', 'value')
+
+    accepted_types = (dict,)
     basetype = 'map'
     parameters = {'required_keys': None}
+    projectable = True
     structural = True
 
     errors = [
@@ -87,7 +95,7 @@ class Map(Field):
 
         return super(Map, self).describe(parameters, verbose, **params)
 
-    def extract(self, subject, strict=True, **params):
+    def extract(self, subject, strict=True, projection=None, **params):
         if params and not self.screen(**params):
             raise FieldExcludedError(self)
 
@@ -106,6 +114,9 @@ class Map(Field):
         definition = self.value
         extraction = {}
 
+        if projection is not None and definition.projectable:
+            params['projection'] = projection
+
         for key, value in subject.items():
             try:
                 extraction[key] = definition.extract(value, strict, **params)
@@ -131,7 +142,7 @@ class Map(Field):
         else:
             raise CannotFilterError(self)
 
-    def instantiate(self, value, key=None):
+    def instantiate(self, value, key=None, projection=None):
         if value is None:
             return None
 
@@ -140,7 +151,10 @@ class Map(Field):
 
         for k, v in value.items():
             try:
-                candidate[k] = definition.instantiate(v, k)
+                if projection is not None and definition.projectable:
+                    candidate[k] = definition.instantiate(v, k, projection)
+                else:
+                    candidate[k] = definition.instantiate(v, k)
             except AttributeError:
                 if isinstance(definition, Undefined):
                     raise UndefinedFieldError("the 'value' field of this map is undefined")
@@ -175,9 +189,26 @@ class Map(Field):
 
         return interpolation
 
-    def process(self, value, phase=INBOUND, serialized=False, ancestry=None):
-        if not ancestry:
-            ancestry = [self.guaranteed_name]
+    def process(self, value, phase=INBOUND, serialized=False, ancestry=None, fail_fast=False,
+            max_errors=None, preserve=False, projection=None):
+        """Processes ``value`` as described by :meth:`Field.process`.
+
+        :param boolean fail_fast: Optional, default is ``False``; if ``True``, processing is
+            aborted as soon as the first error is encountered, at any depth; see
+            :meth:`Structure.process`.
+
+        :param int max_errors: Optional, default is ``None``; if specified, processing is aborted
+            as soon as this many errors have been encountered, at any depth.
+
+        :param boolean preserve: Optional, default is ``False``; if ``True``, ``value`` itself is
+            returned instead of a copy when processing it changed nothing, at any depth; see
+            :meth:`Structure.process`.
+
+        :param projection: Optional, default is ``None``; if specified, the projection which is
+            applied to each value of ``value``; see :meth:`Structure.process`.
+        """
+
+        ancestry = self._construct_ancestry(ancestry, fail_fast, max_errors, preserve)
 
         if self._is_null(value, ancestry):
             return None
@@ -192,26 +223,37 @@ class Map(Field):
         key_field = self.key
         value_field = self.value
 
+        try:
+            process = value_field.process
+        except AttributeError:
+            if not isinstance(value_field, Undefined):
+                raise
+            elif value:
+                raise UndefinedFieldError('the value field of this map is undefined')
+        else:
+            if projection is not None and value_field.projectable:
+                process = partial(process, projection=compile_projection(projection))
+
         map = {}
         for name, subvalue in value.items():
             if key_field:
                 try:
-                    name = key_field.process(name, phase, serialized, ancestry + ['[%s]' % name])
+                    name = key_field.process(name, phase, serialized,
+                        (ancestry, INDEX_SEGMENT, name))
                 except StructuralError as exception:
                     raise ValidationError(identity=ancestry, field=self, value=value).construct('invalidkeys')
             elif not isinstance(name, string):
                 raise ValidationError(identity=ancestry, field=self, value=value).construct('invalidkeys')
 
             try:
-                map[name] = value_field.process(subvalue, phase, serialized, ancestry + ['[%s]' % name])
+                map[name] = process(subvalue, phase, serialized,
+                    (ancestry, INDEX_SEGMENT, name))
             except StructuralError as exception:
                 valid = False
                 map[name] = exception
-            except AttributeError:
-                if isinstance(value_field, Undefined):
-                    raise UndefinedFieldError('the value field of this map is undefined')
-                else:
-                    raise
+                if exhausts_error_budget(ancestry, exception):
+                    raise ValidationError(identity=ancestry, field=self, value=value,
+                        structure=map)
 
         if self.required_keys:
             for name in self.required_keys:
@@ -219,12 +261,18 @@ class Map(Field):
                     valid = False
                     map[name] = ValidationError(identity=ancestry, field=self).construct(
                         'required', name=name)
+                    if exhausts_error_budget(ancestry):
+                        break
 
-        if valid:
-            return map
-        else:
+        if not valid:
             raise ValidationError(identity=ancestry, field=self, value=value, structure=map)
 
+        if (preserves_identity(ancestry) and not self.preprocessor
+                and mapping_is_unchanged(value, map)):
+            return value
+        else:
+            return map
+
     def transform(self, transformer):
         candidate = transformer(self)
         if isinstance(candidate, Field):
@@ -238,9 +286,187 @@ class Map(Field):
         else:
             return self.clone(value=candidate)
 
+    def _compile_processor(self, phase, serialized, projection=None):
+        field = self
+        guaranteed_name = self.guaranteed_name
+        nonnull = self.nonnull
+        preprocessor = self.preprocessor
+        required_keys = self.required_keys
+
+        key_field = None
+        if self.key:
+            key_field = self.key.compile(phase, serialized)
+
+        value_field = self._compile_subfield(self.value, phase, serialized, lambda: self.value,
+            'the value field of this map is undefined', projection)
+
+        def processor(value, ancestry=None):
+            if not ancestry:
+                ancestry = [guaranteed_name]
+
+            if value is None:
+                if nonnull:
+                    raise ValidationError(identity=ancestry, field=field).construct('nonnull')
+                return None
+
+            if not isinstance(value, dict):
+                raise InvalidTypeError(identity=ancestry, field=field,
+                    value=value).construct('invalid')
+
+            if preprocessor is not None:
+                value = preprocessor(value)
+
+            valid = True
+            map = {}
+
+            for name, subvalue in value.items():
+                if key_field is not None:
+                    try:
+                        name = key_field(name, (ancestry, INDEX_SEGMENT, name))
+                    except StructuralError:
+                        raise ValidationError(identity=ancestry, field=field,
+                            value=value).construct('invalidkeys')
+                elif not isinstance(name, string):
+                    raise ValidationError(identity=ancestry, field=field,
+                        value=value).construct('invalidkeys')
+
+                try:
+                    map[name] = value_field(subvalue, (ancestry, INDEX_SEGMENT, name))
+                except StructuralError as exception:
+                    valid = False
+                    map[name] = exception
+                    if exhausts_error_budget(ancestry, exception):
+                        raise ValidationError(identity=ancestry, field=field, value=value,
+                            structure=map)
+
+            if required_keys:
+                for name in required_keys:
+                    if name not in map:
+                        valid = False
+                        map[name] = ValidationError(identity=ancestry, field=field).construct(
+                            'required', name=name)
+                        if exhausts_error_budget(ancestry):
+                            break
+
+            if not valid:
+                raise ValidationError(identity=ancestry, field=field, value=value, structure=map)
+
+            if (preprocessor is None and preserves_identity(ancestry)
+                    and mapping_is_unchanged(value, map)):
+                return value
+            else:
+                return map
+        return processor
+
     def _define_undefined_field(self, field):
+        self._discard_descriptions()
         self.value = field
 
+    def _finish_processing(self, value, map, valid, ancestry):
+        """Completes the processing of ``value`` for this map once ``map`` holds its processed
+        values, returning the processed value; used by the coroutines of
+        :mod:`scheme.asynchronous`, since ``process()`` performs these steps inline."""
+
+        if self.required_keys:
+            for name in self.required_keys:
+                if name not in map:
+                    valid = False
+                    map[name] = ValidationError(identity=ancestry, field=self).construct(
+                        'required', name=name)
+                    if exhausts_error_budget(ancestry):
+                        break
+
+        if not valid:
+            raise ValidationError(identity=ancestry, field=self, value=value, structure=map)
+
+        if (preserves_identity(ancestry) and not self.preprocessor
+                and mapping_is_unchanged(value, map)):
+            return value
+        else:
+            return map
+
+    def _prepare_processing(self, value, ancestry):
+        """Validates and preprocesses ``value``, a non-null value being processed for this
+        map, returning the preprocessed value; used by the coroutines of
+        :mod:`scheme.asynchronous`, since ``process()`` performs these steps inline."""
+
+        if not isinstance(value, dict):
+            raise InvalidTypeError(identity=ancestry, field=self, value=value).construct('invalid')
+
+        if self.preprocessor:
+            value = self.preprocessor(value)
+
+        return value
+
+    def _process_key(self, name, value, phase, serialized, ancestry):
+        """Processes ``name``, a key of ``value``, for the ``key`` field of this map, if any,
+        returning the processed key; used by the coroutines of :mod:`scheme.asynchronous`,
+        which only call it when this map has a ``key`` field or ``name`` is not a string."""
+
+        if self.key:
+            try:
+                return self.key.process(name, phase, serialized, (ancestry, INDEX_SEGMENT, name))
+            except StructuralError:
+                pass
+        raise ValidationError(identity=ancestry, field=self, value=value).construct('invalidkeys')
+
+    def _revalidate(self, previous, changes, serialized, ancestry):
+        groups = group_changes(changes)
+        if (not isinstance(previous, dict) or self.preprocessor or self.key
+                or groups[0][0] is None):
+            return super(Map, self)._revalidate(previous, changes, serialized, ancestry)
+
+        value_field = self.value
+        if isinstance(value_field, Undefined):
+            raise UndefinedFieldError('the value field of this map is undefined')
+
+        map = dict(previous)
+        errors = {}
+
+        for name, subchanges in groups:
+            if not isinstance(name, string):
+                raise ValidationError(identity=ancestry, field=self,
+                    value=previous).construct('invalidkeys')
+
+            try:
+                map[name] = value_field._revalidate(map.get(name), subchanges, serialized,
+                    (ancestry, INDEX_SEGMENT, name))
+            except StructuralError as exception:
+                errors[name] = exception
+                if exhausts_error_budget(ancestry, exception):
+                    break
+
+        if errors:
+            map.update(errors)
+            raise ValidationError(identity=ancestry, field=self, value=previous, structure=map)
+
+        return map
+
+    def _serialize_trusted(self, value, projection=None):
+        if value is None:
+            return None
+
+        key_field = self.key
+        value_field = self.value
+
+        options = ()
+        if projection is not None and value_field.projectable:
+            options = (projection,)
+
+        map = {}
+        for name, subvalue in value.items():
+            if key_field:
+                name = key_field._serialize_trusted(name)
+            try:
+                map[name] = value_field._serialize_trusted(subvalue, *options)
+            except AttributeError:
+                if isinstance(value_field, Undefined):
+                    raise UndefinedFieldError('the value field of this map is undefined')
+                else:
+                    raise
+
+        return map
+
     @classmethod
     def _visit_field(cls, specification, callback):
         params = {'value': callback(specification['value'])}
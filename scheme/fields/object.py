@@ -7,6 +7,8 @@ __all__ = ('Object',)
 class Object(Field):
     """A field for references to python objects."""
 
+    __slots__ = ()
+
     basetype = 'object'
 
     errors = [
@@ -1,10 +1,22 @@
+from functools import partial
+from hashlib import sha1
+
 from scheme.exceptions import *
 from scheme.field import *
 from scheme.interpolation import interpolate_parameters
-from scheme.util import pluralize, string
+from scheme.util import INDEX_SEGMENT, compile_projection
+from scheme.util import exhausts_error_budget, group_changes, parse_change_index, pluralize
+from scheme.util import preserves_identity, sequence_is_unchanged, string
+
+try:
+    import cPickle as pickle
+except ImportError:
+    import pickle
 
 __all__ = ('Sequence',)
 
+PROCESSORS = {}
+
 class Sequence(Field):
     """A field for variable-length sequences of homogeneous items.
 
@@ -29,8 +41,12 @@ class Sequence(Field):
     :raises TypeError: when a parameter to the constructor is invalid
     """
 
+    __slots__ = ('item', 'max_length', 'min_length', 'unique')
+
+    accepted_types = (list,)
     basetype = 'sequence'
     parameters = {'min_length': None, 'max_length': None, 'unique': False}
+    projectable = True
     structural = True
 
     errors = [
@@ -78,7 +94,7 @@ class Sequence(Field):
         return super(Sequence, self).describe(parameters, verbose,
             item=self.item.describe(parameters, verbose), default=default)
 
-    def extract(self, subject, strict=True, **params):
+    def extract(self, subject, strict=True, projection=None, **params):
         if params and not self.screen(**params):
             raise FieldExcludedError(self)
 
@@ -97,6 +113,9 @@ class Sequence(Field):
         definition = self.item
         extraction = []
 
+        if projection is not None and definition.projectable:
+            params['projection'] = projection
+
         for item in subject:
             try:
                 extraction.append(definition.extract(item, strict, **params))
@@ -122,14 +141,19 @@ class Sequence(Field):
         else:
             raise CannotFilterError(self)
 
-    def instantiate(self, value, key=None):
+    def instantiate(self, value, key=None, projection=None):
         if value is None:
             return None
 
+        item = self.item
         candidate = []
+
         for v in value:
             try:
-                candidate.append(self.item.instantiate(v))
+                if projection is not None and item.projectable:
+                    candidate.append(item.instantiate(v, None, projection))
+                else:
+                    candidate.append(item.instantiate(v))
             except AttributeError:
                 if isinstance(self.item, Undefined):
                     raise UndefinedFieldError('the item field of this sequence is undefined')
@@ -162,9 +186,119 @@ class Sequence(Field):
 
         return interpolation
 
-    def process(self, value, phase=INBOUND, serialized=False, ancestry=None):
-        if not ancestry:
-            ancestry = [self.guaranteed_name]
+    def iter_process(self, iterable, phase=INBOUND, serialized=False, ancestry=None):
+        """Processes the items of ``iterable`` as described by :meth:`process`, but as a
+        generator which yields each processed item as soon as it has been processed, so that
+        sequences of arbitrary length can be validated in constant memory (except when
+        ``unique`` is ``True``, in which case each distinct item is retained).
+
+        Unlike :meth:`process`, ``iterable`` can be any iterable value other than a string or
+        a ``dict``, and an item which fails to process does not abort the iteration; instead,
+        the :exc:`StructuralError` for that item is yielded in its place, as would be present
+        within the ``structure`` of the error raised by :meth:`process`. Likewise, an item which
+        duplicates a previous item when ``unique`` is ``True`` is yielded as a
+        :exc:`ValidationError` with the ``'duplicate'`` token. The ``max_length`` constraint
+        is checked as each item arrives, and the ``min_length`` constraint once ``iterable`` is
+        exhausted; a violation of either raises :exc:`ValidationError`. The ``preprocessor`` of
+        this field, if any, is not applied, since it expects an entire sequence.
+
+        :param iterable: The iterable value to process.
+
+        :param str phase: Optional, default is ``INBOUND``; see :meth:`Field.process`.
+
+        :param boolean serialized: Optional, default is ``False``; see :meth:`Field.process`.
+
+        :param ancestry: Optional, default is ``None``; see :meth:`Field.process`.
+        """
+
+        ancestry = self._construct_ancestry(ancestry)
+        if self._is_null(iterable, ancestry):
+            return
+
+        if isinstance(iterable, (string, dict)):
+            raise InvalidTypeError(identity=ancestry, field=self,
+                value=iterable).construct('invalid')
+
+        try:
+            iterator = iter(iterable)
+        except TypeError:
+            raise InvalidTypeError(identity=ancestry, field=self,
+                value=iterable).construct('invalid')
+
+        item = self._compile_subfield(self.item, phase, serialized, lambda: self.item,
+            'the item field of this sequence is undefined')
+
+        max_length = self.max_length
+        seen = set() if self.unique else None
+
+        count = 0
+        for subvalue in iterator:
+            if max_length is not None and count >= max_length:
+                raise ValidationError(identity=ancestry, field=self).construct('max_length',
+                    max_length=max_length, noun=pluralize('item', max_length))
+
+            identity = (ancestry, INDEX_SEGMENT, count)
+            count += 1
+
+            try:
+                processed = item(subvalue, identity)
+            except StructuralError as exception:
+                yield exception
+                continue
+
+            if seen is not None:
+                if processed in seen:
+                    yield ValidationError(identity=identity, field=self,
+                        value=subvalue).construct('duplicate')
+                    continue
+                seen.add(processed)
+
+            yield processed
+
+        min_length = self.min_length
+        if min_length is not None and count < min_length:
+            raise ValidationError(identity=ancestry, field=self).construct('min_length',
+                min_length=min_length, noun=pluralize('item', min_length))
+
+    def process(self, value, phase=INBOUND, serialized=False, ancestry=None, fail_fast=False,
+            max_errors=None, preserve=False, executor=None, chunk_size=1000, projection=None):
+        """Processes ``value`` as described by :meth:`Field.process`.
+
+        :param boolean fail_fast: Optional, default is ``False``; if ``True``, processing is
+            aborted as soon as the first error is encountered, at any depth; see
+            :meth:`Structure.process`.
+
+        :param int max_errors: Optional, default is ``None``; if specified, processing is aborted
+            as soon as this many errors have been encountered, at any depth.
+
+        :param boolean preserve: Optional, default is ``False``; if ``True``, ``value`` itself is
+            returned instead of a copy when processing it changed nothing, at any depth; see
+            :meth:`Structure.process`.
+
+        :param executor: Optional, default is ``None``; if specified, an executor (such as an
+            instance of ``concurrent.futures.ProcessPoolExecutor``) which is used to process the
+            items of ``value`` in parallel, in chunks of ``chunk_size`` items, or an executor
+            class (such as ``ProcessPoolExecutor`` itself), which is instantiated for this call
+            and shut down afterwards. The item field of this sequence is pickled and compiled
+            only once by each worker, so it must be picklable (along with any preprocessor or
+            other callable it holds); it is sent to each worker once, by the initializer of an
+            executor instantiated from a class (as of python 3.7), or else along with each
+            chunk. Any item which fails to process is then reprocessed locally, in order, so
+            that errors are identical to those produced without an executor, and pending chunks
+            are cancelled as soon as ``fail_fast`` or ``max_errors`` aborts processing. Since
+            each chunk is pickled to and from its worker, parallel processing only pays off when
+            processing an item costs substantially more than pickling it; see
+            ``benchmarks/parallel.py``.
+
+        :param int chunk_size: Optional, default is ``1000``; the number of items submitted to
+            ``executor`` as one unit of work.
+
+        :param projection: Optional, default is ``None``; if specified, the projection which is
+            applied to each item of ``value``; see :meth:`Structure.process`. Items are always
+            processed locally when a projection is specified.
+        """
+
+        ancestry = self._construct_ancestry(ancestry, fail_fast, max_errors, preserve)
 
         if self._is_null(value, ancestry):
             return None
@@ -188,23 +322,39 @@ class Sequence(Field):
         valid = True
         item = self.item
 
-        sequence = []
-        for i, subvalue in enumerate(value):
-            try:
-                sequence.append(item.process(subvalue, phase, serialized, ancestry + ['[%s]' % i]))
-            except StructuralError as exception:
-                valid = False
-                sequence.append(exception)
-            except AttributeError:
-                if isinstance(item, Undefined):
-                    raise UndefinedFieldError('the item field of this sequence is undefined')
-                else:
-                    raise
+        try:
+            process = item.process
+        except AttributeError:
+            if not isinstance(item, Undefined):
+                raise
+            elif value:
+                raise UndefinedFieldError('the item field of this sequence is undefined')
+        else:
+            if projection is not None and item.projectable:
+                process = partial(process, projection=compile_projection(projection))
+
+        if executor is not None and projection is None and value:
+            sequence, valid = self._process_in_parallel(value, phase, serialized, ancestry,
+                executor, chunk_size)
+        else:
+            sequence = []
+            for i, subvalue in enumerate(value):
+                try:
+                    sequence.append(process(subvalue, phase, serialized,
+                        (ancestry, INDEX_SEGMENT, i)))
+                except StructuralError as exception:
+                    valid = False
+                    sequence.append(exception)
+                    if exhausts_error_budget(ancestry, exception):
+                        break
 
         if not valid:
             raise ValidationError(identity=ancestry, field=self, value=value, structure=sequence)
         elif self.unique and len(set(sequence)) != len(sequence):
             raise ValidationError(identity=ancestry, field=self, value=value).construct('duplicate')
+        elif (preserves_identity(ancestry) and not self.preprocessor
+                and sequence_is_unchanged(value, sequence)):
+            return value
         else:
             return sequence
 
@@ -221,9 +371,275 @@ class Sequence(Field):
         else:
             return self.clone(item=candidate)
 
+    def _compile_processor(self, phase, serialized, projection=None):
+        field = self
+        guaranteed_name = self.guaranteed_name
+        nonnull = self.nonnull
+        preprocessor = self.preprocessor
+        min_length = self.min_length
+        max_length = self.max_length
+        unique = self.unique
+
+        item = self._compile_subfield(self.item, phase, serialized, lambda: self.item,
+            'the item field of this sequence is undefined', projection)
+
+        def processor(value, ancestry=None):
+            if not ancestry:
+                ancestry = [guaranteed_name]
+
+            if value is None:
+                if nonnull:
+                    raise ValidationError(identity=ancestry, field=field).construct('nonnull')
+                return None
+
+            if not isinstance(value, list):
+                raise InvalidTypeError(identity=ancestry, field=field,
+                    value=value).construct('invalid')
+
+            if preprocessor is not None:
+                value = preprocessor(value)
+
+            if min_length is not None and len(value) < min_length:
+                raise ValidationError(identity=ancestry, field=field,
+                    value=value).construct('min_length', min_length=min_length,
+                    noun=pluralize('item', min_length))
+
+            if max_length is not None and len(value) > max_length:
+                raise ValidationError(identity=ancestry, field=field,
+                    value=value).construct('max_length', max_length=max_length,
+                    noun=pluralize('item', max_length))
+
+            valid = True
+            sequence = []
+
+            for i, subvalue in enumerate(value):
+                try:
+                    sequence.append(item(subvalue, (ancestry, INDEX_SEGMENT, i)))
+                except StructuralError as exception:
+                    valid = False
+                    sequence.append(exception)
+                    if exhausts_error_budget(ancestry, exception):
+                        break
+
+            if not valid:
+                raise ValidationError(identity=ancestry, field=field, value=value,
+                    structure=sequence)
+            elif unique and len(set(sequence)) != len(sequence):
+                raise ValidationError(identity=ancestry, field=field,
+                    value=value).construct('duplicate')
+            elif (preprocessor is None and preserves_identity(ancestry)
+                    and sequence_is_unchanged(value, sequence)):
+                return value
+            else:
+                return sequence
+        return processor
+
     def _define_undefined_field(self, field):
+        self._discard_descriptions()
         self.item = field
 
+    def _finish_processing(self, value, sequence, valid, ancestry):
+        """Completes the processing of ``value`` for this sequence once ``sequence`` holds its
+        processed items, returning the processed value; used by the coroutines of
+        :mod:`scheme.asynchronous`, since ``process()`` performs these steps inline."""
+
+        if not valid:
+            raise ValidationError(identity=ancestry, field=self, value=value, structure=sequence)
+        elif self.unique and len(set(sequence)) != len(sequence):
+            raise ValidationError(identity=ancestry, field=self, value=value).construct('duplicate')
+        elif (preserves_identity(ancestry) and not self.preprocessor
+                and sequence_is_unchanged(value, sequence)):
+            return value
+        else:
+            return sequence
+
+    def _prepare_processing(self, value, ancestry):
+        """Validates and preprocesses ``value``, a non-null value being processed for this
+        sequence, returning the preprocessed value; used by the coroutines of
+        :mod:`scheme.asynchronous`, since ``process()`` performs these steps inline."""
+
+        if not isinstance(value, list):
+            raise InvalidTypeError(identity=ancestry, field=self, value=value).construct('invalid')
+
+        if self.preprocessor:
+            value = self.preprocessor(value)
+
+        min_length = self.min_length
+        if min_length is not None and len(value) < min_length:
+            raise ValidationError(identity=ancestry, field=self, value=value).construct('min_length',
+                min_length=min_length, noun=pluralize('item', min_length))
+
+        max_length = self.max_length
+        if max_length is not None and len(value) > max_length:
+            raise ValidationError(identity=ancestry, field=self, value=value).construct('max_length',
+                max_length=max_length, noun=pluralize('item', max_length))
+
+        return value
+
+    def _process_chunks(self, value, ancestry, item, key, specification, executor, chunk_size,
+            submitted):
+        """Processes ``value`` in chunks of ``chunk_size`` items with ``executor``, submitting
+        ``submitted`` (either ``specification``, the pickled ``item``, or ``None`` if each worker
+        received it when it was started) with each chunk. The results of each chunk are
+        consumed in order, reprocessing its failed items locally, and any pending chunk is
+        cancelled once the error budget of ``ancestry`` is exhausted."""
+
+        offsets = range(0, len(value), chunk_size)
+        futures = [executor.submit(process_chunk, key, value[offset:offset + chunk_size],
+            submitted) for offset in offsets]
+
+        sequence = []
+        valid = True
+
+        try:
+            for offset, future in zip(offsets, futures):
+                results = future.result()
+                if results is None:
+                    results = executor.submit(process_chunk, key,
+                        value[offset:offset + chunk_size], specification).result()
+
+                processed, failed = results
+                sequence.extend(processed)
+
+                for i in failed:
+                    i += offset
+                    try:
+                        sequence[i] = item.process(value[i], key[1], key[2],
+                            (ancestry, INDEX_SEGMENT, i))
+                    except StructuralError as exception:
+                        valid = False
+                        sequence[i] = exception
+                        if exhausts_error_budget(ancestry, exception):
+                            del sequence[i + 1:]
+                            return sequence, valid
+        finally:
+            for future in futures:
+                future.cancel()
+
+        return sequence, valid
+
+    def _process_in_parallel(self, value, phase, serialized, ancestry, executor, chunk_size):
+        item = self.item
+        if isinstance(item, Undefined):
+            if item.field is None:
+                raise UndefinedFieldError('the item field of this sequence is undefined')
+            item = item.field
+
+        if not (isinstance(chunk_size, int) and chunk_size > 0):
+            raise TypeError("argument 'chunk_size' must be an integer > 0")
+
+        specification = pickle.dumps(item, pickle.HIGHEST_PROTOCOL)
+        key = (sha1(specification).hexdigest(), phase, serialized)
+
+        if not isinstance(executor, type):
+            return self._process_chunks(value, ancestry, item, key, specification, executor,
+                chunk_size, specification)
+
+        try:
+            executor = executor(initializer=prepare_worker, initargs=(key, specification))
+        except TypeError:
+            executor, submitted = executor(), specification
+        else:
+            submitted = None
+
+        with executor:
+            return self._process_chunks(value, ancestry, item, key, specification, executor,
+                chunk_size, submitted)
+
+    def _revalidate(self, previous, changes, serialized, ancestry):
+        groups = group_changes(changes)
+        if not isinstance(previous, list) or self.preprocessor or groups[0][0] is None:
+            return super(Sequence, self)._revalidate(previous, changes, serialized, ancestry)
+
+        item = self.item
+        if isinstance(item, Undefined):
+            raise UndefinedFieldError('the item field of this sequence is undefined')
+
+        sequence = list(previous)
+        errors = {}
+
+        for key, subchanges in groups:
+            index = parse_change_index(key, len(sequence))
+            if index is None:
+                self._raise_invalid_path(previous, (key,) + subchanges[0][0],
+                    (ancestry, INDEX_SEGMENT, key))
+
+            try:
+                sequence[index] = item._revalidate(sequence[index], subchanges, serialized,
+                    (ancestry, INDEX_SEGMENT, index))
+            except StructuralError as exception:
+                errors[index] = exception
+                if exhausts_error_budget(ancestry, exception):
+                    break
+
+        if errors:
+            for index, exception in errors.items():
+                sequence[index] = exception
+            raise ValidationError(identity=ancestry, field=self, value=previous,
+                structure=sequence)
+        elif self.unique and len(set(sequence)) != len(sequence):
+            raise ValidationError(identity=ancestry, field=self,
+                value=previous).construct('duplicate')
+
+        return sequence
+
+    def _serialize_trusted(self, value, projection=None):
+        if value is None:
+            return None
+
+        item = self.item
+        try:
+            if projection is not None and item.projectable:
+                return [item._serialize_trusted(subvalue, projection) for subvalue in value]
+            return [item._serialize_trusted(subvalue) for subvalue in value]
+        except AttributeError:
+            if isinstance(item, Undefined):
+                raise UndefinedFieldError('the item field of this sequence is undefined')
+            else:
+                raise
+
     @classmethod
     def _visit_field(cls, specification, callback):
         return {'item': callback(specification['item'])}
+
+def prepare_worker(key, specification):
+    """Unpickles ``specification``, the item field of a sequence, and retains its compiled
+    processor for the phase and serialization of ``key`` for ``process_chunk()``. This is the
+    initializer of the executors constructed by :meth:`Sequence.process`, so that the field is
+    sent to each worker only once."""
+
+    if len(PROCESSORS) >= 16:
+        PROCESSORS.clear()
+
+    PROCESSORS[key] = pickle.loads(specification).compile(key[1], key[2])
+
+def process_chunk(key, values, specification=None):
+    """Processes ``values``, a chunk of the items of a sequence, against the field identified by
+    ``key``, a ``tuple`` of the fingerprint of the pickled field, the phase and whether
+    ``values`` are serialized, returning a ``tuple`` containing a ``list`` of the processed items
+    (with ``None`` for each item which failed) and a ``list`` of the indexes of the failed items.
+    This is the unit of work submitted by :meth:`Sequence.process` to an executor; the compiled
+    processor for each ``key`` is retained, so that the field is unpickled and compiled only
+    once per worker. If the processor has not been retained and ``specification``, the pickled
+    field, is not specified, ``None`` is returned instead, so that the chunk can be submitted
+    again along with it."""
+
+    try:
+        processor = PROCESSORS[key]
+    except KeyError:
+        if specification is None:
+            return None
+        prepare_worker(key, specification)
+        processor = PROCESSORS[key]
+
+    results = []
+    failed = []
+
+    for i, value in enumerate(values):
+        try:
+            results.append(processor(value))
+        except StructuralError:
+            results.append(None)
+            failed.append(i)
+
+    return results, failed
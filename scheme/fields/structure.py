@@ -1,8 +1,13 @@
+from weakref import ref
+
+import scheme.field
 from scheme.exceptions import *
 from scheme.field import *
 from scheme.fields.enumeration import Enumeration
 from scheme.interpolation import interpolate_parameters
-from scheme.util import getitem, string
+from scheme.util import ATTRIBUTE_SEGMENT, compile_projection
+from scheme.util import exhausts_error_budget, getitem, group_changes, mapping_is_unchanged
+from scheme.util import preserves_identity, string
 
 __all__ = ('Structure',)
 
@@ -49,8 +54,13 @@ class Structure(Field):
         of plain ``dict``.
     """
 
+    __slots__ = ('key_order', 'polymorphic_on', 'strict', 'structure', '_dispatchers',
+        '_generation', '_plans')
+
+    accepted_types = (dict,)
     basetype = 'structure'
     parameters = {'strict': True}
+    projectable = True
     structural = True
 
     errors = [
@@ -89,26 +99,29 @@ class Structure(Field):
                 " a space-delimited string of key names")
 
         super(Structure, self).__init__(**params)
+        self._discard_plans()
         self.key_order = key_order
         self.polymorphic_on = polymorphic_on
         self.strict = strict
-        self.structure = structure
 
         if polymorphic_on:
-            for identity, candidate in self.structure.items():
+            for identity, candidate in structure.items():
                 self._prevalidate_structure(candidate, identity)
                 candidate[polymorphic_on.name] = polymorphic_on.clone(constant=identity)
+            structure = dict((identity, StructureMapping(self, candidate))
+                for identity, candidate in structure.items())
         else:
-            self._prevalidate_structure(self.structure)
+            self._prevalidate_structure(structure)
 
+        self.structure = StructureMapping(self, structure)
         if generate_default and not self.default:
             if self.polymorphic:
                 if generate_default in self.structure:
-                    self.default = self.generate_defaults(generate_default)
+                    self._default = self.generate_defaults(generate_default)
                 else:
                     raise ValueError('generate_default must be a valid polymorphic identity')
             elif generate_default is True:
-                self.default = self.generate_defaults()
+                self._default = self.generate_defaults()
             else:
                 raise ValueError('generate_default must be boolean')
 
@@ -128,9 +141,8 @@ class Structure(Field):
 
         if self.polymorphic_on:
             return True
-
-        for field in self.structure.values():
-            if field.required and field.default is None:
+        for name, field, default, required, ignore_null in self._get_plan()[0]:
+            if required and default is None:
                 return True
         else:
             return False
@@ -141,6 +153,17 @@ class Structure(Field):
 
         return (self.polymorphic_on is not None)
 
+    def clone(self, **params):
+        clone = super(Structure, self).clone(**params)
+        if self.polymorphic_on and clone.polymorphic_on:
+            for identity, candidate in clone.structure.items():
+                lender = dict.get(self.structure, identity)
+                if lender is not None:
+                    candidate.borrow(lender)
+        elif not (self.polymorphic_on or clone.polymorphic_on):
+            clone.structure.borrow(self.structure)
+        return clone
+
     def describe(self, parameters=None, verbose=False):
         default_structure = self.structure
         
@@ -162,7 +185,7 @@ class Structure(Field):
         if self.default:
             default = {}
             for name, value in self.default.items():
-                default[name] = default_structure[name]._serialize_value(value)
+                default[name] = dict.__getitem__(default_structure, name)._serialize_value(value)
 
         return super(Structure, self).describe(parameters, verbose, default=default,
             polymorphic_on=polymorphic_on, structure=structure)
@@ -172,6 +195,8 @@ class Structure(Field):
         in ``structure``."""
 
         extension = self.clone()
+        extension._discard_plans()
+
         for name, field in structure.items():
             if not isinstance(field, Field):
                 raise TypeError("values of argument 'structure' must be Field instances")
@@ -181,7 +206,7 @@ class Structure(Field):
 
         return extension
 
-    def extract(self, subject, strict=True, **params):
+    def extract(self, subject, strict=True, projection=None, **params):
         if params and not self.screen(**params):
             raise FieldExcludedError(self)
 
@@ -204,7 +229,17 @@ class Structure(Field):
         definition = self._get_definition(subject, getter)
         extraction = {}
 
-        for name, field in definition.items():
+        projection = compile_projection(projection)
+        discriminator = self.polymorphic_on and self.polymorphic_on.name
+
+        for name, field in dict.items(definition):
+            subprojection = None
+            if projection is not None:
+                if name in projection:
+                    subprojection = projection[name]
+                elif name != discriminator:
+                    continue
+
             try:
                 value = getter(subject, name)
                 if value is None:
@@ -213,7 +248,10 @@ class Structure(Field):
                 continue
 
             try:
-                extraction[name] = field.extract(value, strict, **params)
+                if subprojection is not None and field.projectable:
+                    extraction[name] = field.extract(value, strict, subprojection, **params)
+                else:
+                    extraction[name] = field.extract(value, strict, **params)
             except FieldExcludedError:
                 pass
             except AttributeError:
@@ -286,18 +324,33 @@ class Structure(Field):
         if not field.name:
             raise ValueError("argument 'field' must have a defined 'name' attribute")
         if overwrite or field.name not in self.structure:
+            self._discard_descriptions()
             self.structure[field.name] = field
+            self._discard_plans()
 
-    def instantiate(self, value, key=None):
+    def instantiate(self, value, key=None, projection=None):
         if value is None:
             return None
 
         definition = self._get_definition(value)
         params = {}
-        
+
+        projection = compile_projection(projection)
+        discriminator = self.polymorphic_on and self.polymorphic_on.name
+
         for k, v in value.items():
+            subprojection = None
+            if projection is not None:
+                if k in projection:
+                    subprojection = projection[k]
+                elif k != discriminator:
+                    continue
+
             try:
-                params[k] = definition[k].instantiate(v, k)
+                if subprojection is not None and definition[k].projectable:
+                    params[k] = definition[k].instantiate(v, k, subprojection)
+                else:
+                    params[k] = definition[k].instantiate(v, k)
             except AttributeError:
                 if isinstance(definition[k], Undefined):
                     raise UndefinedFieldError('the %r field of this structure is undefined' % k)
@@ -319,7 +372,7 @@ class Structure(Field):
         definition = self._get_definition(subject)
         interpolation = {}
 
-        for name, field in definition.items():
+        for name, field in dict.items(definition):
             try:
                 value = subject[name]
             except KeyError:
@@ -347,6 +400,8 @@ class Structure(Field):
             ``structure``. By default, such pairs are ignored.
         """
 
+        self._discard_descriptions()
+        self._discard_plans()
         for name, field in structure.items():
             if not isinstance(field, Field):
                 raise TypeError("values of argument 'structure' must be Field instances")
@@ -356,9 +411,39 @@ class Structure(Field):
                 field = field.clone(name=name)
             self.structure[name] = field
 
-    def process(self, value, phase=INBOUND, serialized=False, ancestry=None, partial=False):
-        if not ancestry:
-            ancestry = [self.guaranteed_name]
+    def process(self, value, phase=INBOUND, serialized=False, ancestry=None, partial=False,
+            fail_fast=False, max_errors=None, preserve=False, projection=None):
+        """Processes ``value`` as described by :meth:`Field.process`.
+
+        :param boolean partial: Optional, default is ``False``; if ``True``, fields defined for
+            this structure which are not present in ``value`` are ignored, instead of being
+            defaulted or reported as missing.
+
+        :param boolean fail_fast: Optional, default is ``False``; if ``True``, processing is
+            aborted as soon as the first error is encountered, at any depth, and a
+            :exc:`ValidationError` containing the errors encountered so far is raised. Equivalent
+            to ``max_errors=1``.
+
+        :param int max_errors: Optional, default is ``None``; if specified, processing is aborted
+            as soon as this many errors have been encountered, at any depth.
+
+        :param boolean preserve: Optional, default is ``False``; if ``True``, ``value`` itself is
+            returned instead of a copy when processing it changed nothing, at any depth; that is,
+            when each nested value was returned as is, no defaults were applied and no keys
+            were dropped. Fields with a preprocessor or ``key_order`` always return a copy.
+
+        :param projection: Optional, default is ``None``; if specified, the subset of the fields
+            of this structure to process, as either a ``str`` of comma-separated paths (such as
+            ``'a,b,c.d'``), a sequence of such paths, or a tree returned by
+            :func:`scheme.util.compile_projection`. Fields which are not projected are skipped
+            entirely, and are neither present in the returned value nor reported as missing;
+            a path which continues past a :class:`Sequence` or :class:`Map` applies to each of
+            its items. The ``polymorphic_on`` field of a polymorphic structure is always
+            processed.
+        """
+
+        ancestry = self._construct_ancestry(ancestry, fail_fast, max_errors, preserve)
+        projection = compile_projection(projection)
 
         if self._is_null(value, ancestry):
             return None
@@ -373,12 +458,7 @@ class Structure(Field):
                 raise InvalidTypeError(identity=ancestry, field=self,
                     value=value).construct('invalid').capture()
 
-        valid = True
-        names = set(value.keys())
-
         identity = None
-        definition = self.structure
-
         polymorphic_on = self.polymorphic_on
         if polymorphic_on:
             identity = value.get(polymorphic_on.name)
@@ -386,74 +466,97 @@ class Structure(Field):
                 raise ValidationError(identity=ancestry, field=self).construct('required',
                     name=polymorphic_on.name)
 
-            identity = polymorphic_on.process(identity, phase, serialized,
-                ancestry + ['.' + polymorphic_on.name])
+            identity = self._dispatch(identity, phase, serialized, ancestry)
 
-            definition = self.structure.get(identity)
-            if not definition:
+            if not self.structure.get(identity):
                 raise ValidationError(identity=ancestry, field=self,
                     value=identity).construct('unrecognized')
 
         if self.key_order:
             structure = OrderedDict()
-            if identity:
-                key_order = self.key_order[identity]
-            else:
-                key_order = self.key_order
         else:
             structure = {}
-            key_order = definition.keys()
 
-        for name in key_order:
-            field = definition[name]
-            if name in names:
-                names.remove(name)
+        valid = True
+        entries, known = self._get_plan(identity)
+
+        for name, field, default, required, ignore_null in entries:
+            subprojection = None
+            if projection is not None:
+                if name in projection:
+                    subprojection = projection[name]
+                elif not (polymorphic_on and name == polymorphic_on.name):
+                    continue
+
+            if name in value:
                 field_value = value[name]
             elif partial:
                 continue
-            elif phase == INBOUND and field.default is not None:
-                field_value = field.default
-            elif field.required:
+            elif phase == INBOUND and default is not None:
+                field_value = default
+            elif required:
                 valid = False
                 structure[name] = ValidationError(identity=ancestry, field=self).construct(
                     'required', name=name)
+                if exhausts_error_budget(ancestry):
+                    raise ValidationError(identity=ancestry, field=self, value=value,
+                        structure=structure)
                 continue
             else:
                 continue
 
+            if ignore_null and field_value is None:
+                continue
+
             try:
-                if not (field.ignore_null and field_value is None):
-                   structure[name] = field.process(field_value, phase, serialized,
-                        ancestry + ['.' + name])
+                if subprojection is not None and field.projectable:
+                    structure[name] = field.process(field_value, phase, serialized,
+                        (ancestry, ATTRIBUTE_SEGMENT, name), projection=subprojection)
                 else:
-                    continue
+                    structure[name] = field.process(field_value, phase, serialized,
+                        (ancestry, ATTRIBUTE_SEGMENT, name))
             except StructuralError as exception:
                 valid = False
                 structure[name] = exception
+                if exhausts_error_budget(ancestry, exception):
+                    raise ValidationError(identity=ancestry, field=self, value=value,
+                        structure=structure)
             except AttributeError:
                 if isinstance(field, Undefined):
                     raise UndefinedFieldError("the %r field of this structure is undefined" % name)
                 else:
                     raise
 
-        if self.strict:
-            for name in names:
+        if self.strict and not known.issuperset(value):
+            for name in value:
+                if name in known:
+                    continue
+
                 valid = False
                 structure[name] = ValidationError(identity=ancestry, field=self).construct(
                     'unknown', name=name)
+                if exhausts_error_budget(ancestry):
+                    break
 
-        if valid:
-            return structure
-        else:
+        if not valid:
             raise ValidationError(identity=ancestry, field=self, value=value, structure=structure)
 
+        if (preserves_identity(ancestry)
+                and not (self.key_order or self.preprocessor)
+                and mapping_is_unchanged(value, structure)):
+            return value
+        else:
+            return structure
+
     def remove(self, *names):
         """Removes the field named ``name`` from the structure of this field.
         """
 
+        self._discard_descriptions()
         for name in names:
             if name in self.structure:
                 del self.structure[name]
+        self._discard_plans()
 
     def replace(self, structure):
         """Constructs and returns a clone of this field with the key/field pairs specified
@@ -468,6 +571,8 @@ class Structure(Field):
             return self
 
         replacement = self.clone()
+        replacement._discard_plans()
+
         for name, field in structure.items():
             if not isinstance(field, Field):
                 raise TypeError(field)
@@ -478,6 +583,45 @@ class Structure(Field):
 
         return replacement
 
+    def revalidate(self, previous, changes, serialized=False, ancestry=None):
+        """Revalidates ``previous``, a value previously returned by processing an inbound value
+        for this field, after applying ``changes`` to it, returning the revalidated value. Only
+        the items touched by ``changes`` are processed again, descending through nested
+        structures, sequences and maps; the results are spliced into a copy of ``previous``,
+        which itself is not modified. When a change affects the value of a field as a whole
+        (such as a change to the ``polymorphic_on`` field of a structure), that field is
+        processed again in its entirety.
+
+        :param dict previous: The previously processed value.
+
+        :param dict changes: The changes to apply, as a ``dict`` mapping paths to new,
+            unprocessed values. A path is either a ``str`` of keys separated by periods, such as
+            ``'items.2.name'``, or a ``tuple`` of keys, such as ``('items', 2, 'name')``.
+
+        :param boolean serialized: Optional, default is ``False``; indicates if the values in
+            ``changes`` are serialized, as for :meth:`Field.process`.
+
+        :param ancestry: Optional, default is ``None``; see :meth:`Field.process`.
+
+        :raises ValidationError: when the changed value is invalid for this field, or when a
+            path in ``changes`` does not identify an existing value within ``previous`` (such
+            as an index beyond the end of a sequence), reported at the first key of that path
+            which cannot be resolved
+        """
+
+        if not changes:
+            return previous
+
+        normalized = []
+        for path, value in changes.items():
+            if isinstance(path, string):
+                path = tuple(path.split('.'))
+            normalized.append((tuple(path), value))
+
+        normalized.sort(key=lambda change: len(change[0]))
+        ancestry = self._construct_ancestry(ancestry)
+        return self._revalidate(previous, normalized, serialized, ancestry)
+
     def transform(self, transformer):
         candidate = transformer(self)
         if isinstance(candidate, Field):
@@ -501,25 +645,224 @@ class Structure(Field):
         else:
             return self
 
+    def _compile_definition(self, phase, serialized, identity=None, partial=False,
+            projection=None):
+        entries, known = self._get_plan(identity)
+
+        discriminator = None
+        if self.polymorphic_on:
+            discriminator = self.polymorphic_on.name
+
+        compiled = []
+        for name, field, default, required, ignore_null in entries:
+            subprojection = None
+            if projection is not None:
+                if name in projection:
+                    subprojection = projection[name]
+                elif name != discriminator:
+                    continue
+
+            if isinstance(field, Undefined):
+                raise UndefinedFieldError('the %r field of this structure is undefined' % name)
+            if partial:
+                default, required = None, False
+            elif phase != INBOUND:
+                default = None
+
+            if subprojection is not None and field.projectable:
+                processor = field.compile(phase, serialized, projection=subprojection)
+            else:
+                processor = field.compile(phase, serialized)
+            compiled.append((name, processor, default, required, ignore_null))
+
+        return tuple(compiled), known
+
+    def _compile_processor(self, phase, serialized, partial=False, projection=None):
+        field = self
+        guaranteed_name = self.guaranteed_name
+        nonnull = self.nonnull
+        preprocessor = self.preprocessor
+        strict = self.strict
+
+        if self.key_order:
+            constructor = OrderedDict
+        else:
+            constructor = dict
+
+        preservable = not (self.key_order or preprocessor)
+
+        plans = {}
+        def compile_plan(identity):
+            plan = plans[identity] = self._compile_definition(phase, serialized, identity,
+                partial, projection)
+            return plan
+
+        polymorphic_on = self.polymorphic_on
+        if polymorphic_on:
+            discriminator = polymorphic_on.name
+            discriminate = polymorphic_on.compile(phase, serialized)
+            dispatcher = self._get_dispatcher(phase, serialized)
+            identities = list(self.structure.keys())
+        else:
+            identities = [None]
+
+        # definitions which still contain undefined fields are compiled on first use instead
+        for identity in identities:
+            try:
+                compile_plan(identity)
+            except UndefinedFieldError:
+                pass
+
+        identities = frozenset(identities)
+        def processor(value, ancestry=None):
+            if not ancestry:
+                ancestry = [guaranteed_name]
+
+            if value is None:
+                if nonnull:
+                    raise ValidationError(identity=ancestry, field=field).construct('nonnull')
+                return None
+
+            if not isinstance(value, dict):
+                raise InvalidTypeError(identity=ancestry, field=field,
+                    value=value).construct('invalid')
+
+            if preprocessor is not None:
+                try:
+                    value = preprocessor(value)
+                except Exception:
+                    raise InvalidTypeError(identity=ancestry, field=field,
+                        value=value).construct('invalid').capture()
+
+            if polymorphic_on:
+                identity = value.get(discriminator)
+                if identity is None:
+                    raise ValidationError(identity=ancestry, field=field).construct('required',
+                        name=discriminator)
+
+                try:
+                    candidate = dispatcher[identity]
+                except (KeyError, TypeError):
+                    candidate = None
+
+                if candidate is not None and type(identity) is candidate[0]:
+                    identity = candidate[1]
+                else:
+                    identity = discriminate(identity,
+                        (ancestry, ATTRIBUTE_SEGMENT, discriminator))
+                if identity not in identities:
+                    raise ValidationError(identity=ancestry, field=field,
+                        value=identity).construct('unrecognized')
+            else:
+                identity = None
+
+            plan = plans.get(identity)
+            if plan is None:
+                plan = compile_plan(identity)
+            entries, known = plan
+
+            valid = True
+            structure = constructor()
+
+            for name, subprocessor, default, required, ignore_null in entries:
+                if name in value:
+                    subvalue = value[name]
+                elif default is not None:
+                    subvalue = default
+                elif required:
+                    valid = False
+                    structure[name] = ValidationError(identity=ancestry,
+                        field=field).construct('required', name=name)
+                    if exhausts_error_budget(ancestry):
+                        raise ValidationError(identity=ancestry, field=field, value=value,
+                            structure=structure)
+                    continue
+                else:
+                    continue
+
+                if ignore_null and subvalue is None:
+                    continue
+
+                try:
+                    structure[name] = subprocessor(subvalue, (ancestry, ATTRIBUTE_SEGMENT, name))
+                except StructuralError as exception:
+                    valid = False
+                    structure[name] = exception
+                    if exhausts_error_budget(ancestry, exception):
+                        raise ValidationError(identity=ancestry, field=field, value=value,
+                            structure=structure)
+
+            if strict:
+                for name in value:
+                    if name not in known:
+                        valid = False
+                        structure[name] = ValidationError(identity=ancestry,
+                            field=field).construct('unknown', name=name)
+                        if exhausts_error_budget(ancestry):
+                            break
+
+            if not valid:
+                raise ValidationError(identity=ancestry, field=field, value=value,
+                    structure=structure)
+
+            if (preservable and preserves_identity(ancestry)
+                    and mapping_is_unchanged(value, structure)):
+                return value
+            else:
+                return structure
+        return processor
+
+    def _copy_parameter(self, parameter):
+        if isinstance(parameter, StructureMapping):
+            return dict((name, self._copy_parameter(field) if isinstance(field, StructureMapping)
+                else field) for name, field in dict.items(parameter))
+        return super(Structure, self)._copy_parameter(parameter)
+
     def _define_undefined_field(self, field, name):
         identity, name = name
+        self._discard_descriptions()
         if self.polymorphic_on:
             self.structure[identity][name] = field.clone(name=name)
         else:
             self.structure[name] = field.clone(name=name)
+        self._discard_plans()
 
     def _describe_structure(self, structure, parameters, verbose):
         description = {}
-        for name, field in structure.items():
+        for name, field in dict.items(structure):
             description[name] = field.describe(parameters, verbose)
 
         return description
 
+    def _discard_plans(self):
+        # the tables are only allocated once needed, since most structures nested within a
+        # schema are never processed on their own
+        self._dispatchers = None
+        self._generation = scheme.field.GENERATION
+        self._plans = None
+
+    def _dispatch(self, identity, phase, serialized, ancestry):
+        """Resolves ``identity``, a candidate discriminator value, to the polymorphic identity
+        it specifies, consulting the dispatch table for ``phase`` and ``serialized`` before
+        falling back to processing it with ``polymorphic_on``."""
+
+        try:
+            candidate = self._get_dispatcher(phase, serialized)[identity]
+        except (KeyError, TypeError):
+            candidate = None
+
+        if candidate is not None and type(identity) is candidate[0]:
+            return candidate[1]
+
+        polymorphic_on = self.polymorphic_on
+        return polymorphic_on.process(identity, phase, serialized,
+            (ancestry, ATTRIBUTE_SEGMENT, polymorphic_on.name))
+
     def _filter_structure(self, structure, exclusive, params):
         filtered = False
         candidates = {}
 
-        for name, field in structure.items():
+        for name, field in dict.items(structure):
             candidate = field.filter(all, **params)
             if candidate:
                 candidates[name] = candidate
@@ -531,9 +874,35 @@ class Structure(Field):
         if filtered:
             return candidates
 
+    def _finish_processing(self, value, structure, valid, known, ancestry):
+        """Completes the processing of ``value`` for this structure once ``structure`` holds the
+        processed values of its fields, returning the processed value; used by the coroutines
+        of :mod:`scheme.asynchronous`, since ``process()`` performs these steps inline."""
+
+        if self.strict and not known.issuperset(value):
+            for name in value:
+                if name in known:
+                    continue
+
+                valid = False
+                structure[name] = ValidationError(identity=ancestry, field=self).construct(
+                    'unknown', name=name)
+                if exhausts_error_budget(ancestry):
+                    break
+
+        if not valid:
+            raise ValidationError(identity=ancestry, field=self, value=value, structure=structure)
+
+        if (preserves_identity(ancestry)
+                and not (self.key_order or self.preprocessor)
+                and mapping_is_unchanged(value, structure)):
+            return value
+        else:
+            return structure
+
     def _generate_default_values(self, structure, sparse=False):
         default = {}
-        for name, field in structure.items():
+        for name, field in dict.items(structure):
             value = field.default
             if value is None:
                 value = field.constant
@@ -549,11 +918,123 @@ class Structure(Field):
         else:
             return self.structure
 
+    def _get_dispatcher(self, phase, serialized):
+        """Returns the dispatch table of this polymorphic structure for ``phase`` and
+        ``serialized``, building and caching it if necessary.
+
+        The table maps each raw discriminator value which is known to be processed into a
+        recognized identity, namely each identity and its serialized form, to a ``tuple``
+        containing the type of that raw value and the resulting identity. Raw values which are
+        not in the table, or which only compare equal to a key of a different type, must be
+        processed normally.
+        """
+
+        if self._generation != scheme.field.GENERATION:
+            self._validate_plans()
+
+        dispatchers = self._dispatchers
+        if dispatchers is None:
+            dispatchers = self._dispatchers = {}
+        elif (phase, serialized) in dispatchers:
+            return dispatchers[phase, serialized]
+
+        polymorphic_on = self.polymorphic_on
+        dispatcher = {}
+
+        for identity in self.structure:
+            candidates = [identity]
+            try:
+                candidates.append(polymorphic_on._serialize_value(identity))
+            except Exception:
+                pass
+
+            for candidate in candidates:
+                try:
+                    resolved = polymorphic_on.process(candidate, phase, serialized)
+                    if self.structure.get(resolved):
+                        dispatcher[candidate] = (type(candidate), resolved)
+                except Exception:
+                    continue
+
+        dispatchers[phase, serialized] = dispatcher
+        return dispatcher
+
+    def _get_plan(self, identity=None):
+        """Returns the processing plan for the structure variant specified by ``identity``, or
+        for this structure if it is not polymorphic, building and caching it if necessary.
+
+        A plan is a ``tuple`` containing an ordered ``tuple`` of ``(name, field, default,
+        required, ignore_null)`` entries and a ``frozenset`` of the known keys. Plans are
+        discarded whenever the structure of this field is modified, either through its methods
+        or in place, and whenever the ``default``, ``required`` or ``ignore_null`` attribute of
+        one of its fields is set (see ``_validate_plans()``).
+        """
+
+        if self._generation != scheme.field.GENERATION:
+            self._validate_plans()
+
+        plans = self._plans
+        if plans is None:
+            plans = self._plans = {}
+        else:
+            try:
+                return plans[identity]
+            except KeyError:
+                pass
+
+        if identity is not None:
+            definition = self.structure[identity]
+            key_order = self.key_order and self.key_order[identity]
+        else:
+            definition = self.structure
+            key_order = self.key_order
+
+        entries = []
+        for name in (key_order or definition.keys()):
+            field = dict.__getitem__(definition, name)
+            entries.append((name, field, getattr(field, 'default', None),
+                getattr(field, 'required', False), getattr(field, 'ignore_null', False)))
+
+        plan = plans[identity] = (tuple(entries), frozenset(definition))
+        return plan
+
     def _get_polymorphic_identity(self, value, getter=getitem):
         polymorphic_on = self.polymorphic_on
         if polymorphic_on:
             return getter(value, polymorphic_on.name)
 
+    def _prepare_processing(self, value, phase, serialized, ancestry):
+        """Validates and preprocesses ``value``, a non-null value being processed for this
+        structure, returning a ``tuple`` containing the preprocessed value and its polymorphic
+        identity, if this structure is polymorphic; used by the coroutines of
+        :mod:`scheme.asynchronous`, since ``process()`` performs these steps inline."""
+
+        if not isinstance(value, dict):
+            raise InvalidTypeError(identity=ancestry, field=self, value=value).construct('invalid')
+
+        if self.preprocessor:
+            try:
+                value = self.preprocessor(value)
+            except Exception:
+                raise InvalidTypeError(identity=ancestry, field=self,
+                    value=value).construct('invalid').capture()
+
+        identity = None
+        polymorphic_on = self.polymorphic_on
+        if polymorphic_on:
+            identity = value.get(polymorphic_on.name)
+            if identity is None:
+                raise ValidationError(identity=ancestry, field=self).construct('required',
+                    name=polymorphic_on.name)
+
+            identity = self._dispatch(identity, phase, serialized, ancestry)
+
+            if not self.structure.get(identity):
+                raise ValidationError(identity=ancestry, field=self,
+                    value=identity).construct('unrecognized')
+
+        return value, identity
+
     def _prevalidate_structure(self, structure, identity=None):
         if not isinstance(structure, dict):
             raise TypeError("argument 'structure' must be a dict instance")
@@ -572,6 +1053,162 @@ class Structure(Field):
             if not field.name:
                 field.name = name
 
+    def _revalidate(self, previous, changes, serialized, ancestry):
+        groups = group_changes(changes)
+        polymorphic_on = self.polymorphic_on
+
+        if (not isinstance(previous, dict) or self.preprocessor or self.key_order
+                or (polymorphic_on and polymorphic_on.name in dict(groups))
+                or groups[0][0] is None):
+            return super(Structure, self)._revalidate(previous, changes, serialized, ancestry)
+
+        identity = None
+        if polymorphic_on:
+            identity = previous[polymorphic_on.name]
+
+        entries, known = self._get_plan(identity)
+        fields = dict((entry[0], entry) for entry in entries)
+
+        structure = dict(previous)
+        errors = {}
+
+        for name, subchanges in groups:
+            if name not in known:
+                if self.strict:
+                    errors[name] = ValidationError(identity=ancestry, field=self).construct(
+                        'unknown', name=name)
+                    if exhausts_error_budget(ancestry):
+                        break
+                continue
+
+            name, field, default, required, ignore_null = fields[name]
+            if isinstance(field, Undefined):
+                raise UndefinedFieldError("the %r field of this structure is undefined" % name)
+
+            if ignore_null and subchanges[-1] == ((), None):
+                structure.pop(name, None)
+                continue
+
+            try:
+                structure[name] = field._revalidate(structure.get(name), subchanges, serialized,
+                    (ancestry, ATTRIBUTE_SEGMENT, name))
+            except StructuralError as exception:
+                errors[name] = exception
+                if exhausts_error_budget(ancestry, exception):
+                    break
+
+        if errors:
+            structure.update(errors)
+            raise ValidationError(identity=ancestry, field=self, value=previous,
+                structure=structure)
+
+        return structure
+
+    def _select_values(self, value, phase, entries, partial, projection, ancestry, structure):
+        """Yields a ``(name, field, subvalue, subprojection)`` tuple for each entry of ``entries``,
+        the processing plan for ``value``, which is to be processed, applying defaults, ``partial``
+        and ``projection``; used by the coroutines of :mod:`scheme.asynchronous`, since
+        ``process()`` performs these steps inline. The error for each missing required field is stored in
+        ``structure`` and yielded with a ``field`` of ``None``."""
+
+        discriminator = None
+        if self.polymorphic_on:
+            discriminator = self.polymorphic_on.name
+
+        for name, field, default, required, ignore_null in entries:
+            subprojection = None
+            if projection is not None:
+                if name in projection:
+                    subprojection = projection[name]
+                elif name != discriminator:
+                    continue
+
+            if name in value:
+                subvalue = value[name]
+            elif partial:
+                continue
+            elif phase == INBOUND and default is not None:
+                subvalue = default
+            elif required:
+                structure[name] = ValidationError(identity=ancestry, field=self).construct(
+                    'required', name=name)
+                if exhausts_error_budget(ancestry):
+                    raise ValidationError(identity=ancestry, field=self, value=value,
+                        structure=structure)
+                yield name, None, None, None
+                continue
+            else:
+                continue
+
+            if ignore_null and subvalue is None:
+                continue
+
+            yield name, field, subvalue, subprojection
+
+    def _serialize_trusted(self, value, projection=None):
+        if value is None:
+            return None
+
+        if self.key_order:
+            structure = OrderedDict()
+        else:
+            structure = {}
+
+        identity = discriminator = None
+        if self.polymorphic_on:
+            discriminator = self.polymorphic_on.name
+            identity = value[discriminator]
+
+        for name, field, default, required, ignore_null in self._get_plan(identity)[0]:
+            if name not in value:
+                continue
+
+            subprojection = None
+            if projection is not None:
+                if name in projection:
+                    subprojection = projection[name]
+                elif name != discriminator:
+                    continue
+
+            subvalue = value[name]
+            if ignore_null and subvalue is None:
+                continue
+
+            try:
+                if subprojection is not None and field.projectable:
+                    structure[name] = field._serialize_trusted(subvalue, subprojection)
+                else:
+                    structure[name] = field._serialize_trusted(subvalue)
+            except AttributeError:
+                if isinstance(field, Undefined):
+                    raise UndefinedFieldError("the %r field of this structure is undefined" % name)
+                else:
+                    raise
+
+        return structure
+
+    def _validate_plans(self):
+        """Discards the processing plans and dispatch tables cached by this field if any field
+        they were built from has been modified since they were cached, as indicated by its
+        revision, and otherwise marks them as valid for the current generation; the fields of
+        unrelated structures being modified doesn't invalidate them."""
+
+        generation = self._generation
+        polymorphic_on = self.polymorphic_on
+        if polymorphic_on is not None:
+            if polymorphic_on._revision > generation:
+                return self._discard_plans()
+            definitions = dict.values(self.structure)
+        else:
+            definitions = (self.structure,)
+
+        for definition in definitions:
+            for field in dict.values(definition):
+                if getattr(field, '_revision', 0) > generation:
+                    return self._discard_plans()
+
+        self._generation = scheme.field.GENERATION
+
     @classmethod
     def _visit_field(cls, specification, callback):
         def visit(structure):
@@ -582,3 +1219,163 @@ class Structure(Field):
                 in specification['structure'].items())}
         else:
             return {'structure': visit(specification['structure'])}
+
+class StructureMapping(dict):
+    """The ``structure`` of a :class:`Structure`, or of one variant of a polymorphic structure,
+    which discards the processing plans and cached descriptions of the structure ``owner``
+    whenever it is modified in place.
+
+    When a structure is cloned, the fields within its structure are lent to the structure of
+    the clone rather than copied. Whenever either mapping exposes a field it still shares,
+    whether by key or by exposing all of its values, the borrowing mapping replaces that field
+    with a clone of it, so that modifying a nested field through one structure never affects
+    the other. Processing, description and the other methods of a structure read the shared
+    fields directly, without exposing them, and so never clone them."""
+
+    __slots__ = ('borrowed', 'lent', 'owner', '__weakref__')
+
+    def __init__(self, owner, structure, borrowed=None):
+        super(StructureMapping, self).__init__(structure)
+        self.borrowed = borrowed
+        self.lent = None
+        self.owner = owner
+
+    def __delitem__(self, key):
+        self._discard()
+        self._forget(key)
+        super(StructureMapping, self).__delitem__(key)
+
+    def __getitem__(self, key):
+        if self.borrowed or self.lent:
+            self._release(key)
+        return super(StructureMapping, self).__getitem__(key)
+
+    def __reduce__(self):
+        # the links between lending and borrowing mappings are not pickled, so each field
+        # which is still borrowed is pickled as a clone of it instead
+        structure = dict(dict.items(self))
+        if self.borrowed:
+            for name in self.borrowed:
+                structure[name] = structure[name].clone()
+        return (StructureMapping, (self.owner, structure))
+
+    def __setitem__(self, key, value):
+        self._discard()
+        self._forget(key)
+        super(StructureMapping, self).__setitem__(key, value)
+
+    def borrow(self, lender):
+        """Marks the fields of this mapping which are also present in ``lender`` as borrowed
+        from it."""
+
+        borrowed = set(name for name, field in dict.items(self)
+            if isinstance(field, Field) and dict.get(lender, name) is field)
+        if borrowed:
+            self.borrowed = borrowed
+            lender.lent = [reference for reference in (lender.lent or []) if reference()]
+            lender.lent.append(ref(self))
+
+    def clear(self):
+        self._discard()
+        self.borrowed = None
+        super(StructureMapping, self).clear()
+
+    def copy(self):
+        if self.borrowed or self.lent:
+            self.release()
+        return super(StructureMapping, self).copy()
+
+    def get(self, key, default=None):
+        if self.borrowed or self.lent:
+            self._release(key)
+        return super(StructureMapping, self).get(key, default)
+
+    def items(self):
+        if self.borrowed or self.lent:
+            self.release()
+        return super(StructureMapping, self).items()
+
+    def pop(self, key, *args):
+        if self.borrowed or self.lent:
+            self._release(key)
+        self._discard()
+        self._forget(key)
+        return super(StructureMapping, self).pop(key, *args)
+
+    def popitem(self):
+        if self.borrowed or self.lent:
+            self.release()
+        self._discard()
+        return super(StructureMapping, self).popitem()
+
+    def release(self):
+        """Ensures that no field of this mapping is shared with another mapping; see
+        ``_release()``."""
+
+        for key in list(dict.keys(self)):
+            if not (self.borrowed or self.lent):
+                break
+            self._release(key)
+
+    def setdefault(self, key, default=None):
+        if self.borrowed or self.lent:
+            self._release(key)
+        self._discard()
+        return super(StructureMapping, self).setdefault(key, default)
+
+    def update(self, *args, **params):
+        structure = dict(*args, **params)
+        self._discard()
+        for key in structure:
+            self._forget(key)
+        super(StructureMapping, self).update(structure)
+
+    def values(self):
+        if self.borrowed or self.lent:
+            self.release()
+        return super(StructureMapping, self).values()
+
+    if hasattr(dict, 'iteritems'):
+        def iteritems(self):
+            if self.borrowed or self.lent:
+                self.release()
+            return super(StructureMapping, self).iteritems()
+
+        def itervalues(self):
+            if self.borrowed or self.lent:
+                self.release()
+            return super(StructureMapping, self).itervalues()
+
+    def _discard(self):
+        self.owner._discard_descriptions()
+        self.owner._discard_plans()
+
+    def _forget(self, key):
+        if self.borrowed:
+            self.borrowed.discard(key)
+
+    def _release(self, key):
+        """Ensures that the field at ``key`` is not shared with another mapping, having each
+        mapping which borrowed it from this one, directly or through another borrower, replace
+        it with a clone of it, then doing the same if this mapping borrowed it."""
+
+        field = dict.get(self, key)
+        if self.lent:
+            lent = []
+            for reference in self.lent:
+                borrower = reference()
+                if borrower is None:
+                    continue
+                if field is not None and dict.get(borrower, key) is field:
+                    borrower._release(key)
+                if borrower.borrowed:
+                    lent.append(reference)
+            self.lent = lent or None
+
+        borrowed = self.borrowed
+        if borrowed and key in borrowed:
+            borrowed.discard(key)
+            if not borrowed:
+                self.borrowed = None
+            self._discard()
+            super(StructureMapping, self).__setitem__(key, field.clone())
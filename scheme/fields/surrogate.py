@@ -9,6 +9,8 @@ __all__ = ('Surrogate',)
 class Surrogate(Field):
     """A field for surrogates."""
 
+    __slots__ = ('valid_surrogates',)
+
     basetype = 'structure'
     equivalent = surrogate
     parameters = {'valid_surrogates': None}
@@ -10,9 +10,11 @@ __all__ = ('Text',)
 class Text(Field):
     """A field for text values."""
 
+    __slots__ = ('max_length', 'min_length', 'pattern', 'strip')
+
+    accepted_types = (string,)
     basetype = 'text'
     parameters = {'max_length': None, 'min_length': None, 'strip': True}
-    pattern = None
 
     errors = [
         FieldError('invalid', 'invalid value', '%(field)s must be a textual value'),
@@ -11,6 +11,8 @@ __all__ = ('Time',)
 class Time(Field):
     """A field for time values."""
 
+    __slots__ = ('maximum', 'minimum')
+
     basetype = 'time'
     equivalent = time
     parameters = {'maximum': None, 'minimum': None}
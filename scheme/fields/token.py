@@ -10,6 +10,8 @@ __all__ = ('Token',)
 class Token(Field):
     """A field for token values."""
 
+    __slots__ = ('segments',)
+
     basetype = 'token'
     pattern = re.compile(r'^\w[-+.\w]*(?<=\w)(?::\w[-+.\w]*(?<=\w))*$')
 
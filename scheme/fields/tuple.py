@@ -1,7 +1,8 @@
 from scheme.exceptions import *
 from scheme.field import *
 from scheme.interpolation import interpolate_parameters
-from scheme.util import string
+from scheme.util import INDEX_SEGMENT, exhausts_error_budget, string
+from scheme.util import preserves_identity, sequence_is_unchanged
 
 __all__ = ('Tuple',)
 
@@ -17,6 +18,9 @@ class Tuple(Field):
     :raises TypeError: when a constructor parameter is invalid
     """
 
+    __slots__ = ('values',)
+
+    accepted_types = (list, tuple)
     basetype = 'tuple'
     structural = True
 
@@ -160,9 +164,23 @@ class Tuple(Field):
 
         return tuple(interpolation)
 
-    def process(self, value, phase=INBOUND, serialized=False, ancestry=None):
-        if not ancestry:
-            ancestry = [self.guaranteed_name]
+    def process(self, value, phase=INBOUND, serialized=False, ancestry=None, fail_fast=False,
+            max_errors=None, preserve=False):
+        """Processes ``value`` as described by :meth:`Field.process`.
+
+        :param boolean fail_fast: Optional, default is ``False``; if ``True``, processing is
+            aborted as soon as the first error is encountered, at any depth; see
+            :meth:`Structure.process`.
+
+        :param int max_errors: Optional, default is ``None``; if specified, processing is aborted
+            as soon as this many errors have been encountered, at any depth.
+
+        :param boolean preserve: Optional, default is ``False``; if ``True``, ``value`` itself is
+            returned instead of a copy when processing it changed nothing, at any depth; see
+            :meth:`Structure.process`.
+        """
+
+        ancestry = self._construct_ancestry(ancestry, fail_fast, max_errors, preserve)
 
         if self._is_null(value, ancestry):
             return None
@@ -182,21 +200,28 @@ class Tuple(Field):
         for i, field in enumerate(values):
             try:
                 sequence.append(field.process(value[i], phase, serialized,
-                    ancestry + ['[%s]' % i]))
+                    (ancestry, INDEX_SEGMENT, i)))
             except StructuralError as exception:
                 valid = False
                 sequence.append(exception)
+                if exhausts_error_budget(ancestry, exception):
+                    break
             except AttributeError:
                 if isinstance(field, Undefined):
                     raise UndefinedFieldError("field %r of this tuple is undefined" % i)
                 else:
                     raise
 
-        if valid:
-            return tuple(sequence)
-        else:
+        if not valid:
             raise ValidationError(identity=ancestry, field=self, value=value, structure=sequence)
 
+        if (isinstance(value, tuple) and preserves_identity(ancestry)
+                and not self.preprocessor
+                and sequence_is_unchanged(value, sequence)):
+            return value
+        else:
+            return tuple(sequence)
+
     def transform(self, transformer):
         candidate = transformer(self)
         if isinstance(candidate, Field):
@@ -220,9 +245,86 @@ class Tuple(Field):
         else:
             return self
 
+    def _compile_processor(self, phase, serialized):
+        field = self
+        guaranteed_name = self.guaranteed_name
+        nonnull = self.nonnull
+        preprocessor = self.preprocessor
+
+        def resolver(i):
+            return lambda: self.values[i]
+
+        values = []
+        for i, subfield in enumerate(self.values):
+            values.append(self._compile_subfield(subfield, phase, serialized, resolver(i),
+                'field %r of this tuple is undefined' % i))
+
+        values = tuple(enumerate(values))
+        length = len(values)
+
+        def processor(value, ancestry=None):
+            if not ancestry:
+                ancestry = [guaranteed_name]
+
+            if value is None:
+                if nonnull:
+                    raise ValidationError(identity=ancestry, field=field).construct('nonnull')
+                return None
+
+            if not isinstance(value, (list, tuple)):
+                raise InvalidTypeError(identity=ancestry, field=field,
+                    value=value).construct('invalid')
+            if preprocessor is not None:
+                value = preprocessor(value)
+
+            if len(value) != length:
+                raise ValidationError(identity=ancestry, field=field, value=value).construct(
+                    'length', length=length)
+
+            valid = True
+            sequence = []
+
+            for i, subprocessor in values:
+                try:
+                    sequence.append(subprocessor(value[i], (ancestry, INDEX_SEGMENT, i)))
+                except StructuralError as exception:
+                    valid = False
+                    sequence.append(exception)
+                    if exhausts_error_budget(ancestry, exception):
+                        break
+
+            if not valid:
+                raise ValidationError(identity=ancestry, field=field, value=value,
+                    structure=sequence)
+
+            if (preprocessor is None and isinstance(value, tuple)
+                    and preserves_identity(ancestry)
+                    and sequence_is_unchanged(value, sequence)):
+                return value
+            else:
+                return tuple(sequence)
+        return processor
+
     def _define_undefined_field(self, field, idx):
+        self._discard_descriptions()
         self.values = tuple(list(self.values[:idx]) + [field] + list(self.values[idx + 1:]))
 
+    def _serialize_trusted(self, value):
+        if value is None:
+            return None
+
+        sequence = []
+        for i, field in enumerate(self.values):
+            try:
+                sequence.append(field._serialize_trusted(value[i]))
+            except AttributeError:
+                if isinstance(field, Undefined):
+                    raise UndefinedFieldError("field %r of this tuple is undefined" % i)
+                else:
+                    raise
+
+        return tuple(sequence)
+
     @classmethod
     def _visit_field(cls, specification, callback):
         return {'values': tuple([callback(field) for field in specification['values']])}
@@ -15,9 +15,15 @@ class Union(Field):
     base types, such as a string and an integer. In most cases specifying a proper priority order
     will resolve more ambigious cases.
 
+    Only those fields which can possibly accept a value of a given type are attempted, as
+    determined by the ``accepted_types`` of each field (see :class:`Field`); fields for which
+    this cannot be determined are always attempted.
+
     :param *fields: All positional arguments.
     """
 
+    __slots__ = ('fields', '_indexes')
+
     basetype = 'union'
     structural = True
 
@@ -40,6 +46,7 @@ class Union(Field):
                 raise TypeError("fields must be Field instances")
 
         self.fields = tuple(stack)
+        self._indexes = {}
 
     def __repr__(self):
         return super(Union, self).__repr__(['fields=%r' % (self.fields,)])
@@ -101,7 +108,7 @@ class Union(Field):
         if self._is_null(value, ancestry):
             return None
 
-        for field in self.fields:
+        for field in self._get_candidates(type(value), phase, serialized):
             try:
                 return field.process(value, phase, serialized, ancestry)
             except InvalidTypeError:
@@ -137,8 +144,95 @@ class Union(Field):
         else:
             return self
 
+    def _compile_processor(self, phase, serialized):
+        field = self
+        guaranteed_name = self.guaranteed_name
+        nonnull = self.nonnull
+
+        def resolver(i):
+            return lambda: self.fields[i]
+
+        fields = []
+        for i, subfield in enumerate(self.fields):
+            fields.append((self._compile_subfield(subfield, phase, serialized, resolver(i),
+                'a field of this union is undefined'), self._get_member_types(subfield, phase,
+                serialized)))
+
+        index = {}
+        def get_candidates(value_type):
+            candidates = index[value_type] = tuple([subprocessor for subprocessor, accepted_types
+                in fields if accepted_types is None or issubclass(value_type, accepted_types)])
+            return candidates
+
+        def processor(value, ancestry=None):
+            if not ancestry:
+                ancestry = [guaranteed_name]
+
+            if value is None:
+                if nonnull:
+                    raise ValidationError(identity=ancestry, field=field).construct('nonnull')
+                return None
+
+            candidates = index.get(type(value))
+            if candidates is None:
+                candidates = get_candidates(type(value))
+
+            for subprocessor in candidates:
+                try:
+                    return subprocessor(value, ancestry)
+                except InvalidTypeError:
+                    pass
+            else:
+                raise InvalidTypeError(identity=ancestry, field=field,
+                    value=value).construct('invalid')
+        return processor
+
     def _define_undefined_field(self, field, idx):
+        self._discard_descriptions()
         self.fields = tuple(list(self.fields[:idx]) + [field] + list(self.fields[idx + 1:]))
+        self._indexes = {}
+
+    def _get_candidates(self, value_type, phase, serialized):
+        """Returns the fields of this union which can possibly accept a value of ``value_type``
+        for ``phase`` and ``serialized``, in priority order."""
+
+        try:
+            index = self._indexes[phase, serialized]
+        except KeyError:
+            index = self._indexes[phase, serialized] = {}
+
+        try:
+            return index[value_type]
+        except KeyError:
+            pass
+
+        candidates = []
+        for field in self.fields:
+            accepted_types = self._get_member_types(field, phase, serialized)
+            if accepted_types is None or issubclass(value_type, accepted_types):
+                candidates.append(field)
+
+        candidates = index[value_type] = tuple(candidates)
+        return candidates
+
+    def _get_member_types(self, field, phase, serialized):
+        if isinstance(field, Undefined):
+            return None
+        return field._get_accepted_types(phase, serialized)
+
+    def _serialize_trusted(self, value):
+        """Serializes ``value`` with the only field of this union which can accept it, if that
+        can be determined from its type alone; otherwise, ``value`` is processed as usual to
+        determine which field it is valid for."""
+
+        if value is None:
+            return None
+
+        candidates = self._get_candidates(type(value), OUTBOUND, True)
+        if len(candidates) == 1 and not isinstance(candidates[0], Undefined):
+            return candidates[0]._serialize_trusted(value)
+
+        return self.process(value, OUTBOUND, True)
 
     @classmethod
     def _visit_field(cls, specification, callback):
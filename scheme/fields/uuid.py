@@ -10,6 +10,8 @@ __all__ = ('UUID',)
 class UUID(Field):
     """A field for UUID values."""
 
+    __slots__ = ()
+
     basetype = 'text'
     pattern = re.compile(r'^[a-f0-9]{8}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{12}$')
 
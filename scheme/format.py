@@ -1,9 +1,60 @@
 import os
+from importlib import import_module
 
 from scheme.util import with_metaclass
 
 __all__ = ('Format',)
 
+# the module implementing each standard format, for each of the keys the format is registered
+# under once its module is imported
+STANDARD_FORMATS = {
+    'csv': 'scheme.formats.csv',
+    '.csv': 'scheme.formats.csv',
+    'application/csv': 'scheme.formats.csv',
+    'json': 'scheme.formats.json',
+    '.json': 'scheme.formats.json',
+    'application/json': 'scheme.formats.json',
+    'structuredtext': 'scheme.formats.structuredtext',
+    'text/plain': 'scheme.formats.structuredtext',
+    'urlencoded': 'scheme.formats.urlencoded',
+    'application/x-www-form-urlencoded': 'scheme.formats.urlencoded',
+    'xml': 'scheme.formats.xml',
+    '.xml': 'scheme.formats.xml',
+    'application/xml': 'scheme.formats.xml',
+    'yaml': 'scheme.formats.yaml',
+    '.yaml': 'scheme.formats.yaml',
+    '.yml': 'scheme.formats.yaml',
+    'application/x-yaml': 'scheme.formats.yaml',
+}
+
+class FormatRegistry(dict):
+    """The registry of formats, keyed by name, extension, mimetype and class. The standard
+    formats are only imported (and registered) when first looked up, so that their modules,
+    and the modules those depend upon, are never imported by processes which don't use them.
+    Iterating over this registry only produces the formats imported so far."""
+
+    def __contains__(self, key):
+        return dict.__contains__(self, key) or self._import_format(key)
+
+    def __missing__(self, key):
+        if self._import_format(key):
+            return dict.__getitem__(self, key)
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        if key in self:
+            return dict.__getitem__(self, key)
+        return default
+
+    def _import_format(self, key):
+        try:
+            module = STANDARD_FORMATS[key]
+        except (KeyError, TypeError):
+            return False
+
+        import_module(module)
+        return dict.__contains__(self, key)
+
 class FormatMeta(type):
     def __new__(metatype, name, bases, namespace):
         format = type.__new__(metatype, name, bases, namespace)
@@ -26,7 +77,7 @@ class FormatMeta(type):
 class Format(object):
     """A data format."""
 
-    formats = {}
+    formats = FormatRegistry()
 
     extensions = None
     mimetype = None
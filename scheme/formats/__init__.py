@@ -1,8 +1,32 @@
-from .csv import Csv
-from .json import Json
-from .structuredtext import StructuredText
-from .urlencoded import UrlEncoded
-from .xml import Xml
-from .yaml import Yaml
+import sys
+from importlib import import_module
 
 __all__ = ('Csv', 'Json', 'StructuredText', 'UrlEncoded', 'Xml', 'Yaml')
+
+MODULES = {
+    'Csv': 'scheme.formats.csv',
+    'Json': 'scheme.formats.json',
+    'StructuredText': 'scheme.formats.structuredtext',
+    'UrlEncoded': 'scheme.formats.urlencoded',
+    'Xml': 'scheme.formats.xml',
+    'Yaml': 'scheme.formats.yaml',
+}
+
+# on python 3.7 and later, each format is only imported when first accessed, either here or
+# through Format.formats; earlier versions don't support module __getattr__
+if sys.version_info >= (3, 7):
+    def __getattr__(name):
+        try:
+            module = MODULES[name]
+        except KeyError:
+            raise AttributeError('module %r has no attribute %r' % (__name__, name))
+
+        format = globals()[name] = getattr(import_module(module), name)
+        return format
+else:
+    from .csv import Csv
+    from .json import Json
+    from .structuredtext import StructuredText
+    from .urlencoded import UrlEncoded
+    from .xml import Xml
+    from .yaml import Yaml
@@ -1,11 +1,6 @@
 from datetime import date
 import re
 
-try:
-    import jinja2
-except ImportError:
-    jinja2 = None
-
 from scheme.exceptions import *
 from scheme.timezone import current_timestamp
 from scheme.util import string
@@ -14,6 +9,9 @@ __all__ = ('Interpolator', 'interpolate_parameters')
 
 VARIABLE_EXPR = re.compile(r'^\s*[$][{]([^}]+)[}]\s*$')
 
+# jinja2 is only imported when the first interpolator is constructed
+jinja2 = None
+
 class Interpolator(object):
     """The standard jinja-based interpolator."""
 
@@ -22,6 +20,10 @@ class Interpolator(object):
     standard_globals = []
 
     def __init__(self, filters=None, globals=None):
+        global jinja2
+        if jinja2 is None:
+            import jinja2
+
         self.environment = jinja2.Environment(
             variable_start_string='${',
             variable_end_string='}')
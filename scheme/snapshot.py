@@ -0,0 +1,75 @@
+"""Snapshots of constructed schemas, which can be restored considerably faster than the schemas
+can be constructed again.
+
+A process which constructs many schemas at startup, or which reconstructs a large catalog of
+schemas from their descriptions, can instead save them to a snapshot once, then restore them
+from that snapshot on subsequent startups. Restoring a schema does not invoke the constructors
+of its fields, so none of the validation of field parameters performed by those constructors is
+repeated. Any processing plans a structure has already built are retained, but compiled
+processors are not, as they cannot be serialized; they are compiled again as needed.
+
+Snapshots are serialized with :mod:`pickle`, and so must only be restored from trusted
+sources. A snapshot can only be restored by the version of scheme which saved it. This module is
+not imported by :mod:`scheme` itself.
+"""
+
+import os
+
+try:
+    import cPickle as pickle
+except ImportError:
+    import pickle
+
+import scheme
+
+__all__ = ('dumps', 'load', 'loads', 'save')
+
+SNAPSHOT_HEADER = b'scheme-snapshot '
+
+def dumps(schemas):
+    """Returns a snapshot of ``schemas`` as a byte string.
+
+    :param schemas: The schemas to snapshot, typically a ``dict`` mapping names to
+        :class:`Field` instances, though any picklable value containing fields is accepted.
+    """
+
+    version = scheme.__version__.encode('ascii')
+    return SNAPSHOT_HEADER + version + b'\n' + pickle.dumps(schemas, pickle.HIGHEST_PROTOCOL)
+
+def load(path):
+    """Restores the schemas in the snapshot stored at ``path``; see :func:`loads`."""
+
+    with open(path, 'rb') as openfile:
+        return loads(openfile.read())
+
+def loads(snapshot):
+    """Restores the schemas in ``snapshot``, a byte string returned by :func:`dumps`. Raises
+    ``ValueError`` if ``snapshot`` is not a snapshot, or was saved by a different version of
+    scheme."""
+
+    header, separator, content = snapshot.partition(b'\n')
+    if not (separator and header.startswith(SNAPSHOT_HEADER)):
+        raise ValueError("argument 'snapshot' is not a valid snapshot")
+
+    version = header[len(SNAPSHOT_HEADER):].decode('ascii')
+    if version != scheme.__version__:
+        raise ValueError("argument 'snapshot' was saved by version %s of scheme" % version)
+
+    return pickle.loads(content)
+
+def save(path, schemas):
+    """Saves a snapshot of ``schemas`` to ``path``; see :func:`dumps`. The snapshot is written
+    to a temporary file which then replaces ``path``, so that a process restoring the snapshot
+    concurrently never observes a partially written snapshot."""
+
+    snapshot = dumps(schemas)
+    temporary = '%s.%d.tmp' % (path, os.getpid())
+
+    with open(temporary, 'wb') as openfile:
+        openfile.write(snapshot)
+
+    try:
+        os.rename(temporary, path)
+    except OSError:
+        os.remove(path)
+        os.rename(temporary, path)
@@ -23,10 +23,16 @@ class surrogate(dict):
         dynamic schema for this surrogate instance.
 
     :param integer version: Optional, default is ``None``; the schema version of this surrogate.
+
+    By default, a distinct schema is reconstructed for each surrogate carrying a dynamic schema.
+    If ``interner`` is set to a :class:`FieldInterner` (typically a bounded one), dynamic schemas
+    are instead reconstructed with it, so that surrogates carrying identical schemas share a
+    single reconstructed schema; such schemas must then be treated as immutable.
     """
 
     __metaclass__ = SurrogateMeta
     cache = {}
+    interner = None
     schemas = None
 
     def __init__(self, value, schema=None, version=None):
@@ -159,7 +165,11 @@ class surrogate(dict):
 
     @classmethod
     def _interpolate_dynamic_surrogate(cls, value, parameters, interpolator):
-        schema = scheme.Field.reconstruct(deepcopy(value.pop('__schema__')))
+        schema = value.pop('__schema__')
+        if cls.interner is None:
+            schema = deepcopy(schema)
+
+        schema = scheme.Field.reconstruct(schema, cls.interner)
         if not schema:
             raise ValueError(value)
 
@@ -188,7 +198,7 @@ class surrogate(dict):
         if not schema:
             raise ValueError(value)
 
-        schema = scheme.Field.reconstruct(schema)
+        schema = scheme.Field.reconstruct(schema, cls.interner)
         if not schema:
             raise ValueError(value)
 
@@ -1,8 +1,14 @@
 import re
 import sys
+from hashlib import sha1
 from inspect import getmodule
 from types import ModuleType
 
+try:
+    from collections import OrderedDict
+except ImportError:
+    OrderedDict = dict
+
 try:
     integers = (int, long)
 except NameError:
@@ -20,6 +26,332 @@ except NameError:
 
 NODEFAULT = object()
 
+class AncestrySegment(object):
+    """A segment template for lazily materialized ancestries.
+
+    Structural fields identify the location of each child value they process with a lazy
+    ancestry, a plain 3-tuple ``(parent, segment, key)`` where ``parent`` is the ancestry of the
+    structural value itself (either another lazy ancestry or a ``list`` of ``str`` segments),
+    ``segment`` is an ``AncestrySegment`` and ``key`` is the key or index of the child value.
+    Lazy ancestries are only joined into a ``list`` of ``str`` segments, via
+    ``materialize_ancestry()``, if an error is actually raised.
+
+    Since an ancestry received by ``process()`` may be lazy, it cannot be extended with ``+``;
+    implementations of ``process()`` should use ``extend_ancestry()`` instead, or else
+    materialize it first. A ``list`` of ``str`` segments is accepted anywhere an ancestry is.
+    """
+
+    __slots__ = ('template',)
+
+    def __init__(self, template):
+        self.template = template
+
+    def __repr__(self):
+        return 'AncestrySegment(%r)' % self.template
+
+ATTRIBUTE_SEGMENT = AncestrySegment('.%s')
+INDEX_SEGMENT = AncestrySegment('[%s]')
+
+def extend_ancestry(ancestry, key, segment=ATTRIBUTE_SEGMENT):
+    """Returns the lazy ancestry of the value identified by ``key`` within the value identified
+    by ``ancestry``, which is either a lazy ancestry or a ``list`` of ``str`` segments.
+
+    :param key: The key or index of the nested value.
+
+    :param segment: Optional, default is ``ATTRIBUTE_SEGMENT``, which is appropriate for the
+        keys of structures and maps; ``INDEX_SEGMENT`` is appropriate for the indexes of
+        sequences and tuples.
+    """
+
+    return (ancestry, segment, key)
+
+def materialize_ancestry(ancestry):
+    """Returns ``ancestry``, which is either a lazy ancestry or a ``list`` of ``str`` segments,
+    as a ``list`` of ``str`` segments."""
+
+    segments = []
+    while (isinstance(ancestry, tuple) and len(ancestry) == 3
+            and isinstance(ancestry[1], AncestrySegment)):
+        ancestry, segment, key = ancestry
+        segments.append(segment.template % (key,))
+
+    if not segments:
+        return ancestry
+
+    segments.reverse()
+    if ancestry:
+        segments[:0] = ancestry
+    return segments
+
+class ProcessingContext(list):
+    """A root ancestry which carries options that apply to the processing of an entire
+    hierarchical value. Since lazy ancestries link back to their root, structural fields nested
+    at any depth can find the context (via ``get_processing_context()``).
+
+    :param ancestry: The ancestry of the value being processed, either a ``list`` of ``str``
+        segments or a lazy ancestry.
+
+    :param int max_errors: Optional, default is ``None``; if specified, the number of errors,
+        >= 1, at which processing should be aborted instead of continuing to collect errors.
+
+    :param boolean preserve: Optional, default is ``False``; if ``True``, structural fields
+        return the candidate value itself, instead of a copy, when processing it changed
+        nothing. This can only be specified when the context is constructed.
+    """
+
+    def __init__(self, ancestry, max_errors=None, preserve=False):
+        super(ProcessingContext, self).__init__(materialize_ancestry(ancestry))
+        if max_errors is not None:
+            if not (isinstance(max_errors, integers) and max_errors >= 1):
+                raise TypeError("argument 'max_errors' must be an integer >= 1")
+
+        self.error_count = 0
+        self.max_errors = max_errors
+        self.preserve = preserve
+
+    def consume(self, error=None):
+        """Records ``error``, returning ``True`` if the error budget of this context is now
+        exhausted. Errors which contain a nested error structure are not counted, since the
+        errors within that structure have already been counted individually."""
+
+        if self.max_errors is None:
+            return False
+        if getattr(error, 'structure', None) is None:
+            self.error_count += 1
+        return self.error_count >= self.max_errors
+
+class ErrorBudget(ProcessingContext):
+    """A processing context which only limits the number of errors that can be accumulated
+    while processing a hierarchical value, such that processing is aborted as soon as the limit
+    is reached.
+
+    :param ancestry: The ancestry of the value being processed.
+
+    :param int max_errors: The number of errors, >= 1, at which processing should be aborted.
+    """
+
+    def __init__(self, ancestry, max_errors):
+        if max_errors is None:
+            raise TypeError("argument 'max_errors' must be an integer >= 1")
+        super(ErrorBudget, self).__init__(ancestry, max_errors)
+
+class LRUCache(object):
+    """A bounded cache which discards its least recently used entry when full, and which
+    counts its hits and misses.
+
+    :param int size: The maximum number of entries, >= 1.
+    """
+
+    __slots__ = ('entries', 'hits', 'misses', 'size')
+
+    def __init__(self, size):
+        if not (isinstance(size, integers) and size >= 1):
+            raise TypeError("argument 'size' must be an integer >= 1")
+
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.size = size
+
+    def __len__(self):
+        return len(self.entries)
+
+    def clear(self):
+        """Discards all entries and resets the counters of this cache."""
+
+        self.entries.clear()
+        self.hits = self.misses = 0
+
+    def get(self, key, default=None):
+        """Returns the value cached for ``key``, marking it as recently used, or ``default``
+        if there is none. Raises ``TypeError`` if ``key`` is not hashable."""
+
+        entries = self.entries
+        try:
+            value = entries.pop(key)
+        except KeyError:
+            self.misses += 1
+            return default
+
+        entries[key] = value
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        """Caches ``value`` for ``key``, discarding the least recently used entry if this
+        cache is full."""
+
+        entries = self.entries
+        if key not in entries and len(entries) >= self.size:
+            entries.pop(next(iter(entries)))
+        entries[key] = value
+
+def get_processing_context(ancestry):
+    """Returns the ``ProcessingContext`` at the root of ``ancestry``, if any."""
+
+    while type(ancestry) is tuple:
+        ancestry = ancestry[0]
+
+    if isinstance(ancestry, ProcessingContext):
+        return ancestry
+
+def exhausts_error_budget(ancestry, error=None):
+    """Records ``error`` against the error budget associated with ``ancestry``, if any,
+    returning ``True`` if that budget is now exhausted. If ``error`` is ``None``, an error
+    generated directly by the structural field processing ``ancestry`` is assumed."""
+
+    context = get_processing_context(ancestry)
+    if context is not None:
+        return context.consume(error)
+    else:
+        return False
+
+def preserves_identity(ancestry):
+    """Indicates if unchanged values should be returned as is when processing ``ancestry``,
+    which is the case when the ``ProcessingContext`` at its root specifies ``preserve``."""
+
+    while type(ancestry) is tuple:
+        ancestry = ancestry[0]
+    return type(ancestry) is not list and getattr(ancestry, 'preserve', False)
+
+def mapping_is_unchanged(original, processed):
+    """Indicates if ``processed``, a ``dict`` produced by processing the ``dict`` ``original``,
+    contains exactly the same keys and value objects as ``original``."""
+
+    if len(original) != len(processed):
+        return False
+
+    for key, value in original.items():
+        if key not in processed or processed[key] is not value:
+            return False
+    else:
+        return True
+
+def sequence_is_unchanged(original, processed):
+    """Indicates if ``processed``, a sequence produced by processing the sequence ``original``,
+    contains exactly the same value objects as ``original``."""
+
+    if len(original) != len(processed):
+        return False
+
+    for value, candidate in zip(original, processed):
+        if candidate is not value:
+            return False
+    else:
+        return True
+
+def compile_projection(projection):
+    """Compiles ``projection``, either a ``str`` of comma-separated paths (such as
+    ``'a,b,c.d'``) or a sequence of such paths, into a projection tree, which is a ``dict``
+    mapping each projected key either to ``None``, indicating that the entire value for that
+    key is projected, or to a nested projection tree. A projection which is already a ``dict``
+    is returned as is, so a tree can be compiled once and then reused."""
+
+    if projection is None or isinstance(projection, dict):
+        return projection
+
+    if isinstance(projection, string):
+        projection = projection.split(',')
+
+    tree = {}
+    for path in projection:
+        segments = path.strip().split('.')
+        if not segments[0]:
+            continue
+
+        node = tree
+        for segment in segments[:-1]:
+            if segment not in node:
+                node[segment] = {}
+            elif node[segment] is None:
+                break
+            node = node[segment]
+        else:
+            node[segments[-1]] = None
+
+    return tree
+
+def copy_description(value):
+    """Returns a copy of ``value``, a possibly nested field description, in which every
+    ``dict``, ``list`` and ``tuple`` is copied; since a description otherwise only contains
+    immutable values, this is equivalent to, but much cheaper than, a deep copy."""
+
+    if isinstance(value, dict):
+        return dict((k, copy_description(v)) for k, v in value.items())
+    elif isinstance(value, list):
+        return [copy_description(v) for v in value]
+    elif isinstance(value, tuple):
+        return tuple(copy_description(v) for v in value)
+    else:
+        return value
+
+def fingerprint_description(value):
+    """Returns a fingerprint of ``value``, a possibly nested field description (such as one
+    returned by ``Field.describe()``), as a string of hexadecimal digits; equal descriptions have
+    equal fingerprints, regardless of the order of their keys, only if their values are of the
+    same types. Raises ``TypeError`` if ``value`` contains a value which is not hashable."""
+
+    tokens = []
+    tokenize_description(value, tokens)
+    return sha1(' '.join(tokens).encode('utf8')).hexdigest()
+
+def tokenize_description(value, tokens):
+    """Appends the canonical tokens of ``value``, a possibly nested field description, to
+    ``tokens``; see :func:`fingerprint_description`."""
+
+    if isinstance(value, dict):
+        tokens.append('{')
+        for key, name in sorted((repr(name), name) for name in value):
+            tokens.append(key)
+            tokenize_description(value[name], tokens)
+        tokens.append('}')
+    elif isinstance(value, (list, tuple)):
+        tokens.append('(' if isinstance(value, tuple) else '[')
+        for item in value:
+            tokenize_description(item, tokens)
+        tokens.append(')' if isinstance(value, tuple) else ']')
+    else:
+        hash(value)
+        tokens.append(repr(value))
+
+def group_changes(changes):
+    """Groups ``changes``, a ``list`` of ``(path, value)`` pairs with each ``path`` a ``tuple``
+    of keys, by the first key of each path, returning a ``list`` of ``(key, changes)`` pairs in
+    which ``changes`` are relative to ``key``. A change with an empty path is returned with a
+    ``key`` of ``None``."""
+
+    groups = []
+    indexes = {}
+
+    for path, value in changes:
+        if path:
+            key, path = path[0], path[1:]
+        else:
+            key = None
+
+        if key in indexes:
+            groups[indexes[key]][1].append((path, value))
+        else:
+            indexes[key] = len(groups)
+            groups.append((key, [(path, value)]))
+
+    return groups
+
+def parse_change_index(key, length):
+    """Parses ``key``, a key of a change path (see ``group_changes()``), as an index into a
+    sequence of ``length`` items, returning ``None`` if it is not a non-negative ``int``, or a
+    ``str`` of digits, which identifies an existing item."""
+
+    if isinstance(key, string):
+        if not key.isdigit():
+            return None
+        key = int(key)
+    elif not isinstance(key, integers) or isinstance(key, bool) or key < 0:
+        return None
+
+    if key < length:
+        return key
+
 def abbreviate_string(value, maxlength=0):
     maxlength = max(maxlength, 4)
     if len(value) <= maxlength:
@@ -266,5 +598,11 @@ def with_metaclass(metaclass):
         params = cls.__dict__.copy()
         params.pop('__dict__', None)
         params.pop('__weakref__', None)
+
+        slots = params.get('__slots__')
+        if isinstance(slots, string):
+            slots = [slots]
+        for slot in slots or ():
+            params.pop(slot, None)
         return metaclass(cls.__name__, cls.__bases__, params)
     return decorator
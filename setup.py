@@ -1,4 +1,17 @@
+import sys
+
 from setuptools import setup, find_packages
+from setuptools.command.build_py import build_py
+
+class BuildPy(build_py):
+    """Omits scheme.asynchronous, which uses async/await syntax, when building for a version of
+    python which cannot byte-compile it."""
+
+    def find_package_modules(self, package, package_dir):
+        modules = build_py.find_package_modules(self, package, package_dir)
+        if sys.version_info < (3, 5):
+            modules = [module for module in modules if module[:2] != ('scheme', 'asynchronous')]
+        return modules
 
 setup(
     name='scheme',
@@ -10,6 +23,7 @@ setup(
     author_email='mccoy.jordan@gmail.com',
     url='https://github.com/arterial-io/scheme',
     packages=find_packages(exclude=['docs', 'tests']),
+    cmdclass={'build_py': BuildPy},
     keywords='schema data validation structured api',
     install_requires=[
         'Jinja2>=2.7',
@@ -0,0 +1,105 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from scheme import *
+from tests.util import *
+
+def construct_schema():
+    return Structure({
+        'id': Integer(nonnull=True),
+        'created': Date(),
+        'items': Sequence(Structure({
+            'name': Text(nonempty=True),
+            'attrs': Map(Integer()),
+        })),
+    }, name='test')
+
+def construct_value(count):
+    items = [{'name': 'item %d' % i, 'attrs': {'a': i}} for i in range(count)]
+    return {'id': 1, 'created': '2014-01-01', 'items': items}
+
+class TestAsynchronous(FieldTestCase):
+    def run_coroutine(self, coroutine):
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(coroutine)
+        finally:
+            loop.close()
+
+    def test_processing(self):
+        field = construct_schema()
+        value = construct_value(10)
+
+        expected = field.process(value, INBOUND, True)
+        self.assertEqual(self.run_coroutine(field.aprocess(value, INBOUND, True)), expected)
+        self.assertIs(self.run_coroutine(field.aprocess(None)), None)
+
+        value['items'][3]['attrs']['b'] = 'invalid'
+        del value['id']
+
+        expected = should_fail(field.process, value, INBOUND, True)
+        error = should_fail(self.run_coroutine, field.aprocess(value, INBOUND, True))
+        self.assertIsInstance(error, ValidationError)
+        self.assertEqual(error.serialize(), expected.serialize())
+        self.assertEqual(error.structure['items'].structure[3].structure['attrs']
+            .structure['b'].identity, ['test', '.items', '[3]', '.attrs', '[b]'])
+
+    def test_processing_options(self):
+        field = construct_schema()
+        value = construct_value(5)
+        del value['id']
+
+        for params in ({'partial': True}, {'projection': 'created,items.name'},
+                {'projection': 'id,items'}, {'max_errors': 1}, {'preserve': True}):
+            try:
+                expected = field.process(value, INBOUND, True, **params)
+            except ValidationError as exception:
+                error = should_fail(self.run_coroutine, field.aprocess(value, INBOUND, True,
+                    **params))
+                self.assertEqual(error.serialize(), exception.serialize())
+            else:
+                self.assertEqual(self.run_coroutine(field.aprocess(value, INBOUND, True,
+                    **params)), expected)
+
+        with self.assertRaises(TypeError):
+            self.run_coroutine(field.structure['items'].aprocess([], partial=True))
+
+    def test_undefined_fields(self):
+        for field, empty, value in ((Sequence(Undefined()), [], [1]),
+                (Map(Undefined()), {}, {'a': 1})):
+            self.assertEqual(self.run_coroutine(field.aprocess(empty)), empty)
+            with self.assertRaises(UndefinedFieldError):
+                self.run_coroutine(field.aprocess(value))
+
+    def test_cooperative_yielding(self):
+        field = construct_schema()
+        value = construct_value(100)
+        ticks = []
+
+        async def tick():
+            while True:
+                ticks.append(None)
+                await asyncio.sleep(0)
+
+        async def run():
+            ticker = asyncio.ensure_future(tick())
+            try:
+                return await field.aprocess(value, INBOUND, True, interval=0)
+            finally:
+                ticker.cancel()
+
+        self.assertEqual(self.run_coroutine(run()), field.process(value, INBOUND, True))
+        self.assertTrue(len(ticks) > 100)
+
+    def test_unserialization(self):
+        field = construct_schema()
+        value = construct_value(3)
+        expected = field.process(value, INBOUND, True)
+        serialized = field.serialize(expected, 'json')
+
+        self.assertEqual(self.run_coroutine(field.aunserialize(serialized, 'json')), expected)
+        with ThreadPoolExecutor(1) as executor:
+            self.assertEqual(self.run_coroutine(field.aunserialize(serialized, 'json',
+                executor=executor)), expected)
+            self.assertEqual(self.run_coroutine(field.aprocess(value, INBOUND, True,
+                executor=executor)), expected)
@@ -0,0 +1,6 @@
+import sys
+
+# the tests of scheme.asynchronous use async/await syntax, which python versions prior to 3.5
+# cannot compile, so they are only imported when they can run
+if sys.version_info >= (3, 5):
+    from tests.asynchronous_cases import TestAsynchronous
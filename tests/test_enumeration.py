@@ -24,6 +24,28 @@ class TestEnumeration(FieldTestCase):
         self.assert_processed(field, None, *values)
         self.assert_not_processed(field, 'invalid', 'beta', 2, False)
 
+    def test_unhashable_values(self):
+        field = Enumeration(['alpha', [1, 2], {'a': 1}], ignored_values=[[3]])
+        self.assert_processed(field, None, 'alpha', [1, 2], {'a': 1})
+        self.assert_not_processed(field, 'invalid', 'beta', [2, 1], {'a': 2})
+        self.assertIs(field.process([3]), None)
+
+        field = Enumeration('alpha beta')
+        self.assert_not_processed(field, 'invalid', [1, 2], {})
+
+    def test_redefinition(self):
+        field = Enumeration('alpha beta')
+        field.redefine('gamma')
+        self.assert_processed(field, 'alpha', 'gamma')
+
+        field.redefine('delta', 'replace')
+        self.assert_processed(field, 'delta')
+        self.assert_not_processed(field, 'invalid', 'alpha')
+
+        error = should_fail(field.process, 'alpha')
+        self.assertEqual(error.errors[0]['message'], "unknown-field must be one of 'delta'")
+        self.assertEqual(field.representation, "'delta'")
+
     def test_ignored_values(self):
         field = Enumeration('alpha beta', ignored_values='gamma delta')
         self.assert_processed(field, None, 'alpha', 'beta')
@@ -3,7 +3,11 @@ try:
 except ImportError:
     from unittest import TestCase
 
+import json
+import pickle
+
 from scheme import *
+from scheme.util import ATTRIBUTE_SEGMENT, INDEX_SEGMENT
 from tests.util import *
 
 class TestStructuralError(TestCase):
@@ -80,3 +84,63 @@ class TestStructuralError(TestCase):
         self.assertEqual(error.errors, [{'token': 'error'}])
 
 
+
+class TestValidationError(TestCase):
+    def test_deferred_rendering(self):
+        renderings = []
+
+        class RecordingError(FieldError):
+            __slots__ = ()
+
+            def format(self, field, params):
+                renderings.append(params['field'])
+                return super(RecordingError, self).format(field, params)
+
+        field = Integer(name='test', errors=[RecordingError('invalid', 'invalid value',
+            '%(field)s must be an integer')])
+
+        union = Union((field, Text()))
+        self.assertEqual(union.process('text'), 'text')
+        self.assertEqual(renderings, [])
+
+        error = ValidationError(identity=['test'], field=field).construct('invalid')
+        self.assertTrue(error.substantive)
+        self.assertEqual(renderings, [])
+
+        rendered = {'token': 'invalid', 'title': 'invalid value',
+            'message': 'test must be an integer'}
+        self.assertEqual(error.errors, [rendered])
+        self.assertEqual(error.serialize(), ([rendered], None))
+        self.assertIn('test must be an integer', str(error))
+        self.assertEqual(renderings, ['test'])
+
+        error = ValidationError(identity=['test'], field=Integer(name='test')).construct('invalid')
+        self.assertEqual(pickle.loads(pickle.dumps(error)).errors, [rendered])
+
+    def test_rendered_errors(self):
+        field = Integer(name='test')
+        error = ValidationError(identity=['test'], field=field).construct('invalid')
+        field.name = 'renamed'
+
+        rendered = {'token': 'invalid', 'title': 'invalid value',
+            'message': 'test must be an integer'}
+        self.assertIs(type(error.errors[0]), dict)
+        self.assertEqual(error.errors[0], rendered)
+        self.assertEqual(sorted(error.errors[0].keys()), ['message', 'title', 'token'])
+        self.assertIn('message', error.errors[0])
+        self.assertEqual(error.errors[0].get('message'), 'test must be an integer')
+        self.assertEqual(json.loads(json.dumps(error.errors)), [rendered])
+        self.assertEqual(error.serialize(), ([rendered], None))
+        self.assertIn('test must be an integer', str(error))
+
+    def test_pickling(self):
+        ancestry = ((['test'], ATTRIBUTE_SEGMENT, 'a'), INDEX_SEGMENT, 1)
+        error = ValidationError({'token': 'invalid'}, identity=ancestry, structure={'a': 1},
+            value=2)
+
+        unpickled = pickle.loads(pickle.dumps(error))
+        self.assertIs(type(unpickled), ValidationError)
+        self.assertEqual(unpickled.errors, [{'token': 'invalid'}])
+        self.assertEqual(unpickled.identity, ['test', '.a', '[1]'])
+        self.assertEqual(unpickled.structure, {'a': 1})
+        self.assertEqual(unpickled.value, 2)
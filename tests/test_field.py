@@ -1,6 +1,17 @@
+from decimal import Decimal as decimal
+
 from scheme import *
+from scheme.timezone import UTC
 from tests.util import *
 
+try:
+    from collections import OrderedDict
+except ImportError:
+    OrderedDict = dict
+
+def lowercase(value):
+    return value.lower()
+
 class TestField(FieldTestCase):
     def test_construction(self):
         field = Field(nonempty=True)
@@ -30,6 +41,44 @@ class TestField(FieldTestCase):
         field = Field(name='name')
         self.assertEqual(field.guaranteed_name, 'name')
 
+    def test_parameter_defaults(self):
+        # parameters stored in slots are always set by the constructor, so only the defaults
+        # of other parameters are materialized on the class
+        self.assertIs(Text().min_length, None)
+        self.assertIs(Text().strip, True)
+        self.assertIs(Email().strip, False)
+        self.assertNotIn('min_length', Email.defaulted_parameters)
+
+        class ParameterizedField(Field):
+            parameters = {'mode': 'normal'}
+
+        self.assertIn('mode', ParameterizedField.defaulted_parameters)
+        self.assertIs(ParameterizedField.mode, 'normal')
+
+        self.assertEqual(ParameterizedField().mode, 'normal')
+        self.assertEqual(ParameterizedField(mode='special').mode, 'special')
+        self.assertEqual(ParameterizedField(aspects={'mode': 'special'}).mode, 'special')
+        self.assertIs(ParameterizedField().undeclared, None)
+
+    def test_slots(self):
+        for fieldtype in Field.types.values():
+            if fieldtype.__module__.startswith('scheme.'):
+                self.assertIn('__slots__', vars(fieldtype))
+
+        field = Text(name='test', min_length=1, preprocessor=lowercase)
+        self.assertEqual(field.__dict__, {'preprocessor': lowercase})
+        self.assertEqual(Text(name='test').__dict__, {})
+
+        state = field.__getstate__()
+        self.assertEqual(state['name'], 'test')
+        self.assertEqual(state['min_length'], 1)
+        self.assertIs(state['preprocessor'], lowercase)
+        self.assertNotIn('_descriptions', state)
+
+        clone = field.clone()
+        self.assertEqual((clone.name, clone.min_length, clone.preprocessor),
+            ('test', 1, lowercase))
+
     def test_nulls(self):
         field = Field()
         for phase in (INBOUND, OUTBOUND):
@@ -62,6 +111,112 @@ class TestField(FieldTestCase):
         self.assertEqual(cloned.name, 'test')
         self.assertIsNone(cloned.description)
 
+    def test_compilation(self):
+        field = Field(name='test', nonnull=True, constant=1)
+        processor = field.compile()
+        self.assertEqual(processor(1), 1)
+
+        error = should_fail(processor, 2)
+        self.assertIsInstance(error, InvalidTypeError)
+        self.assertEqual(error.identity, ['test'])
+
+        error = should_fail(processor, None, ['outer', '.test'])
+        self.assertIsInstance(error, ValidationError)
+        self.assertEqual(error.identity, ['outer', '.test'])
+
+        class CustomField(Field):
+            def process(self, value, phase=INBOUND, serialized=False, ancestry=None):
+                return (value, phase, serialized)
+
+        processor = CustomField().compile(OUTBOUND, True)
+        self.assertEqual(processor(1), (1, OUTBOUND, True))
+
+    def test_trusted_serialization(self):
+        field = Structure({
+            'a': DateTime(),
+            'b': Sequence(Date()),
+            'c': Map(Decimal(), key=Text()),
+            'd': Tuple((Binary(), Integer(minimum=5))),
+            'e': Union((Text(), Integer(), Structure({'f': Time()}))),
+            'g': Structure({'x': {'h': Date()}, 'y': {'i': Integer()}}, polymorphic_on='type'),
+            'j': Text(ignore_null=True),
+        }, key_order='a b c d e g j')
+
+        today, now = date.today(), datetime.now(UTC).replace(microsecond=0)
+        values = [
+            {'a': now, 'b': [today], 'c': {'c': decimal('1.5')}, 'd': (b'test', 6), 'e': 'e',
+                'g': {'type': 'x', 'h': today}, 'j': None},
+            {'e': 2, 'g': {'type': 'y', 'i': 1}},
+            {'e': {'f': time(12, 0, 0)}},
+        ]
+
+        for value in values:
+            serialized = field.serialize(value, trusted=True)
+            self.assertIsInstance(serialized, OrderedDict)
+            self.assertEqual(serialized, field.serialize(value))
+
+        self.assertEqual(field.serialize({'d': (b'', 1)}, trusted=True), {'d': (b'', 1)})
+        self.assertIs(field.serialize(None, trusted=True), None)
+
+    def test_batch_processing(self):
+        field = Structure({'a': Integer(), 'b': Date()}, name='test')
+        now = date.today()
+
+        results, errors = field.process_many([{'a': 1}, {'a': 'a'}, None, {'b': now}])
+        self.assertEqual(results, [{'a': 1}, None, None, {'b': now}])
+        self.assertEqual(list(errors), [1])
+        self.assertIsInstance(errors[1], ValidationError)
+        self.assertEqual(errors[1].identity, ['test'])
+
+        results, errors = field.serialize_many([{'b': now}, {'b': 'b'}])
+        self.assertEqual(results, [field.serialize({'b': now}), None])
+        self.assertEqual(list(errors), [1])
+
+        results, errors = field.unserialize_many(results[:1])
+        self.assertEqual((results, errors), ([{'b': now}], {}))
+
+    def test_value_cache(self):
+        field = Date(cache=2)
+        self.assertIs(Date().cache, None)
+
+        unserialize = lambda value: field.process(value, INBOUND, True)
+        for processor in (unserialize, field.compile(INBOUND, True)):
+            field.cache.clear()
+
+            first = processor('2014-01-01')
+            self.assertEqual(first, date(2014, 1, 1))
+            self.assertIs(processor('2014-01-01'), first)
+            self.assertEqual((field.cache.hits, field.cache.misses), (1, 1))
+
+            processor('2014-01-02')
+            processor('2014-01-03')
+            self.assertEqual(len(field.cache), 2)
+            self.assertIsNot(processor('2014-01-01'), first)
+
+            for i in range(2):
+                with self.assertRaises(InvalidTypeError):
+                    processor('invalid')
+            self.assertEqual(len(field.cache), 2)
+            self.assertIs(processor(None), None)
+
+        self.assertEqual(field.process(date(2014, 1, 1), OUTBOUND, True), '2014-01-01')
+        self.assertEqual(field.process(date(2014, 1, 1)), date(2014, 1, 1))
+
+        field = Date()
+        self.assertEqual(field.process('2014-01-01', INBOUND, True), date(2014, 1, 1))
+        self.assertNotIn('_cached_processors', field.__dict__)
+
+        field = Field(cache=10)
+        self.assertEqual(field.process([1, 2]), [1, 2])
+        self.assertEqual(len(field.cache), 0)
+
+        clone = field.clone()
+        self.assertIsNot(clone.cache, field.cache)
+        self.assertEqual(clone.cache.size, 10)
+
+        with self.assertRaises(TypeError):
+            Field(cache=0)
+
     def test_describe(self):
         field = Field(name='test', required=True, aspects={'empty_custom_attr': None},
             custom_attr=True)
@@ -82,6 +237,81 @@ class TestField(FieldTestCase):
         self.assertEqual(field.describe({'name': None, 'cannot_be_described': None}),
             {'fieldtype': 'field', 'name': 'test'})
 
+    def test_description_caching(self):
+        import json
+
+        address = Structure({'city': Text()})
+        field = Structure({'id': Integer(), 'address': address}, name='test')
+        description = field.describe()
+        self.assertEqual(description, {'fieldtype': 'structure', 'name': 'test',
+            'structural': True, 'structure': {
+                'id': {'fieldtype': 'integer', 'name': 'id'},
+                'address': {'fieldtype': 'structure', 'name': 'address', 'structural': True,
+                    'structure': {'city': {'fieldtype': 'text', 'name': 'city'}}}}})
+
+        description['structure']['address']['structure'].clear()
+        Field.reconstruct(field.describe())
+        self.assertIsNot(field.describe(), field.describe())
+        self.assertEqual(field.describe(), json.loads(field.serialize_description()))
+        self.assertIs(field.serialize_description(), field.serialize_description())
+
+        def describe_city():
+            return field.describe()['structure']['address']['structure']['city']
+
+        address.insert(Text(name='city', required=True), True)
+        self.assertEqual(describe_city()['required'], True)
+        self.assertIn('"required": true', field.serialize_description())
+
+        address.insert(Text(name='street'))
+        self.assertIn('street', field.describe()['structure']['address']['structure'])
+        address.remove('street')
+        self.assertNotIn('street', field.describe()['structure']['address']['structure'])
+        address.merge({'zip': Text()})
+        self.assertIn('zip', field.describe()['structure']['address']['structure'])
+
+        self.assertIs(field.describe(verbose=True)['nonnull'], False)
+        self.assertIs(field.describe({'strict': False})['strict'], True)
+        self.assertNotIn('nonnull', field.describe())
+        self.assertNotIn('strict', field.describe())
+
+        field = Structure({'status': Enumeration('a b')})
+        self.assertEqual(field.describe()['structure']['status']['enumeration'], ['a', 'b'])
+        field.structure['status'].redefine('c', 'replace')
+        self.assertEqual(field.describe()['structure']['status']['enumeration'], ['c'])
+
+        undefined = Undefined()
+        field = Sequence(Structure({'items': Sequence(undefined)}))
+        self.assertEqual(Sequence(Integer()).describe()['item'], {'fieldtype': 'integer'})
+        undefined.define(Text())
+        self.assertEqual(field.describe()['item']['structure']['items']['item'],
+            {'fieldtype': 'text'})
+
+    def test_description_caching_of_attributes(self):
+        field = Text()
+        self.assertEqual(field.describe(), {'fieldtype': 'text'})
+        structure = Structure({'a': field})
+        self.assertEqual(field.describe(), {'fieldtype': 'text', 'name': 'a'})
+        self.assertEqual(structure.describe()['structure']['a'], field.describe())
+
+        renamed = Text(name='x')
+        self.assertEqual(renamed.describe()['name'], 'x')
+        extension = structure.extend({'y': renamed})
+        self.assertEqual(renamed.describe()['name'], 'y')
+        self.assertEqual(extension.describe()['structure']['y']['name'], 'y')
+
+        self.assertNotIn('nonnull', structure.serialize_description())
+        field.nonnull = True
+        self.assertIs(field.describe()['nonnull'], True)
+        self.assertIs(structure.describe()['structure']['a']['nonnull'], True)
+        self.assertIn('"nonnull": true', structure.serialize_description())
+
+        field = Enumeration('a b')
+        self.assertEqual(field.describe()['enumeration'], ['a', 'b'])
+        field.enumeration.append('c')
+        self.assertEqual(field.describe()['enumeration'], ['a', 'b'])
+        field.enumeration = ['c']
+        self.assertEqual(field.describe()['enumeration'], ['c'])
+
     def test_extraction(self):
         field = Field()
         self.assertIs(field.extract(None), None)
@@ -152,6 +382,81 @@ class TestField(FieldTestCase):
         with self.assertRaises(ValueError):
             Field.reconstruct(bad_specification)
 
+    def test_interned_reconstruction(self):
+        address = Structure({'street': Text(nonempty=True), 'city': Text()}, name='address')
+        first = Structure({'address': address, 'id': Integer()}).describe()
+        second = Structure({'address': address, 'tags': Sequence(Text(nonempty=True))})
+        second = second.describe()
+
+        interner = FieldInterner()
+        a = Field.reconstruct(first, interner)
+        b = interner.reconstruct(second)
+
+        self.assertIsNot(a, b)
+        self.assertIs(a.structure['address'], b.structure['address'])
+        self.assertIs(Field.reconstruct(first, interner), a)
+        self.assertIsNot(b.structure['tags'].item, a.structure['address'].structure['street'])
+        self.assertEqual(first['fieldtype'], 'structure')
+
+        self.assertIsNot(Field.reconstruct(Structure({'id': Integer()}).describe(), interner),
+            a)
+        self.assertEqual(b.process({'address': {'street': 'a'}, 'tags': ['b']}),
+            {'address': {'street': 'a'}, 'tags': ['b']})
+
+        self.assertEqual(len(interner), 9)
+        interner.clear()
+        self.assertIsNot(Field.reconstruct(first, interner), a)
+
+    def test_interning_unnamed_fields(self):
+        first = {'fieldtype': 'structure', 'structure': {'x': {'fieldtype': 'text'}}}
+        second = {'fieldtype': 'structure', 'structure': {'y': {'fieldtype': 'text'}}}
+        third = {'fieldtype': 'structure', 'name': 'third',
+            'structure': {'x': {'fieldtype': 'text'}}}
+
+        interner = FieldInterner()
+        a = interner.reconstruct(first)
+        b = interner.reconstruct(second)
+        c = interner.reconstruct(third)
+
+        self.assertIsNot(a.structure['x'], b.structure['y'])
+        self.assertIs(a.structure['x'], c.structure['x'])
+        self.assertEqual(a.structure['x'].name, 'x')
+        self.assertEqual(b.structure['y'].name, 'y')
+        self.assertEqual(b.describe()['structure'], {'y': {'fieldtype': 'text', 'name': 'y'}})
+
+        errors = should_fail(b.process, {'y': 1}).serialize()[1]
+        self.assertEqual(errors['y'][0]['message'], 'y must be a textual value')
+
+    def test_bounded_interning(self):
+        first = Structure({'id': Integer()}).describe()
+        second = Structure({'id': Text()}).describe()
+
+        interner = FieldInterner(2)
+        a = interner.reconstruct(first)
+        self.assertEqual(len(interner), 2)
+        self.assertIs(interner.reconstruct(first), a)
+
+        b = interner.reconstruct(second)
+        self.assertEqual(len(interner), 2)
+        self.assertIs(interner.reconstruct(second), b)
+        self.assertIsNot(interner.reconstruct(first), a)
+
+        with self.assertRaises(TypeError):
+            FieldInterner(0)
+
+    def test_fingerprint(self):
+        field = Structure({'id': Integer(), 'name': Text(nonempty=True)}, name='test')
+        fingerprint = field.fingerprint()
+
+        self.assertIsInstance(fingerprint, str)
+        self.assertEqual(len(fingerprint), 40)
+        self.assertEqual(Structure({'name': Text(nonempty=True), 'id': Integer()},
+            name='test').fingerprint(), fingerprint)
+        self.assertEqual(Field.reconstruct(field.describe()).fingerprint(), fingerprint)
+        self.assertNotEqual(Structure({'id': Integer(), 'name': Text()},
+            name='test').fingerprint(), fingerprint)
+        self.assertNotEqual(Integer(default=1).fingerprint(), Integer(default=1.0).fingerprint())
+
     def test_indirect_instantiation_via_reconstruct(self):
         field = Field.reconstruct('field', name='test', required=True)
 
@@ -0,0 +1,69 @@
+import os
+import subprocess
+import sys
+from unittest import skipIf
+
+from tests.util import *
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+LAZY_MODULES = ('csv', 'jinja2', 'scheme.formats.csv', 'scheme.formats.json',
+    'scheme.formats.structuredtext', 'scheme.formats.urlencoded', 'scheme.formats.xml',
+    'scheme.formats.yaml', 'xml.etree.ElementTree', 'yaml')
+
+def run_python(*args):
+    environment = dict(os.environ, PYTHONPATH=ROOT)
+    process = subprocess.Popen((sys.executable,) + args, cwd=ROOT, env=environment,
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True)
+
+    stdout, stderr = process.communicate()
+    if process.returncode != 0:
+        raise AssertionError(stderr)
+    return stdout, stderr
+
+def measure_import_time(statement):
+    """Returns a ``dict`` mapping each module imported by ``statement`` to its cumulative
+    import time in microseconds, as reported by ``python -X importtime``."""
+
+    stdout, stderr = run_python('-X', 'importtime', '-c', statement)
+
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+
+        cumulative, module = line.split('|')[1:]
+        try:
+            modules[module.strip()] = int(cumulative)
+        except ValueError:
+            pass
+    return modules
+
+@skipIf(sys.version_info < (3, 7), 'lazy imports require python 3.7 or later')
+class TestImports(TestCase):
+    def test_lazy_imports(self):
+        modules = measure_import_time('import scheme')
+        self.assertIn('scheme', modules)
+
+        imported = sorted(set(LAZY_MODULES).intersection(modules))
+        self.assertEqual(imported, [], 'import scheme (%dus) eagerly imported %s'
+            % (modules['scheme'], ', '.join(imported)))
+
+    def test_lazy_access(self):
+        stdout, stderr = run_python('-c', '; '.join([
+            'import sys, scheme',
+            'from scheme.format import Format',
+            'assert scheme.Json is Format.formats["json"]',
+            'assert "scheme.formats.xml" not in sys.modules',
+            'assert ".xml" in Format.formats and Format.formats.get(".yml") is scheme.Yaml',
+            'assert Format.formats.get("unknown") is None and "unknown" not in Format.formats',
+            'from scheme import *',
+            'assert Csv is scheme.formats.Csv and UrlEncoded.name == "urlencoded"',
+            'from scheme.interpolation import interpolate_parameters',
+            'assert "jinja2" not in sys.modules',
+            'assert interpolate_parameters("${a}", {"a": 1}, True) == 1',
+        ]))
+
+        with self.assertRaises(AttributeError):
+            import scheme
+            scheme.Unknown
@@ -1,4 +1,5 @@
 from scheme import *
+from scheme.util import ErrorBudget
 from tests.util import *
 
 class TestMap(FieldTestCase):
@@ -46,6 +47,16 @@ class TestMap(FieldTestCase):
         expected_error = ValidationError(structure={'a': REQUIRED_ERROR})
         self.assert_not_processed(field, expected_error, {})
 
+    def test_error_budget(self):
+        field = Map(Integer(), required_keys='x y')
+        error = should_fail(field.process, {'a': 'a'}, fail_fast=True)
+        self.assertEqual(list(error.structure), ['a'])
+
+        for processor, kwargs in ((field.process, {'max_errors': 1}),
+                (field.compile(), {'ancestry': ErrorBudget(['test'], 1)})):
+            error = should_fail(processor, {'a': 1}, **kwargs)
+            self.assertEqual(len([e for e in error.structure.values() if e != 1]), 1)
+
     def test_explicit_key(self):
         field = Map(Integer(), key=Integer())
         self.assert_processed(field, {}, {1: 1}, {1: 1, 2: 2})
@@ -58,6 +69,7 @@ class TestMap(FieldTestCase):
 
         undefined = Undefined()
         field = Map(undefined)
+        self.assert_processed(field, None, {})
 
         with self.assertRaises(UndefinedFieldError):
             field.process({'a': 1})
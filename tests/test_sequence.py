@@ -1,6 +1,56 @@
+try:
+    from unittest2 import skipIf
+except ImportError:
+    from unittest import skipIf
+
 from scheme import *
+from scheme.fields.sequence import process_chunk
+from scheme.util import ErrorBudget
 from tests.util import *
 
+try:
+    from concurrent.futures import Future, ProcessPoolExecutor
+except ImportError:
+    ProcessPoolExecutor = None
+else:
+    class DeferredFuture(Future):
+        def __init__(self, call):
+            super(DeferredFuture, self).__init__()
+            self.call = call
+
+        def result(self, timeout=None):
+            if not self.done() and self.set_running_or_notify_cancel():
+                self.set_result(self.call())
+            return super(DeferredFuture, self).result(timeout)
+
+    class DeferredExecutor(object):
+        """An executor which only runs each submitted call when its result is requested."""
+
+        instances = []
+
+        def __init__(self, initializer=None, initargs=()):
+            if initializer:
+                initializer(*initargs)
+
+            self.futures = []
+            self.submissions = []
+            self.instances.append(self)
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *args):
+            pass
+
+        def submit(self, function, *args):
+            self.submissions.append(args)
+            future = DeferredFuture(lambda: function(*args))
+            self.futures.append(future)
+            return future
+
+def lowercase(value):
+    return value.lower()
+
 class TestSequence(FieldTestCase):
     def _generate_sequences(self):
         today, today_text = construct_today()
@@ -75,6 +125,115 @@ class TestSequence(FieldTestCase):
         self.assert_processed(field, [], [1], [1, 2])
         self.assert_not_processed(field, 'duplicate', [1, 1])
 
+    def test_error_budget(self):
+        field = Sequence(Integer())
+        error = should_fail(field.process, [1, 'a', 2, 'b', 'c'], fail_fast=True)
+        self.assertEqual(len(error.structure), 2)
+
+        error = should_fail(field.process, [1, 'a', 2, 'b', 'c'], max_errors=2)
+        self.assertEqual(len(error.structure), 4)
+
+        error = should_fail(field.compile(), [1, 'a', 2, 'b', 'c'], ErrorBudget(['test'], 1))
+        self.assertEqual(len(error.structure), 2)
+
+    def test_iterative_processing(self):
+        field = Sequence(Integer())
+        self.assertEqual(list(field.iter_process(iter([1, 2, 3]))), [1, 2, 3])
+        self.assertEqual(list(field.iter_process((i for i in range(3)))), [0, 1, 2])
+        self.assertEqual(list(field.iter_process(None)), [])
+
+        for value in ('invalid', {}, 1):
+            with self.assertRaises(InvalidTypeError):
+                list(field.iter_process(value))
+
+        items = list(field.iter_process(iter([1, 'a', 3])))
+        self.assertEqual(items[0], 1)
+        self.assertIsInstance(items[1], InvalidTypeError)
+        self.assertEqual(items[1].identity, ['(sequence)', '[1]'])
+        self.assertEqual(items[2], 3)
+
+        field = Sequence(Integer(), unique=True)
+        items = list(field.iter_process(iter([1, 2, 1])))
+        self.assertEqual(items[:2], [1, 2])
+        self.assertEqual(items[2].errors[0]['token'], 'duplicate')
+
+        field = Sequence(Integer(), min_length=2, max_length=3)
+        self.assertEqual(list(field.iter_process(iter([1, 2]))), [1, 2])
+
+        iterator = field.iter_process(iter([1, 2, 3, 4]))
+        self.assertEqual([next(iterator) for i in range(3)], [1, 2, 3])
+        error = should_fail(next, iterator)
+        self.assertEqual(error.errors[0]['token'], 'max_length')
+
+        error = should_fail(list, field.iter_process(iter([1])))
+        self.assertEqual(error.errors[0]['token'], 'min_length')
+
+        field = Sequence(Date())
+        a, b = self._generate_sequences()
+        self.assertEqual(list(field.iter_process(iter(b), INBOUND, True)), a)
+
+    @skipIf(ProcessPoolExecutor is None, 'concurrent.futures is not available')
+    def test_parallel_processing(self):
+        field = Sequence(Structure({'a': Integer(), 'b': Date()}))
+        a, b = self._generate_sequences()
+        value = [{'a': i, 'b': b[i % 3]} for i in range(25)]
+        expected = [{'a': i, 'b': a[i % 3]} for i in range(25)]
+
+        with ProcessPoolExecutor(2) as executor:
+            self.assertEqual(field.process(value, INBOUND, True, executor=executor,
+                chunk_size=4), expected)
+
+            value[5]['a'] = 'invalid'
+            value[22]['b'] = 'invalid'
+
+            error = should_fail(field.process, value, INBOUND, True, executor=executor,
+                chunk_size=4)
+            self.assertEqual(len(error.structure), 25)
+            self.assertIsInstance(error.structure[5], ValidationError)
+            self.assertEqual(error.structure[5].structure['a'].identity,
+                ['(sequence)', '[5]', '.a'])
+            self.assertIsInstance(error.structure[22], ValidationError)
+            self.assertEqual(error.structure[4], expected[4])
+            self.assertEqual(error.serialize(),
+                should_fail(field.process, value, INBOUND, True).serialize())
+
+            error = should_fail(field.process, value, INBOUND, True, executor=executor,
+                chunk_size=4, fail_fast=True)
+            self.assertEqual(len(error.structure), 6)
+
+            with self.assertRaises(TypeError):
+                field.process(value, executor=executor, chunk_size=0)
+
+            value[5]['a'], value[22]['b'] = 5, b[1]
+            self.assertEqual(field.process(value, INBOUND, True, executor=ProcessPoolExecutor,
+                chunk_size=4), expected)
+
+            field = Sequence(Structure({'a': Text(preprocessor=lowercase)}))
+            value = [{'a': 'ITEM %d' % i} for i in range(10)]
+            self.assertEqual(field.process(value, executor=executor, chunk_size=4),
+                field.process(value))
+            self.assertEqual(field.process(value, executor=executor)[9], {'a': 'item 9'})
+
+        field = Sequence(Structure({'a': Integer()}))
+        value = [{'a': i} for i in range(10)]
+        value[2]['a'] = value[6]['a'] = 'invalid'
+
+        executor = DeferredExecutor()
+        error = should_fail(field.process, value, executor=executor, chunk_size=2,
+            max_errors=2)
+        self.assertEqual(len(error.structure), 7)
+        self.assertEqual([future.cancelled() for future in executor.futures],
+            [False, False, False, False, True])
+
+        self.assertEqual(len(set(args[2] for args in executor.submissions)), 1)
+        value[2]['a'] = value[6]['a'] = 2
+        self.assertEqual(field.process(value, executor=DeferredExecutor, chunk_size=2), value)
+        self.assertEqual([args[2] for args in DeferredExecutor.instances[-1].submissions],
+            [None] * 5)
+
+        key = (DeferredExecutor.instances[-1].submissions[0][0][0], OUTBOUND, False)
+        self.assertIsNone(process_chunk(key, value))
+
     def test_undefined_field(self):
         undefined = Undefined(Integer())
         field = Sequence(undefined)
@@ -83,6 +242,7 @@ class TestSequence(FieldTestCase):
 
         undefined = Undefined()
         field = Sequence(undefined)
+        self.assert_processed(field, None, [])
 
         with self.assertRaises(UndefinedFieldError):
             field.process([1, 2])
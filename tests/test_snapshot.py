@@ -0,0 +1,98 @@
+import os
+from tempfile import mkdtemp
+
+from scheme import *
+from scheme import snapshot
+from tests.util import *
+
+def construct_schemas():
+    address = Structure({'street': Text(nonempty=True), 'city': Text()}, name='address')
+    node = Structure({'name': Text(nonempty=True), 'children': Sequence(Undefined())})
+    node.structure['children'].item.define(node)
+
+    return {
+        'person': Structure({
+            'id': Integer(nonnull=True, minimum=1),
+            'name': Text(nonempty=True, cache=16),
+            'status': Enumeration('active inactive', default='active'),
+            'created': DateTime(),
+            'address': address,
+            'tags': Sequence(Text(), unique=True),
+            'attrs': Map(Union((Integer(), Text()))),
+            'point': Tuple((Float(), Float())),
+        }, name='person', key_order='id name'),
+        'office': Structure({'address': address}, name='office'),
+        'shape': Structure({
+            'circle': {'radius': Float()},
+            'square': {'side': Float()},
+        }, polymorphic_on='type'),
+        'node': node,
+    }
+
+class TestSnapshot(TestCase):
+    def test_restoration(self):
+        schemas = construct_schemas()
+        person = {'id': 1, 'name': 'a', 'created': '2014-01-01T00:00:00Z',
+            'address': {'street': 'b'}, 'tags': ['c'], 'attrs': {'d': 1, 'e': 'f'},
+            'point': [1.0, 2.0]}
+        schemas['person'].unserialize(person)
+
+        restored = snapshot.loads(snapshot.dumps(schemas))
+        self.assertEqual(set(restored), set(schemas))
+        for name in ('person', 'office', 'shape'):
+            self.assertIsNot(restored[name], schemas[name])
+            self.assertEqual(restored[name].describe(), schemas[name].describe())
+
+        self.assertEqual(restored['person'].unserialize(person),
+            schemas['person'].unserialize(person))
+        self.assertIs(restored['person'].structure['address'],
+            restored['office'].structure['address'])
+        self.assertEqual(restored['shape'].process({'type': 'circle', 'radius': 1.0}),
+            {'type': 'circle', 'radius': 1.0})
+        self.assertEqual(restored['node'].process({'name': 'a', 'children': [{'name': 'b'}]}),
+            {'name': 'a', 'children': [{'name': 'b'}]})
+
+        error = should_fail(restored['person'].process, {'id': 0})
+        self.assertEqual(error.serialize(), should_fail(schemas['person'].process,
+            {'id': 0}).serialize())
+
+        address = restored['person'].structure['address']
+        address.insert(Text(name='zip'))
+        self.assertIn('zip', restored['office'].describe()['structure']['address']['structure'])
+        self.assertNotIn('zip', schemas['office'].describe()['structure']['address']['structure'])
+
+    def test_restoring_clones(self):
+        base = Structure({'a': Integer(), 'b': Structure({'c': Text()})}, name='base')
+        clone = base.clone()
+
+        base, clone = snapshot.loads(snapshot.dumps((base, clone)))
+        base.structure['a'].nonnull = True
+        base.structure['b'].insert(Text(name='d'))
+        self.assertFalse(clone.structure['a'].nonnull)
+        self.assertEqual(set(clone.structure['b'].structure), set(['c']))
+        self.assertEqual(clone.process({'a': None, 'b': {'c': 'c'}}), {'a': None, 'b': {'c': 'c'}})
+        should_fail(base.process, {'a': None})
+
+        clone.structure['a'].minimum = 1
+        self.assertIsNone(base.structure['a'].minimum)
+
+    def test_files(self):
+        path = os.path.join(mkdtemp(), 'schemas.snapshot')
+        schemas = construct_schemas()
+
+        snapshot.save(path, schemas)
+        snapshot.save(path, schemas)
+        self.assertEqual(os.listdir(os.path.dirname(path)), ['schemas.snapshot'])
+        self.assertEqual(snapshot.load(path)['person'].describe(), schemas['person'].describe())
+
+        os.remove(path)
+        os.rmdir(os.path.dirname(path))
+
+    def test_invalid_snapshots(self):
+        content = snapshot.dumps({'field': Integer()})
+        with self.assertRaises(ValueError):
+            snapshot.loads(b'invalid')
+        with self.assertRaises(ValueError):
+            snapshot.loads(content.replace(b'scheme-snapshot', b'something-else', 1))
+        with self.assertRaises(ValueError):
+            snapshot.loads(content.replace(b'\n', b'.0\n', 1))
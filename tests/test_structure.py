@@ -1,6 +1,12 @@
 from scheme import *
+from scheme.util import ErrorBudget, ProcessingContext, compile_projection
 from tests.util import *
 
+try:
+    from collections import OrderedDict
+except ImportError:
+    OrderedDict = dict
+
 class TestStructure(FieldTestCase):
     maxDiff=None
     class ExtractionTarget(object):
@@ -41,6 +47,162 @@ class TestStructure(FieldTestCase):
         expected_error = ValidationError(structure={'a': INVALID_ERROR, 'b': 'b', 'c': True})
         self.assert_not_processed(field, expected_error, {'a': '', 'b': 'b', 'c': True})
 
+    def test_error_identity(self):
+        field = Structure({'a': Sequence(Structure({'b': Integer()}))}, name='test')
+        for processor in (field.process, field.compile()):
+            error = should_fail(processor, {'a': [{'b': 1}, {'b': 'b'}]})
+            self.assertEqual(error.identity, ['test'])
+
+            error = error.structure['a']
+            self.assertEqual(error.identity, ['test', '.a'])
+            self.assertEqual(error.structure[1].structure['b'].identity,
+                ['test', '.a', '[1]', '.b'])
+
+    def test_error_budget(self):
+        field = Structure({'a': Integer(), 'b': Integer(), 'c': Sequence(Integer())},
+            key_order='a b c', strict=True)
+        value = {'a': 'a', 'b': 'b', 'c': [1, 'c', 'c'], 'd': 4}
+
+        error = should_fail(field.process, value)
+        self.assertEqual(set(error.structure), set(['a', 'b', 'c', 'd']))
+
+        error = should_fail(field.process, value, fail_fast=True)
+        self.assertEqual(list(error.structure), ['a'])
+
+        error = should_fail(field.process, value, max_errors=3)
+        self.assertEqual(list(error.structure), ['a', 'b', 'c'])
+        self.assertEqual(len(error.structure['c'].structure), 2)
+
+        error = should_fail(field.process, {'c': [], 'd': 4, 'e': 5}, max_errors=1)
+        self.assertEqual(len(error.structure), 2)
+
+        processor = field.compile()
+        error = should_fail(processor, value, ErrorBudget(['test'], 5))
+        self.assertEqual(list(error.structure), ['a', 'b', 'c', 'd'])
+        self.assertEqual(error.identity, ['test'])
+
+        field = Structure({'a': Integer(), 'b': Integer(required=True)}, key_order='a b')
+        error = should_fail(field.process, {'a': 'a'}, fail_fast=True)
+        self.assertEqual(list(error.structure), ['a'])
+
+        with self.assertRaises(TypeError):
+            field.process({}, max_errors=0)
+
+    def test_identity_preservation(self):
+        field = Structure({'a': Sequence(Map(Integer())), 'b': Tuple((Text(), Integer())),
+            'c': Integer(default=1)})
+
+        value = {'a': [{'x': 1}], 'b': ('b', 2), 'c': 3}
+        for processor, kwargs in ((field.process, {'preserve': True}),
+                (field.compile(), {'ancestry': ProcessingContext(['test'], preserve=True)})):
+            self.assertIs(processor(value, **kwargs), value)
+
+            processed = processor({'a': value['a'], 'b': ['b', 2]}, **kwargs)
+            self.assertEqual(processed, {'a': [{'x': 1}], 'b': ('b', 2), 'c': 1})
+            self.assertIs(processed['a'], value['a'])
+
+        processed = field.process(value)
+        self.assertEqual(processed, value)
+        self.assertIsNot(processed, value)
+        self.assertIsNot(processed['a'], value['a'])
+
+        field = Structure({'a': Text()}, key_order='a')
+        value = {'a': 'a'}
+        self.assertIsNot(field.process(value, preserve=True), value)
+
+        # the flag is carried by the context at the root of the ancestry, so contexts which
+        # share an identity with a collected preserving context do not inherit it
+        field = Structure({'a': Sequence(Map(Integer()))})
+        value = {'a': [{'x': 1}]}
+        self.assertIs(field.process(value, ancestry=ProcessingContext(['test'], preserve=True)), value)
+        for _ in range(3):
+            self.assertIsNot(field.process(value, ancestry=ProcessingContext(['test'])), value)
+
+    def test_processing_plan(self):
+        field = Structure({'a': Integer(), 'b': Integer(required=True, default=2)})
+        self.assertFalse(field.has_required_fields)
+        self.assertEqual(field.process({'a': 1}), {'a': 1, 'b': 2})
+
+        field.insert(Integer(name='c', required=True))
+        self.assertTrue(field.has_required_fields)
+        should_fail(field.process, {'a': 1})
+        self.assertEqual(field.process({'a': 1, 'c': 3}), {'a': 1, 'b': 2, 'c': 3})
+
+        field.remove('c')
+        self.assertFalse(field.has_required_fields)
+        self.assertEqual(field.process({'a': 1}), {'a': 1, 'b': 2})
+        should_fail(field.process, {'a': 1, 'c': 3})
+
+        field.merge({'c': Integer(), 'd': Integer()})
+        self.assertEqual(field.process({'a': 1, 'c': 3, 'd': 4}), {'a': 1, 'b': 2, 'c': 3, 'd': 4})
+
+        extension = field.extend({'e': Integer()})
+        self.assertEqual(extension.process({'e': 5}), {'b': 2, 'e': 5})
+        should_fail(field.process, {'e': 5})
+
+    def test_processing_plan_invalidation(self):
+        inner = Structure({'x': Integer()})
+        field = Structure({'a': Integer(), 'b': Integer(), 'inner': inner})
+        self.assertEqual(field.process({}), {})
+        self.assertEqual(field.describe()['structure']['a'], {'fieldtype': 'integer', 'name': 'a'})
+
+        field.structure['a'].default = 1
+        field.structure['b'].required = True
+        self.assertEqual(field.structure['a'].describe()['default'], 1)
+        should_fail(field.process, {})
+        self.assertEqual(field.process({'b': 2}), {'a': 1, 'b': 2})
+
+        field.structure['b'].required = False
+        field.structure['a'].ignore_null = True
+        self.assertEqual(field.process({'a': None}), {})
+
+        field.structure['c'] = Integer(name='c', default=3)
+        self.assertIn('c', field.describe()['structure'])
+        self.assertEqual(field.process({}), {'a': 1, 'c': 3})
+        del field.structure['c']
+        self.assertEqual(field.process({}), {'a': 1})
+        should_fail(field.process, {'c': 3})
+
+        self.assertEqual(field.process({'inner': {}}), {'a': 1, 'inner': {}})
+        inner.structure.update({'y': Integer(name='y', default=2)})
+        self.assertEqual(field.process({'inner': {}}), {'a': 1, 'inner': {'y': 2}})
+
+        field = Structure({'alpha': {'a': Integer()}, 'beta': {'b': Integer()}},
+            polymorphic_on='type')
+        self.assertEqual(field.process({'type': 'alpha'}), {'type': 'alpha'})
+        field.structure['alpha']['c'] = Integer(name='c', default=3)
+        self.assertEqual(field.process({'type': 'alpha'}), {'type': 'alpha', 'c': 3})
+
+        clone = field.clone()
+        self.assertIsNot(clone.structure['alpha'], field.structure['alpha'])
+        clone.structure['alpha']['d'] = Integer(name='d', default=4)
+        self.assertEqual(field.process({'type': 'alpha'}), {'type': 'alpha', 'c': 3})
+        self.assertEqual(clone.process({'type': 'alpha'}), {'type': 'alpha', 'c': 3, 'd': 4})
+
+    def test_processing_plan_revisions(self):
+        field = Structure({'a': Integer(), 'b': Integer()})
+        unrelated = Structure({'a': Integer()})
+        plan = field._get_plan()
+
+        unrelated.structure['a'].required = True
+        Integer().default = 1
+        self.assertIs(field._get_plan(), plan)
+        should_fail(unrelated.process, {})
+
+        field.structure['b'].default = 2
+        self.assertIsNot(field._get_plan(), plan)
+        self.assertEqual(field.process({}), {'b': 2})
+
+        field = Structure({'alpha': {'a': Integer()}, 'beta': {'b': Integer()}},
+            polymorphic_on='type')
+        self.assertEqual(field.process({'type': 'alpha'}), {'type': 'alpha'})
+        dispatcher = field._get_dispatcher(INBOUND, False)
+        self.assertIs(field._get_dispatcher(INBOUND, False), dispatcher)
+
+        field.polymorphic_on.redefine(['alpha'], 'replace')
+        self.assertIsNot(field._get_dispatcher(INBOUND, False), dispatcher)
+        should_fail(field.process, {'type': 'beta'})
+
     def test_preprocessing(self):
         def preprocess(value):
             if 'a' in value:
@@ -129,6 +291,20 @@ class TestStructure(FieldTestCase):
         expected_error = ValidationError(structure={'id': 'alpha', 'b': UNKNOWN_ERROR})
         self.assert_not_processed(field, expected_error, {'id': 'alpha', 'b': 2})
 
+    def test_polymorphic_dispatch(self):
+        field = Structure({
+            1: {'a': Integer()},
+            2: {'b': Integer()},
+        }, polymorphic_on=Integer(name='id'))
+
+        dispatcher = field._get_dispatcher(INBOUND, True)
+        self.assertEqual(dispatcher, {1: (int, 1), 2: (int, 2)})
+
+        self.assert_processed(field, {'id': 1, 'a': 1}, {'id': 2, 'b': 2})
+        self.assert_not_processed(field, 'unrecognized', {'id': 3})
+        self.assert_not_processed(field, 'invalid', {'id': 'alpha'}, {'id': [1]})
+        self.assertEqual(field.process({'id': 2.0, 'b': 2}, INBOUND, True), {'id': 2, 'b': 2})
+
     def test_polymorphism_with_common_fields(self):
         field = Structure({
             '*': {'n': Integer()},
@@ -140,6 +316,80 @@ class TestStructure(FieldTestCase):
         self.assert_processed(field, {'id': 'alpha', 'a': 1, 'n': 3},
             {'id': 'beta', 'b': 2, 'n': 3})
 
+    def test_compilation(self):
+        field = Structure({'a': Integer(required=True), 'b': Text(default='b'),
+            'c': Integer(ignore_null=True)}, key_order='c a b')
+        processor = field.compile()
+
+        value = processor({'a': 1, 'c': None})
+        self.assertIsInstance(value, OrderedDict)
+        self.assertEqual(list(value.items()), [('a', 1), ('b', 'b')])
+
+        error = should_fail(processor, {'b': 'b', 'z': 1})
+        self.assertIsInstance(error, ValidationError)
+        self.assertEqual(error.serialize(), should_fail(field.process,
+            {'b': 'b', 'z': 1}).serialize())
+
+        field = Structure({
+            'alpha': {'a': Integer()},
+            'beta': {'b': Integer()},
+        }, polymorphic_on=Text(name='type'))
+
+        processor = field.compile(INBOUND, True)
+        self.assertEqual(processor({'type': 'alpha', 'a': 1}), {'type': 'alpha', 'a': 1})
+        self.assertEqual(processor({'type': 'beta', 'b': 2}), {'type': 'beta', 'b': 2})
+
+        error = should_fail(processor, {'type': 'gamma'})
+        self.assertEqual(error.errors[0]['token'], 'unrecognized')
+
+    def test_compilation_of_undefined_fields(self):
+        undefined = Undefined()
+        field = Structure({'a': undefined})
+        processor = field.compile()
+
+        with self.assertRaises(UndefinedFieldError):
+            processor({'a': 1})
+
+        undefined.define(Integer())
+        self.assertEqual(processor({'a': 1}), {'a': 1})
+
+    def test_compilation_with_options(self):
+        field = Structure({
+            'a': Integer(required=True, nonnull=True),
+            'b': Text(default='b'),
+            'items': Sequence(Structure({'name': Text(), 'd': Date(required=True)})),
+            'attrs': Map(Structure({'x': Integer(), 'y': Integer()})),
+            'kind': Structure({
+                'alpha': {'x': Integer()},
+                'beta': {'y': Integer(), 'z': Integer()},
+            }, polymorphic_on='type'),
+        })
+
+        values = [{}, {'a': 2}, {'a': None, 'b': 'c'},
+            {'a': 1, 'items': [{'name': 'n', 'd': date(2014, 1, 2)}, {'name': 'm'}],
+                'attrs': {'k': {'x': 1, 'y': 2}}, 'kind': {'type': 'beta', 'y': 1, 'z': 2}}]
+
+        for params in ({'partial': True}, {'projection': 'b,items.d,attrs.x,kind.z'},
+                {'partial': True, 'projection': 'a,items'}):
+            processor = field.compile(**params)
+            for value in values:
+                try:
+                    expected = field.process(value, **params)
+                except ValidationError as exception:
+                    self.assertEqual(should_fail(processor, value).serialize(),
+                        exception.serialize())
+                else:
+                    self.assertEqual(processor(value), expected)
+
+        processor = field.compile(projection='items')
+        self.assertEqual(processor({'b': 'bad', 'items': [{'name': 'n', 'd': None}]}),
+            {'items': [{'name': 'n', 'd': None}]})
+
+        with self.assertRaises(TypeError):
+            Text().compile(projection='a')
+        with self.assertRaises(TypeError):
+            Sequence(Text()).compile(partial=True)
+
     def test_undefined_fields(self):
         undefined = Undefined(Integer())
         field = Structure({'a': undefined})
@@ -389,6 +639,103 @@ class TestStructure(FieldTestCase):
         self.assertEqual(set(field.structure.keys()), set(['a']))
         self.assertEqual(set(clone.structure.keys()), set(['a', 'b']))
 
+    def test_copy_on_write_cloning(self):
+        address = Structure({'street': Text(), 'city': Text()})
+        field = Structure({'id': Integer(), 'address': address, 'tags': Sequence(Text())},
+            default={'id': 1, 'tags': ['a']}, key_order='id address tags')
+        value = {'id': 2, 'address': {'city': 'x'}, 'tags': ['b']}
+        expected = field.process(value)
+
+        clone = field.clone()
+        self.assertIsNot(clone.structure, field.structure)
+        self.assertIs(dict.__getitem__(clone.structure, 'address'), address)
+        self.assertEqual(clone.process(value), expected)
+        self.assertIs(dict.__getitem__(clone.structure, 'address'), address)
+
+        clone.structure['address'].insert(Text(name='zip', required=True))
+        clone.structure['tags'].item.required = True
+        with self.assertRaises(ValidationError):
+            clone.process(value)
+
+        clone.insert(Boolean(name='active'))
+        clone.remove('id')
+        clone.default['tags'].append('c')
+        clone.key_order.append('active')
+        self.assertIs(field.structure['address'], address)
+        self.assertEqual(set(address.structure), set(['street', 'city']))
+        self.assertFalse(field.structure['tags'].item.required)
+        self.assertEqual(set(field.structure), set(['id', 'address', 'tags']))
+        self.assertEqual(field.default, {'id': 1, 'tags': ['a']})
+        self.assertEqual(field.key_order, ['id', 'address', 'tags'])
+        self.assertEqual(field.process(value), expected)
+
+        clone = field.clone()
+        field.structure['address'].structure['city'].required = True
+        self.assertFalse(clone.structure['address'].structure['city'].required)
+        self.assertEqual(clone.process({'address': {}}), {'address': {}})
+        with self.assertRaises(ValidationError):
+            field.process({'address': {}})
+
+        extension = field.extend({'active': Boolean()})
+        replacement = extension.replace({'address': Text()})
+        self.assertIsInstance(extension.structure['address'], Structure)
+        self.assertIsNot(extension.structure['address'], address)
+        self.assertIsInstance(replacement.structure['address'], Text)
+        self.assertIs(field.structure['address'], address)
+        self.assertNotIn('active', field.structure)
+
+        field = Structure({'alpha': {'a': Integer()}, 'beta': {'b': address}},
+            polymorphic_on='type')
+        clone = field.clone()
+        self.assertIs(dict.__getitem__(clone.structure['beta'], 'b'), address)
+        clone.structure['beta']['b'].remove('street')
+        clone.structure['alpha']['c'] = Text(name='c')
+        self.assertIn('street', address.structure)
+        self.assertEqual(set(field.structure['alpha']), set(['a', 'type']))
+
+        undefined = Undefined()
+        field = Structure({'a': undefined})
+        clone = field.clone()
+        undefined.define(Integer())
+        self.assertIsInstance(field.structure['a'], Integer)
+        self.assertIsInstance(clone.structure['a'], Integer)
+
+    def test_copy_on_write_exposure(self):
+        import pickle
+
+        a, b = Integer(), Structure({'c': Text()})
+        field = Structure({'a': a, 'b': b}, default={'a': 1})
+        clone = field.clone()
+        subclone = clone.clone()
+
+        def shared(name):
+            original = dict.__getitem__(field.structure, name)
+            return [dict.__getitem__(candidate.structure, name) is original
+                for candidate in (clone, subclone)]
+
+        field.describe()
+        field.extract({'a': 1, 'b': {}})
+        field.interpolate({'a': 1}, {})
+        field.generate_defaults()
+        self.assertIs(field.filter(), field)
+        self.assertEqual(shared('a') + shared('b'), [True] * 4)
+
+        self.assertIs(field.structure['a'], a)
+        self.assertEqual(shared('a') + shared('b'), [False, False, True, True])
+        a.nonnull = True
+        self.assertFalse(clone.structure['a'].nonnull)
+        self.assertFalse(subclone.structure['a'].nonnull)
+
+        subclone.structure.get('b').insert(Text(name='d'))
+        self.assertEqual(shared('b'), [True, False])
+        self.assertEqual(set(b.structure), set(['c']))
+
+        field, clone = pickle.loads(pickle.dumps((field, clone)))
+        self.assertIsNot(dict.__getitem__(clone.structure, 'b'),
+            dict.__getitem__(field.structure, 'b'))
+        field.structure['b'].remove('c')
+        self.assertEqual(set(clone.structure['b'].structure), set(['c']))
+
     def test_field_insertion(self):
         field = Structure({'a': Integer()})
         self.assertEqual(set(field.structure.keys()), set(['a']))
@@ -489,6 +836,118 @@ class TestStructure(FieldTestCase):
 
         self.assertEqual(field.process({'a': 2}, INBOUND, partial=True), {'a': 2})
 
+    def test_projection(self):
+        field = Structure({
+            'a': Integer(required=True),
+            'b': Date(),
+            'items': Sequence(Structure({'name': Text(), 'd': Date()})),
+            'attrs': Map(Structure({'x': Integer(), 'y': Integer()})),
+            'kind': Structure({
+                'alpha': {'x': Integer()},
+                'beta': {'y': Integer(), 'z': Integer()},
+            }, polymorphic_on='type'),
+        })
+
+        value = {'a': 1, 'b': date(2014, 1, 1), 'items': [{'name': 'n', 'd': date(2014, 1, 2)}],
+            'attrs': {'k': {'x': 1, 'y': 2}}, 'kind': {'type': 'beta', 'y': 1, 'z': 2}}
+        serialized = field.process(value, OUTBOUND, True)
+
+        projection = compile_projection('b,items.d,attrs.x,kind.z')
+        expected = {'b': date(2014, 1, 1), 'items': [{'d': date(2014, 1, 2)}],
+            'attrs': {'k': {'x': 1}}, 'kind': {'type': 'beta', 'z': 2}}
+
+        self.assertEqual(field.process(value, projection=projection), expected)
+        self.assertEqual(field.process(value, projection='b,items.d,attrs.x,kind.z'), expected)
+        self.assertEqual(field.process(serialized, INBOUND, True, projection='a,b,items'),
+            {'a': 1, 'b': date(2014, 1, 1), 'items': value['items']})
+        self.assertEqual(field.process({'b': 'bad'}, projection='items'), {})
+
+        expected_serialized = {'b': '2014-01-01', 'items': [{'d': '2014-01-02'}],
+            'attrs': {'k': {'x': 1}}, 'kind': {'type': 'beta', 'z': 2}}
+        for trusted in (False, True):
+            self.assertEqual(field.serialize(value, trusted=trusted, projection=projection),
+                expected_serialized)
+
+        self.assertEqual(field.extract(value, projection=projection), expected)
+        self.assertEqual(field.instantiate(value, projection=projection), expected)
+
+        with self.assertRaises(TypeError):
+            Integer().serialize(1, projection='a')
+
+    def test_revalidation(self):
+        field = Structure({
+            'a': Integer(),
+            'b': Date(),
+            'c': Text(ignore_null=True),
+            'items': Sequence(Structure({'name': Text(), 'd': Date()})),
+            'nums': Sequence(Integer(), unique=True),
+            'attrs': Map(Integer()),
+            'kind': Structure({
+                'alpha': {'x': Integer()},
+                'beta': {'x': Integer(), 'y': Date()},
+            }, polymorphic_on='type'),
+        }, name='test')
+
+        previous = field.process({'a': 1, 'b': '2014-01-01', 'c': 'c',
+            'items': [{'name': 'one', 'd': '2014-01-01'}, {'name': 'two'}],
+            'nums': [1, 2], 'attrs': {'k': 1}, 'kind': {'type': 'alpha', 'x': 1}}, INBOUND, True)
+        original = dict(previous)
+
+        self.assertIs(field.revalidate(previous, {}), previous)
+
+        value = field.revalidate(previous, {'b': '2014-02-01', 'items.1.d': '2014-03-01',
+            ('attrs', 'j'): 2, 'c': None}, True)
+        self.assertEqual(value['b'], date(2014, 2, 1))
+        self.assertEqual(value['items'][1], {'name': 'two', 'd': date(2014, 3, 1)})
+        self.assertIs(value['items'][0], previous['items'][0])
+        self.assertEqual(value['attrs'], {'k': 1, 'j': 2})
+        self.assertNotIn('c', value)
+        self.assertIs(value['kind'], previous['kind'])
+        self.assertEqual(previous, original)
+
+        value = field.revalidate(previous, {'kind.type': 'beta', 'kind.y': '2014-01-01'}, True)
+        self.assertEqual(value['kind'], {'type': 'beta', 'x': 1, 'y': date(2014, 1, 1)})
+        should_fail(field.revalidate, previous, {'kind.type': 'gamma'}, True)
+
+        value = field.revalidate(previous, {'kind': {'type': 'beta', 'y': '2014-01-01'}}, True)
+        self.assertEqual(value['kind'], {'type': 'beta', 'y': date(2014, 1, 1)})
+
+        error = should_fail(field.revalidate, previous, {'a': 'bad', 'items.0.d': 'bad',
+            'unknown': 1}, True)
+        self.assertIsInstance(error, ValidationError)
+        self.assertEqual(error.structure['items'].structure[0].structure['d'].identity,
+            ['test', '.items', '[0]', '.d'])
+        self.assertIn('a', error.structure)
+        self.assertIn('unknown', error.structure)
+        self.assertIs(error.structure['b'], previous['b'])
+
+        self.assertEqual(field.revalidate(previous, {'nums.1': 3})['nums'], [1, 3])
+        error = should_fail(field.revalidate, previous, {'nums.1': 1})
+        self.assertEqual(error.structure['nums'].errors[0]['token'], 'duplicate')
+
+        for path, keys, identity in (
+                ('items.2.name', ['items'], ['test', '.items', '[2]']),
+                ('items.-1.name', ['items'], ['test', '.items', '[-1]']),
+                ('items.x', ['items'], ['test', '.items', '[x]']),
+                ('items.0.name.x', ['items', 0, 'name'], ['test', '.items', '[0]', '.name', '.x']),
+                ('attrs.j.x', ['attrs', 'j'], ['test', '.attrs', '[j]', '.x']),
+                ('kind.x.y', ['kind', 'x'], ['test', '.kind', '.x', '.y'])):
+            error = should_fail(field.revalidate, previous, {path: 'x'})
+            for key in keys:
+                error = error.structure[key]
+            self.assertEqual(error.errors[0]['token'], 'invalidpath')
+            self.assertEqual(error.identity, identity)
+
+        field = Structure({'address': Structure({'city': Text()}), 'items': Sequence(Text())},
+            name='test')
+        previous = field.process({'items': ['a']})
+        error = should_fail(field.revalidate, previous, {'address.city': 'x'})
+        self.assertEqual(error.structure['address'].identity, ['test', '.address', '.city'])
+        error = should_fail(field.revalidate, previous, {('items', 1): 'b'})
+        self.assertEqual(error.structure['items'].identity, ['test', '.items', '[1]'])
+        self.assertEqual(field.revalidate(previous, {('items', 0): 'b'}), {'items': ['b']})
+        self.assertEqual(previous, {'items': ['a']})
+
     def test_has_required_fields(self):
         field = Structure({'alpha': Text(required=True), 'beta': Integer()})
         self.assertTrue(field.has_required_fields)
@@ -10,3 +10,32 @@ class TestSurrogate(TestCase):
         self.assertEqual(s, {'id': 'id', 'name': 'name'})
         self.assertIsNone(s.schema)
         self.assertIsNone(s.version)
+
+    def test_dynamic_schema_interning(self):
+        schema = Structure({'id': Text(), 'name': Text()})
+        def serialize():
+            return {'id': 'id', 'name': 'name', '__schema__': schema.describe()}
+
+        self.assertIs(surrogate.interner, None)
+        first = surrogate.unserialize(serialize())
+        self.assertIsNot(surrogate.unserialize(serialize()).schema, first.schema)
+
+        surrogate.interner = FieldInterner(16)
+        try:
+            first = surrogate.unserialize(serialize())
+            self.assertEqual(first, {'id': 'id', 'name': 'name'})
+            self.assertIs(surrogate.unserialize(serialize()).schema, first.schema)
+            self.assertEqual(first.schema.fingerprint(), schema.fingerprint())
+
+            first = surrogate.unserialize({'a': 'a', '__schema__': {'fieldtype': 'structure',
+                'structure': {'a': {'fieldtype': 'text'}}}})
+            second = surrogate.unserialize({'b': 'b', '__schema__': {'fieldtype': 'structure',
+                'structure': {'b': {'fieldtype': 'text'}}}})
+
+            self.assertEqual((first, second), ({'a': 'a'}, {'b': 'b'}))
+            self.assertEqual(first.schema.structure['a'].name, 'a')
+            self.assertEqual(second.schema.structure['b'].name, 'b')
+            self.assertEqual(second.schema.describe()['structure'],
+                {'b': {'fieldtype': 'text', 'name': 'b'}})
+        finally:
+            surrogate.interner = None
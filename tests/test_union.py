@@ -18,6 +18,21 @@ class TestUnion(FieldTestCase):
         self.assert_processed(field, None, {'a': 1}, 'testing')
         self.assert_not_processed(field, 'invalid', 1, True, [])
 
+    def test_candidate_fields(self):
+        text, integer, structure = Text(), Integer(), Structure({'a': Integer()})
+        field = Union((text, integer, structure))
+        self.assertEqual(field._get_candidates(str, INBOUND, False), (text,))
+        self.assertEqual(field._get_candidates(bool, INBOUND, False), (integer,))
+        self.assertEqual(field._get_candidates(dict, INBOUND, False), (structure,))
+        self.assertEqual(field._get_candidates(dict, INBOUND, True), (integer, structure))
+        self.assertEqual(field._get_candidates(float, OUTBOUND, True), ())
+
+        preprocessed = Integer(preprocessor=int)
+        field = Union((text, preprocessed))
+        self.assertEqual(field._get_candidates(str, INBOUND, False), (text, preprocessed))
+        self.assert_processed(field, 'testing', 1)
+        self.assertEqual(field.process(1.0), 1)
+
     def test_undefined_fields(self):
         undefined = Undefined(Integer())
         field = Union((Text(), undefined, Boolean()))
@@ -1,7 +1,85 @@
+from scheme import *
 from scheme.util import *
 from tests.util import *
 
 class TestUtil(TestCase):
+    def test_materialize_ancestry(self):
+        ancestry = ((['root'], ATTRIBUTE_SEGMENT, 'items'), INDEX_SEGMENT, 2)
+        self.assertEqual(materialize_ancestry(ancestry), ['root', '.items', '[2]'])
+
+        ancestry = (None, INDEX_SEGMENT, ('a', 1))
+        self.assertEqual(materialize_ancestry(ancestry), ["[('a', 1)]"])
+
+        for ancestry in (['root', '.a'], ('root', '.a', '[1]'), '(unknown)', None):
+            self.assertIs(materialize_ancestry(ancestry), ancestry)
+
+        error = StructuralError(identity=((['root'], ATTRIBUTE_SEGMENT, 'a'), INDEX_SEGMENT, 1))
+        self.assertEqual(error.identity, ['root', '.a', '[1]'])
+
+    def test_extend_ancestry(self):
+        class Pair(Field):
+            def process(self, value, phase=INBOUND, serialized=False, ancestry=None):
+                ancestry = ancestry or [self.guaranteed_name]
+                first = Integer().process(value[0], phase, serialized,
+                    extend_ancestry(ancestry, 0, INDEX_SEGMENT))
+                second = Integer().process(value[1], phase, serialized,
+                    materialize_ancestry(ancestry) + ['[1]'])
+                return (first, second)
+
+        field = Structure({'pair': Pair()}, name='root')
+        self.assertEqual(field.process({'pair': (1, 2)}), {'pair': (1, 2)})
+
+        error = should_fail(field.process, {'pair': ('a', 2)})
+        self.assertEqual(error.structure['pair'].identity, ['root', '.pair', '[0]'])
+        error = should_fail(field.process, {'pair': (1, 'b')})
+        self.assertEqual(error.structure['pair'].identity, ['root', '.pair', '[1]'])
+
+        self.assertEqual(materialize_ancestry(extend_ancestry(['root'], 'a')), ['root', '.a'])
+
+    def test_compile_projection(self):
+        expected = {'a': None, 'b': None, 'c': {'d': None, 'e': {'f': None}}}
+        self.assertEqual(compile_projection('a,b, c.d,c.e.f'), expected)
+        self.assertEqual(compile_projection(['a', 'b', 'c.d', 'c.e.f', '']), expected)
+
+        self.assertEqual(compile_projection('c.d,c'), {'c': None})
+        self.assertEqual(compile_projection('c,c.d'), {'c': None})
+
+        self.assertIs(compile_projection(expected), expected)
+        self.assertIs(compile_projection(None), None)
+
+    def test_fingerprint_description(self):
+        description = {'fieldtype': 'sequence', 'item': {'fieldtype': 'integer', 'minimum': 1}}
+        fingerprint = fingerprint_description(description)
+        self.assertEqual(fingerprint_description({'item': {'minimum': 1,
+            'fieldtype': 'integer'}, 'fieldtype': 'sequence'}), fingerprint)
+        self.assertNotEqual(fingerprint_description({'fieldtype': 'sequence',
+            'item': {'fieldtype': 'integer', 'minimum': 2}}), fingerprint)
+        self.assertNotEqual(fingerprint_description([1, 2]), fingerprint_description((1, 2)))
+
+        with self.assertRaises(TypeError):
+            fingerprint_description({'fieldtype': 'field', 'default': {1, 2}})
+
+    def test_lru_cache(self):
+        cache = LRUCache(2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        self.assertEqual(cache.get('a'), 1)
+
+        cache.put('c', 3)
+        self.assertEqual(len(cache), 2)
+        self.assertIs(cache.get('b'), None)
+        self.assertEqual(cache.get('a', 0), 1)
+        self.assertEqual((cache.hits, cache.misses), (2, 1))
+
+        with self.assertRaises(TypeError):
+            cache.get([])
+
+        cache.clear()
+        self.assertEqual((len(cache), cache.hits, cache.misses), (0, 0, 0))
+
+        with self.assertRaises(TypeError):
+            LRUCache(0)
+
     def test_identify_object(self):
         import scheme
         self.assertEqual(identify_object(scheme), 'scheme')
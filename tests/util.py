@@ -74,6 +74,9 @@ UNKNOWN_ERROR = ValidationError({'token': 'unknown'})
 class FieldTestCase(TestCase):
     def assert_processed(self, field, *tests, **params):
         ancestry = params.get('ancestry', None)
+        compiled = dict(((phase, serialized), field.compile(phase, serialized))
+            for phase in (INBOUND, OUTBOUND) for serialized in (False, True))
+
         for test in tests:
             if isinstance(test, tuple):
                 unserialized, serialized = test
@@ -84,10 +87,18 @@ class FieldTestCase(TestCase):
             self.assertEqual(field.process(serialized, INBOUND, True, ancestry=ancestry), unserialized)
             self.assertEqual(field.process(unserialized, OUTBOUND, True, ancestry=ancestry), serialized)
 
+            self.assertEqual(compiled[INBOUND, False](unserialized, ancestry), unserialized)
+            self.assertEqual(compiled[OUTBOUND, False](unserialized, ancestry), unserialized)
+            self.assertEqual(compiled[INBOUND, True](serialized, ancestry), unserialized)
+            self.assertEqual(compiled[OUTBOUND, True](unserialized, ancestry), serialized)
+
     def assert_not_processed(self, field, expected, *tests):
         if isinstance(expected, string):
             expected = ValidationError().append({'token': expected})
 
+        compiled = dict(((phase, serialized), field.compile(phase, serialized))
+            for phase in (INBOUND, OUTBOUND) for serialized in (False, True))
+
         for test in tests:
             if not isinstance(test, tuple):
                 test = (test, test)
@@ -96,11 +107,19 @@ class FieldTestCase(TestCase):
             failed, reason = self.compare_structural_errors(expected, error)
             assert failed, reason
 
+            error = should_fail(compiled[INBOUND, False], test[0])
+            failed, reason = self.compare_structural_errors(expected, error)
+            assert failed, reason
+
             for value, phase in zip(test, (OUTBOUND, INBOUND)):
                 error = should_fail(field.process, value, phase, True)
                 failed, reason = self.compare_structural_errors(expected, error)
                 assert failed, reason
 
+                error = should_fail(compiled[phase, True], value)
+                failed, reason = self.compare_structural_errors(expected, error)
+                assert failed, reason
+
     def assert_interpolated(self, field, *tests, **params):
         for test in tests:
             if isinstance(test, tuple):